@@ -0,0 +1,126 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+"""
+Compare throughput and number of TCP connections of the AsyncConnectClient
+using HTTP/1.1 and HTTP/2 against a local TLS server.
+
+Requirements:
+
+    pip install httpx[http2] hypercorn trustme
+
+Usage:
+
+    poetry run python benchmarks/http2.py --requests 2000 --concurrency 200
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+
+import trustme
+
+from connect.client import AsyncConnectClient, fluent
+
+
+PAGE = json.dumps([{'id': f'PRD-{idx:03d}', 'name': f'Product {idx}'} for idx in range(20)])
+
+
+def _run_server(port, certfile, keyfile, ready):
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    connections = set()
+
+    async def app(scope, receive, send):
+        if scope['type'] != 'http':
+            return
+        if scope['path'] == '/stats':
+            body = json.dumps({'connections': len(connections)}).encode()
+            connections.clear()
+        else:
+            connections.add(tuple(scope['client']))
+            await asyncio.sleep(0.005)
+            body = PAGE.encode()
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': 200,
+                'headers': [(b'content-type', b'application/json')],
+            },
+        )
+        await send({'type': 'http.response.body', 'body': body})
+
+    config = Config()
+    config.bind = [f'127.0.0.1:{port}']
+    config.certfile = certfile
+    config.keyfile = keyfile
+    config.alpn_protocols = ['h2', 'http/1.1']
+    config.loglevel = 'ERROR'
+    config.keep_alive_max_requests = 10**9
+    ready.set()
+    asyncio.run(serve(app, config))
+
+
+async def _bench(endpoint, http2, requests, concurrency):
+    async with AsyncConnectClient(
+        'ApiKey SU-000-000-000:benchmark',
+        endpoint=endpoint,
+        http2=http2,
+        max_concurrent_streams=concurrency,
+        max_retries=0,
+    ) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[client.products.all().first() for _ in range(requests)])
+        elapsed = time.perf_counter() - started
+        stats = await client.get('stats')
+    return requests / elapsed, stats['connections']
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--port', type=int, default=8443)
+    args = parser.parse_args()
+
+    ca = trustme.CA()
+    cert = ca.issue_cert('127.0.0.1')
+    ca.configure_trust(fluent._SSL_CONTEXT)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        certfile = os.path.join(tmpdir, 'cert.pem')
+        keyfile = os.path.join(tmpdir, 'key.pem')
+        cert.cert_chain_pems[0].write_to_path(certfile)
+        cert.private_key_pem.write_to_path(keyfile)
+
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(
+            target=_run_server,
+            args=(args.port, certfile, keyfile, ready),
+            daemon=True,
+        )
+        server.start()
+        ready.wait()
+        time.sleep(1)
+
+        endpoint = f'https://127.0.0.1:{args.port}'
+        try:
+            print(f'{"protocol":<10}{"req/s":>10}{"connections":>14}')
+            for http2 in (False, True):
+                rps, connections = asyncio.run(
+                    _bench(endpoint, http2, args.requests, args.concurrency),
+                )
+                protocol = 'HTTP/2' if http2 else 'HTTP/1.1'
+                print(f'{protocol:<10}{rps:>10.0f}{connections:>14}')
+        finally:
+            server.terminate()
+
+
+if __name__ == '__main__':
+    main()
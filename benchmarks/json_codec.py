@@ -0,0 +1,178 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+"""
+Compare the time spent decoding pages of subscriptions and fulfillment requests,
+and encoding request payloads, with the JSON codecs available to the client.
+
+The `requests` row decodes pages through `Response.json()`, as the client did before
+the `json_codec` option was introduced.
+
+Requirements:
+
+    pip install orjson ujson
+
+Usage:
+
+    poetry run python benchmarks/json_codec.py --limit 1000 --repeat 20
+"""
+import argparse
+import json
+import timeit
+
+from requests import Response
+
+from connect.client.codec import JSON_CODECS
+
+
+def _get_asset(idx):
+    return {
+        'id': f'AS-{idx:04d}-0000-0000',
+        'status': 'active',
+        'events': {
+            'created': {'at': '2025-01-01T10:00:00+00:00', 'by': {'id': 'PA-000-000'}},
+            'updated': {'at': '2025-01-02T10:00:00+00:00', 'by': {'id': 'PA-000-000'}},
+        },
+        'external_id': str(100000 + idx),
+        'external_uid': f'a1b2c3d4-{idx:04d}-4e5f-8a9b-0c1d2e3f4a5b',
+        'product': {'id': 'PRD-000-000-000', 'name': 'Product', 'icon': '/media/icon.png'},
+        'connection': {
+            'id': 'CT-0000-0000-0000',
+            'type': 'production',
+            'provider': {'id': 'PA-000-000', 'name': 'Provider'},
+            'vendor': {'id': 'VA-000-000', 'name': 'Vendor'},
+            'hub': {'id': 'HB-0000-0000', 'name': 'Hub'},
+        },
+        'params': [
+            {
+                'id': f'param_{param}',
+                'name': f'Parameter {param}',
+                'type': 'text',
+                'value': f'value {idx} {param}',
+                'value_error': '',
+                'phase': 'ordering',
+                'constraints': {'required': True, 'hidden': False, 'unique': False},
+            }
+            for param in range(6)
+        ],
+        'tiers': {
+            'customer': {
+                'id': f'TA-{idx:04d}-0000',
+                'name': 'Customer Inc.',
+                'contact_info': {
+                    'address_line1': 'Street 1',
+                    'city': 'City',
+                    'country': 'US',
+                    'postal_code': '10001',
+                    'contact': {'email': 'user@example.com', 'first_name': 'Jane'},
+                },
+            },
+            'tier1': {'id': 'TA-0000-0001', 'name': 'Reseller'},
+        },
+        'items': [
+            {
+                'id': f'PRD-000-000-000-{item:04d}',
+                'global_id': f'PRD-000-000-000-{item:04d}',
+                'mpn': f'MPN-{item}',
+                'quantity': str(item * 10),
+                'old_quantity': '0',
+                'period': 'monthly',
+                'type': 'Reservation',
+            }
+            for item in range(5)
+        ],
+    }
+
+
+def _get_subscription(idx):
+    asset = _get_asset(idx)
+    asset['id'] = f'AS-{idx:04d}-1111-1111'
+    asset['billing'] = {
+        'period': {'delta': 1.0, 'uom': 'monthly'},
+        'next_date': '2025-02-01T00:00:00+00:00',
+        'anniversary': {'day': 1, 'month': 1},
+    }
+    return asset
+
+
+def _get_request(idx):
+    return {
+        'id': f'PR-{idx:04d}-0000-0000-001',
+        'type': 'purchase',
+        'status': 'pending',
+        'created': '2025-01-01T10:00:00+00:00',
+        'updated': '2025-01-01T10:00:00+00:00',
+        'answered': False,
+        'assignee': '',
+        'asset': _get_asset(idx),
+        'contract': {'id': 'CRD-00000-00000-00000', 'name': 'Contract'},
+        'marketplace': {'id': 'MP-00000', 'name': 'Marketplace'},
+    }
+
+
+PAGES = {
+    'subscriptions': _get_subscription,
+    'requests': _get_request,
+}
+
+
+def _available_codecs():
+    codecs = {}
+    for name, codec_class in JSON_CODECS.items():
+        try:
+            codecs[name] = codec_class()
+        except ImportError:
+            print(f'{name} is not installed, skipping.')
+    return codecs
+
+
+def _response_json(content):
+    response = Response()
+    response._content = content
+    response.encoding = 'utf-8'
+    return response.json()
+
+
+def _benchmark_page(page, data, codecs, repeat):
+    content = json.dumps(data).encode('utf-8')
+    size = len(content) / 1024 / 1024
+
+    rows = [('requests', lambda: _response_json(content), None)]
+    for name, codec in codecs.items():
+        rows.append(
+            (
+                name,
+                lambda codec=codec: codec.loads(content),
+                lambda codec=codec: codec.dumps(data),
+            ),
+        )
+
+    for name, decode, encode in rows:
+        decode_time = min(timeit.repeat(decode, number=1, repeat=repeat))
+        encode_time = min(timeit.repeat(encode, number=1, repeat=repeat)) if encode else None
+        print(
+            f'{page:<14}{name:<10}{decode_time * 1000:>12.2f}'
+            f'{encode_time * 1000 if encode_time else float("nan"):>12.2f}'
+            f'{size / decode_time:>10.1f}',
+        )
+
+
+def run(limit, repeat):
+    codecs = _available_codecs()
+    print(f'{"page":<14}{"codec":<10}{"decode ms":>12}{"encode ms":>12}{"MB/s":>10}')
+    for page, factory in PAGES.items():
+        _benchmark_page(page, [factory(idx) for idx in range(limit)], codecs, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--limit', type=int, default=1000, help='Number of objects per page.')
+    parser.add_argument('--repeat', type=int, default=20, help='Number of runs per codec.')
+    args = parser.parse_args()
+    run(args.limit, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
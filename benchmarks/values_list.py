@@ -0,0 +1,85 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+"""
+Compare the time spent extracting fields from a page of fulfillment requests
+resolving the field paths for each resource, as `values_list` did before field paths
+were compiled, and with compiled field paths. Fields within lists are compared with
+the equivalent hand-written loop.
+
+Usage:
+
+    poetry run python benchmarks/values_list.py --limit 1000 --repeat 20
+"""
+import argparse
+import timeit
+
+from connect.client.utils import compile_values, resolve_attribute
+from json_codec import PAGES
+
+
+FIELDS = {
+    'flat': ('id', 'status', 'type'),
+    'nested': ('id', 'asset.id', 'asset.product.id', 'asset.tiers.customer.contact_info.city'),
+    'lists': ('id', 'asset.items.*.id', 'asset.params[id=param_3].value'),
+}
+
+
+def _resolve_values(page, fields):
+    return [{field: resolve_attribute(field, item) for field in fields} for item in page]
+
+
+def _manual_values(page, fields):
+    # The post-processing loop needed to get list fields before compiled field paths.
+    values = []
+    for item in page:
+        asset = resolve_attribute('asset', item)
+        values.append(
+            {
+                'id': resolve_attribute('id', item),
+                'asset.items.*.id': [resolve_attribute('id', entry) for entry in asset['items']],
+                'asset.params[id=param_3].value': next(
+                    (param['value'] for param in asset['params'] if param['id'] == 'param_3'),
+                    None,
+                ),
+            },
+        )
+    return values
+
+
+def _compiled_values(page, fields):
+    get_values = compile_values(fields)
+    return [get_values(item) for item in page]
+
+
+def _benchmark_fields(name, page, fields, repeat):
+    compiled = min(timeit.repeat(lambda: _compiled_values(page, fields), number=1, repeat=repeat))
+    # resolve_attribute can't traverse lists, so they were extracted by hand.
+    baseline = _manual_values if name == 'lists' else _resolve_values
+    resolved = min(timeit.repeat(lambda: baseline(page, fields), number=1, repeat=repeat))
+    limit = len(page)
+    print(
+        f'{name:<10}{resolved * 1e6 / limit:>18.2f}{compiled * 1e6 / limit:>18.2f}'
+        f'{resolved / compiled:>9.1f}x',
+    )
+
+
+def run(limit, repeat):
+    page = [PAGES['requests'](idx) for idx in range(limit)]
+    print(f'{"fields":<10}{"resolve µs/item":>18}{"compiled µs/item":>18}{"speedup":>10}')
+    for name, fields in FIELDS.items():
+        _benchmark_fields(name, page, fields, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--limit', type=int, default=1000, help='Number of objects per page.')
+    parser.add_argument('--repeat', type=int, default=20, help='Number of runs per extractor.')
+    args = parser.parse_args()
+    run(args.limit, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
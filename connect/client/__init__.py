@@ -3,7 +3,12 @@
 #
 # Copyright (c) 2025 CloudBlue. All Rights Reserved.
 #
+from connect.client.batching import GetBatcher  # noqa
+from connect.client.cache import ResponseCache, SQLiteCache  # noqa
+from connect.client.codec import JSONCodec  # noqa
 from connect.client.exceptions import ClientError  # noqa
 from connect.client.fluent import AsyncConnectClient, ConnectClient  # noqa
 from connect.client.logger import RequestLogger  # noqa
+from connect.client.ratelimit import RateLimiter  # noqa
+from connect.client.retry import RetryPolicy  # noqa
 from connect.client.rql import R  # noqa
@@ -0,0 +1,153 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+import asyncio
+import copy
+import weakref
+
+from connect.client.exceptions import ClientError
+from connect.client.rql import R
+
+
+# Status codes of a list query that mean the collection cannot be filtered by id,
+# so the resources have to be retrieved one by one.
+_FALLBACK_STATUS_CODES = (400, 404, 405)
+
+
+class _PendingBatch:
+    def __init__(self, client, collection):
+        self.client = client
+        self.collection = collection
+        self.futures = {}
+        self.handle = None
+
+
+class GetBatcher:
+    """
+    Batch the retrieval of resources of the same collection made concurrently by
+    different tasks of an `AsyncConnectClient`.
+
+    The gets issued within `window` seconds are sent as a single list query using
+    the RQL `in` operator. Each caller gets its own resource or, if it doesn't exist,
+    a `ClientError` with status code `404`. If the collection cannot be filtered by
+    id, the resources are retrieved one by one.
+
+    Usage:
+
+    ```py3
+    client = AsyncConnectClient('ApiKey SU-000:xxxx', get_batcher=GetBatcher())
+
+    products = await asyncio.gather(
+        client.products['PRD-000-000-001'].get(),
+        client.products['PRD-000-000-002'].get(),
+    )
+    ```
+
+    Args:
+        window (float): (Optional) Number of seconds to wait for other gets before
+            sending the list query.
+        max_size (int): (Optional) Max number of resources per list query. A batch
+            that reaches this size is sent immediately.
+
+    Attributes:
+        batched (int): The number of gets that have been served by a list query.
+    """
+
+    def __init__(self, window: float = 0.002, max_size: int = 100):
+        if window < 0:
+            raise ValueError('`window` must be a positive number.')
+        if not isinstance(max_size, int) or max_size <= 0:
+            raise ValueError('`max_size` must be a positive, non-zero integer.')
+        self.window = window
+        self.max_size = max_size
+        self.batched = 0
+        self._batches = weakref.WeakKeyDictionary()
+        self._tasks = set()
+
+    async def get(self, client, path: str):
+        """
+        Retrieve the resource identified by `path` batching it with the other
+        resources of the same collection requested in the meanwhile.
+        """
+        collection, _, resource_id = path.rpartition('/')
+        loop = asyncio.get_running_loop()
+        batches = self._batches.setdefault(loop, {})
+        key = (id(client), collection)
+        batch = batches.get(key)
+        if batch is None:
+            batch = batches[key] = _PendingBatch(client, collection)
+            batch.handle = loop.call_later(self.window, self._flush, key, batch)
+        future = loop.create_future()
+        batch.futures.setdefault(resource_id, []).append(future)
+        if len(batch.futures) >= self.max_size:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key, batch):
+        batch.handle.cancel()
+        loop = asyncio.get_running_loop()
+        batches = self._batches.get(loop, {})
+        if batches.get(key) is batch:
+            del batches[key]
+        task = loop.create_task(self._fetch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch):
+        ids = list(batch.futures)
+        if len(ids) > 1:
+            client = batch.client
+            rs = (
+                client._get_collection_class()(client, batch.collection)
+                .filter(R().n('id').oneof(ids))
+                .limit(len(ids))
+            )
+            try:
+                resources = {resource['id']: resource async for resource in rs}
+            except ClientError as error:
+                if error.status_code not in _FALLBACK_STATUS_CODES:
+                    self._set_exception(ids, batch, error)
+                    return
+            except Exception as error:
+                self._set_exception(ids, batch, error)
+                return
+            else:
+                for resource_id in ids:
+                    resource = resources.get(resource_id)
+                    if resource is None:
+                        self._set_exception(
+                            [resource_id],
+                            batch,
+                            ClientError(
+                                f'The resource `{batch.collection}/{resource_id}` does not exist.',
+                                status_code=404,
+                            ),
+                        )
+                    else:
+                        self.batched += len(batch.futures[resource_id])
+                        self._set_result(resource_id, batch, resource)
+                return
+        await asyncio.gather(*(self._fetch_one(resource_id, batch) for resource_id in ids))
+
+    async def _fetch_one(self, resource_id, batch):
+        try:
+            resource = await batch.client.get(f'{batch.collection}/{resource_id}')
+        except Exception as error:
+            self._set_exception([resource_id], batch, error)
+        else:
+            self._set_result(resource_id, batch, resource)
+
+    def _set_result(self, resource_id, batch, resource):
+        for future in batch.futures[resource_id]:
+            if not future.done():
+                future.set_result(resource)
+                # Each caller gets its own copy of the resource.
+                resource = copy.copy(resource)
+
+    def _set_exception(self, ids, batch, error):
+        for resource_id in ids:
+            for future in batch.futures[resource_id]:
+                if not future.done():
+                    future.set_exception(error)
@@ -0,0 +1,634 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+from connect.client.codec import get_json_codec
+
+
+# Response headers stored along with a cached body, they are needed to
+# revalidate the entry and to rebuild the response on a cache hit.
+CACHED_HEADERS = ('Content-Type', 'Content-Range', 'ETag', 'Last-Modified')
+
+
+def get_cache_key(url: str, kwargs) -> str:
+    """
+    Returns the key that identifies a GET call to `url` made with
+    the given request keyword arguments.
+    """
+    params = kwargs.get('params')
+    if params:
+        join = '&' if '?' in url else '?'
+        url = f'{url}{join}{urlencode(sorted(params.items()))}'
+    authorization = kwargs.get('headers', {}).get('Authorization', '')
+    digest = hashlib.sha256(authorization.encode('utf-8')).hexdigest()[:16]
+    return f'{digest}:{url}'
+
+
+class CacheEntry:
+    """
+    A cached response body along with the response headers needed to
+    revalidate it.
+
+    Args:
+        path (str): The path of the cached resource or collection.
+        body: The decoded response body.
+        content (bytes): The raw response body.
+        headers (dict): The response headers listed in `CACHED_HEADERS`.
+        stored_at (float): (Optional) Time (as returned by `time.time()`) when the
+            entry has been stored or last revalidated.
+    """
+
+    def __init__(self, path, body, content, headers, stored_at=None):
+        self.path = path
+        self.body = body
+        self.content = content
+        self.headers = headers
+        self.stored_at = stored_at or time.time()
+
+    @classmethod
+    def from_response(cls, path, body, response):
+        headers = {
+            name: response.headers[name] for name in CACHED_HEADERS if name in response.headers
+        }
+        return cls(path.split('?', 1)[0], body, response.content, headers)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('Last-Modified')
+
+    @property
+    def size(self) -> int:
+        return len(self.content or b'')
+
+    def get_body(self):
+        """
+        Returns a shallow copy of the cached body, so callers can alter the
+        returned list or dictionary without affecting the cache.
+        """
+        return copy.copy(self.body)
+
+    def get_conditional_headers(self):
+        """
+        Returns the headers to send to revalidate this entry.
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def revalidated(self, headers):
+        """
+        Returns a copy of this entry refreshed with the validators sent
+        along with a `304 Not Modified` response.
+        """
+        entry_headers = dict(self.headers)
+        for name in ('ETag', 'Last-Modified'):
+            if name in headers:
+                entry_headers[name] = headers[name]
+        return CacheEntry(self.path, self.body, self.content, entry_headers)
+
+
+def _split_path(path):
+    return tuple(comp for comp in path.split('?', 1)[0].split('/') if comp)
+
+
+def _is_related(path, other):
+    """
+    Returns True if one of the two paths is equal to or nested under the other one.
+    """
+    common = min(len(path), len(other))
+    return path[:common] == other[:common]
+
+
+def _sort_by_path(values):
+    return sorted(
+        ((_split_path(path), value) for path, value in (values or {}).items()),
+        key=lambda item: len(item[0]),
+        reverse=True,
+    )
+
+
+def _match_path(values, path, default):
+    """
+    Returns the value associated with the longest prefix of `path`.
+    """
+    components = _split_path(path)
+    for prefix, value in values:
+        if components[: len(prefix)] == prefix:
+            return value
+    return default
+
+
+class BaseCache:
+    """
+    Base class for the cache backends used by the `ConnectClient` and
+    the `AsyncConnectClient`.
+
+    Subclasses must implement the storage methods `get`, `set`, `delete`, `invalidate`
+    and `clear`. Subclasses whose storage methods can block (i.e. waiting for I/O or for a
+    lock) must set `blocking` to True, so the `AsyncConnectClient` calls them in a worker
+    thread instead of the event loop.
+
+    Args:
+        ttl (float): (Optional) Number of seconds a cached response is considered fresh and
+            returned without contacting the server. If zero, cached responses are
+            always revalidated using their `ETag` or `Last-Modified` validators.
+        ttls (dict): (Optional) Number of seconds a cached response is considered fresh for
+            each collection, i.e. `{'products': 600, 'marketplaces': 3600}`. The longest
+            matching path wins.
+        stale_while_revalidate (dict): (Optional) Max number of seconds an expired response
+            can be served for each collection, i.e. `{'products': 3600}`. Stale responses
+            are returned immediately while a single background call refreshes them.
+    """
+
+    STATS = ('hits', 'misses', 'stale', 'revalidations', 'evictions', 'invalidations')
+
+    blocking = False
+
+    def __init__(
+        self,
+        ttl: float = 0,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_while_revalidate: Optional[Dict[str, float]] = None,
+    ):
+        self.ttl = ttl
+        self.ttls = _sort_by_path(ttls)
+        self.stale_while_revalidate = _sort_by_path(stale_while_revalidate)
+        self._stats = dict.fromkeys(self.STATS, 0)
+        self._stats_lock = threading.Lock()
+        self._refreshing = set()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the number of cache hits, misses, stale responses served, revalidations,
+        evictions and invalidations.
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError()
+
+    def set(self, key: str, entry: CacheEntry):
+        raise NotImplementedError()
+
+    def delete(self, key: str):
+        raise NotImplementedError()
+
+    def invalidate(self, path: str):
+        """
+        Remove all the entries whose path is equal to, a parent of or nested under `path`.
+        """
+        raise NotImplementedError()
+
+    def clear(self):
+        raise NotImplementedError()
+
+    def get_ttl(self, path: str) -> float:
+        """
+        Returns the number of seconds a response for `path` is considered fresh.
+        """
+        return _match_path(self.ttls, path, self.ttl)
+
+    def get_max_staleness(self, path: str) -> float:
+        """
+        Returns the number of seconds an expired response for `path` can still be served
+        while it is refreshed.
+        """
+        return _match_path(self.stale_while_revalidate, path, 0)
+
+    def get_lifetime(self, path: str) -> float:
+        """
+        Returns the number of seconds a response for `path` can be served without
+        revalidating it, stale or not.
+        """
+        return self.get_ttl(path) + self.get_max_staleness(path)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.get_ttl(entry.path)
+
+    def can_serve_stale(self, entry: CacheEntry) -> bool:
+        """
+        Returns True if the expired `entry` can be served while it is refreshed.
+        """
+        return time.time() - entry.stored_at < self.get_lifetime(entry.path)
+
+    def should_store(self, entry: CacheEntry) -> bool:
+        """
+        Returns True if the entry must be stored in this cache.
+        """
+        return bool(entry.etag or entry.last_modified or self.get_lifetime(entry.path) > 0)
+
+    def begin_refresh(self, key: str) -> bool:
+        """
+        Mark the entry stored with `key` as being refreshed. Returns False if
+        a refresh of the same entry is already in progress.
+        """
+        with self._stats_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str):
+        with self._stats_lock:
+            self._refreshing.discard(key)
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Returns the entry stored with `key`, if any, updating the hits and misses counters.
+        """
+        entry = self.get(key)
+        if entry is None:
+            self.incr('misses')
+        elif self.is_fresh(entry):
+            self.incr('hits')
+        return entry
+
+    def store(self, key: str, path: str, body, response):
+        """
+        Store the body of the response to a GET call to `path`.
+        """
+        # The entry keeps its own copy, so the caller can alter the returned body
+        # (i.e. extend it with the next pages of a ResourceSet).
+        entry = CacheEntry.from_response(path, copy.copy(body), response)
+        if self.should_store(entry):
+            self.set(key, entry)
+
+    def revalidate(self, key: str, entry: CacheEntry, headers) -> CacheEntry:
+        """
+        Refresh the entry stored with `key` after a `304 Not Modified` response.
+        """
+        entry = entry.revalidated(headers)
+        self.set(key, entry)
+        self.incr('revalidations')
+        return entry
+
+    def incr(self, name: str, value: int = 1):
+        with self._stats_lock:
+            self._stats[name] += value
+
+
+class ResponseCache(BaseCache):
+    """
+    In-memory LRU cache of the responses to GET calls.
+
+    Responses are stored along with their decoded body. While a response is fresh,
+    according to `ttl` and `ttls`, GET calls to the same URL with the same query
+    parameters and API key return the cached body without contacting the server.
+    Once expired, responses that carry an `ETag` or `Last-Modified` validator
+    are revalidated sending the `If-None-Match` / `If-Modified-Since` conditional headers:
+    if the server answers with `304 Not Modified`, the cached body is returned without
+    downloading and parsing it again.
+
+    For collections listed in `stale_while_revalidate`, expired responses are returned
+    immediately, up to the given number of seconds after their expiration, while a
+    single background thread (`ConnectClient`) or task (`AsyncConnectClient`)
+    refreshes them.
+
+    Cached responses are invalidated when the client that owns the cache performs
+    a `POST`, `PUT` or `DELETE` call on the same path, on one of its parents or on
+    one of its children, so `update`, `delete`, `create`, `bulk_*` calls and actions
+    discard the stale copies.
+
+    Usage:
+
+    ```py3
+    from connect.client import ConnectClient, ResponseCache
+
+    client = ConnectClient(
+        'ApiKey SU-000-000-000:xxxxxxxxxxxxxxxx',
+        cache=ResponseCache(
+            ttl=60,
+            ttls={'products': 600, 'marketplaces': 3600},
+            max_entries=5000,
+            stale_while_revalidate={'products': 3600},
+        ),
+    )
+    ```
+
+    !!! note
+        Cached lists and dictionaries are shallow copied before being returned,
+        nested objects are shared with the cache and must not be modified.
+
+    Args:
+        ttl (float): (Optional) Number of seconds a cached response is considered fresh.
+        ttls (dict): (Optional) Number of seconds a cached response is considered fresh for
+            each collection.
+        max_entries (int): (Optional) Max number of responses to keep.
+        max_bytes (int): (Optional) Max size in bytes of the cached response bodies.
+        stale_while_revalidate (dict): (Optional) Max number of seconds an expired response
+            can be served, while it is refreshed in background, for each collection.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: Optional[int] = 1000,
+        max_bytes: Optional[int] = None,
+        stale_while_revalidate: Optional[Dict[str, float]] = None,
+    ):
+        super().__init__(ttl=ttl, ttls=ttls, stale_while_revalidate=stale_while_revalidate)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the size in bytes of the cached response bodies.
+        """
+        return self._size
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            evicted = 0
+            while len(self._entries) > 1 and (
+                (self.max_entries and len(self._entries) > self.max_entries)
+                or (self.max_bytes and self._size > self.max_bytes)
+            ):
+                self._pop(next(iter(self._entries)))
+                evicted += 1
+        if evicted:
+            self.incr('evictions', evicted)
+
+    def delete(self, key):
+        with self._lock:
+            self._pop(key)
+
+    def invalidate(self, path):
+        components = _split_path(path)
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if _is_related(components, _split_path(entry.path))
+            ]
+            for key in keys:
+                self._pop(key)
+        if keys:
+            self.incr('invalidations', len(keys))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+
+class SQLiteCache(BaseCache):
+    """
+    Persistent cache of the responses to GET calls stored in a local SQLite database.
+
+    The cache can be shared by many processes, i.e. short lived workers that
+    read the same products, templates or parameters at startup: the database runs in
+    WAL mode so readers are not blocked by writers. Response bodies are stored
+    zlib-compressed along with their validators and, once the database grows over
+    `max_bytes`, expired entries are evicted first and then the least recently
+    stored ones.
+
+    The same database can be used by both the `ConnectClient` and the `AsyncConnectClient`.
+    The `AsyncConnectClient` accesses the database in worker threads, so waiting for a lock
+    held by another process doesn't block the event loop.
+
+    Usage:
+
+    ```py3
+    from connect.client import ConnectClient, SQLiteCache
+
+    client = ConnectClient(
+        'ApiKey SU-000-000-000:xxxxxxxxxxxxxxxx',
+        cache=SQLiteCache('/var/cache/connect.db', ttls={'products': 600}),
+    )
+    ```
+
+    Args:
+        filename (str): Path of the SQLite database file.
+        ttl (float): (Optional) Number of seconds a cached response is considered fresh.
+        ttls (dict): (Optional) Number of seconds a cached response is considered fresh for
+            each collection.
+        max_bytes (int): (Optional) Max size in bytes of the compressed response bodies.
+        compression_level (int): (Optional) zlib compression level from 0 to 9.
+        timeout (float): (Optional) Number of seconds to wait for a lock held by another
+            process before raising an error.
+        stale_while_revalidate (dict): (Optional) Max number of seconds an expired response
+            can be served, while it is refreshed in background, for each collection.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        filename: str,
+        ttl: float = 0,
+        ttls: Optional[Dict[str, float]] = None,
+        max_bytes: Optional[int] = 100 * 1024 * 1024,
+        compression_level: int = 6,
+        timeout: float = 30.0,
+        stale_while_revalidate: Optional[Dict[str, float]] = None,
+    ):
+        super().__init__(ttl=ttl, ttls=ttls, stale_while_revalidate=stale_while_revalidate)
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        with self._connection as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, '
+                'path TEXT NOT NULL, '
+                'content BLOB NOT NULL, '
+                'headers TEXT NOT NULL, '
+                'size INTEGER NOT NULL, '
+                'stored_at REAL NOT NULL, '
+                'expires_at REAL NOT NULL, '
+                'revalidable INTEGER NOT NULL)',
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS responses_path ON responses (path)')
+            conn.execute('CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)')
+            # The total size of the stored bodies is kept up to date by triggers, within
+            # the same transaction of each write, so it doesn't need a full table scan.
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)',
+            )
+            conn.execute(
+                'CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN '
+                "UPDATE meta SET value = value + new.size WHERE name = 'size'; END",
+            )
+            conn.execute(
+                'CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses '
+                "BEGIN UPDATE meta SET value = value - old.size + new.size WHERE name = 'size'; END",
+            )
+            conn.execute(
+                'CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN '
+                "UPDATE meta SET value = value - old.size WHERE name = 'size'; END",
+            )
+            conn.execute(
+                'INSERT OR IGNORE INTO meta (name, value) '
+                "SELECT 'size', COALESCE(SUM(size), 0) FROM responses",
+            )
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the size in bytes of the compressed response bodies.
+        """
+        return self._get_size(self._connection)
+
+    def get(self, key):
+        row = self._connection.execute(
+            'SELECT path, content, headers, stored_at FROM responses WHERE key = ?',
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        path, content, headers, stored_at = row
+        content = zlib.decompress(content)
+        headers = json.loads(headers)
+        body = content
+        if content and headers.get('Content-Type', '').startswith('application/json'):
+            body = get_json_codec().loads(content)
+        return CacheEntry(path, body, content, headers, stored_at=stored_at)
+
+    def set(self, key, entry):
+        content = zlib.compress(entry.content or b'', self.compression_level)
+        revalidable = bool(entry.etag or entry.last_modified)
+        with self._connection as conn:
+            conn.execute(
+                'INSERT INTO responses '
+                '(key, path, content, headers, size, stored_at, expires_at, revalidable) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET path = excluded.path, '
+                'content = excluded.content, headers = excluded.headers, size = excluded.size, '
+                'stored_at = excluded.stored_at, expires_at = excluded.expires_at, '
+                'revalidable = excluded.revalidable',
+                (
+                    key,
+                    '/'.join(_split_path(entry.path)),
+                    content,
+                    json.dumps(entry.headers),
+                    len(content),
+                    entry.stored_at,
+                    entry.stored_at + self.get_lifetime(entry.path),
+                    revalidable,
+                ),
+            )
+            evicted = self._evict(conn)
+        if evicted:
+            self.incr('evictions', evicted)
+
+    def delete(self, key):
+        with self._connection as conn:
+            conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def invalidate(self, path):
+        components = _split_path(path)
+        path = '/'.join(components)
+        parents = ['/'.join(components[:idx]) for idx in range(1, len(components) + 1)]
+        placeholders = ', '.join('?' for _ in parents)
+        with self._connection as conn:
+            cursor = conn.execute(
+                f'DELETE FROM responses WHERE path IN ({placeholders}) '
+                'OR substr(path, 1, ?) = ?',
+                (*parents, len(path) + 1, f'{path}/'),
+            )
+        if cursor.rowcount > 0:
+            self.incr('invalidations', cursor.rowcount)
+
+    def clear(self):
+        with self._connection as conn:
+            conn.execute('DELETE FROM responses')
+
+    def close(self):
+        """
+        Close the connections to the database opened by this cache.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    @property
+    def _connection(self):
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = sqlite3.connect(self.filename, timeout=self.timeout)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _get_size(self, conn):
+        return conn.execute("SELECT value FROM meta WHERE name = 'size'").fetchone()[0]
+
+    def _evict(self, conn):
+        if not self.max_bytes:
+            return 0
+        size = self._get_size(conn)
+        if size <= self.max_bytes:
+            return 0
+        evicted = conn.execute(
+            'DELETE FROM responses WHERE revalidable = 0 AND expires_at <= ?',
+            (time.time(),),
+        ).rowcount
+        size = self._get_size(conn)
+        rows = conn.execute(
+            'SELECT key, size FROM responses ORDER BY stored_at',
+        )
+        keys = []
+        for key, entry_size in rows:
+            if size <= self.max_bytes:
+                break
+            keys.append((key,))
+            size -= entry_size
+        rows.close()
+        conn.executemany('DELETE FROM responses WHERE key = ?', keys)
+        return evicted + len(keys)
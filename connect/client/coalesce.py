@@ -0,0 +1,114 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+import asyncio
+import copy
+import threading
+import weakref
+from typing import Tuple
+
+
+class InFlightCall:
+    """
+    A GET call shared by all the callers that requested the same URL while
+    it was in progress.
+
+    Attributes:
+        response: The response of the call.
+        result: The decoded response body.
+        exception (Exception): The exception raised by the call, if any.
+        completed (bool): True if the call returned or raised an error, False if
+            it has been interrupted (i.e. the task that was running it has been cancelled).
+    """
+
+    def __init__(self, event):
+        self.event = event
+        self.response = None
+        self.result = None
+        self.exception = None
+        self.completed = False
+
+    def set_result(self, response, result):
+        self.response = response
+        self.result = result
+        self.completed = True
+
+    def set_exception(self, response, exception):
+        self.response = response
+        self.exception = exception
+        self.completed = True
+
+    def get_result(self):
+        """
+        Returns a shallow copy of the decoded response body or raises the
+        exception raised by the call.
+        """
+        if self.exception is not None:
+            raise self.exception
+        return copy.copy(self.result)
+
+
+class RequestCoalescer:
+    """
+    Keeps track of the GET calls in progress so that identical calls made
+    concurrently by different threads are sent only once.
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def join(self, key: str) -> Tuple[InFlightCall, bool]:
+        """
+        Returns the call in progress identified by `key` and a flag that is True if
+        the caller is the first one requesting it and so must send the request.
+        """
+        with self._lock:
+            calls = self.get_calls()
+            call = calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                return call, False
+            call = calls[key] = InFlightCall(self.create_event())
+            return call, True
+
+    def leave(self, key: str, call: InFlightCall):
+        """
+        Mark the call identified by `key` as done and wake up the waiting callers.
+        """
+        with self._lock:
+            calls = self.get_calls()
+            if calls.get(key) is call:
+                del calls[key]
+        call.event.set()
+
+    def get_calls(self):
+        """
+        Returns the calls in progress keyed by URL.
+        """
+        return self._calls
+
+    def create_event(self):
+        return threading.Event()
+
+
+class AsyncRequestCoalescer(RequestCoalescer):
+    """
+    Keeps track of the GET calls in progress so that identical calls made
+    concurrently by different tasks of the same event loop are sent only once.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # The calls in progress of each event loop. They are dropped along with the loop,
+        # whose id can then be reused by a new one.
+        self._calls = weakref.WeakKeyDictionary()
+
+    def get_calls(self):
+        return self._calls.setdefault(asyncio.get_running_loop(), {})
+
+    def create_event(self):
+        return asyncio.Event()
@@ -0,0 +1,108 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+import functools
+import importlib
+import json
+from typing import Any, Optional, Union
+
+
+class JSONCodec:
+    """
+    Encode request payloads and decode response bodies using the `json`
+    module of the standard library.
+
+    Subclass it to plug a different JSON library into the client.
+    """
+
+    name = 'json'
+
+    def loads(self, content: bytes) -> Any:
+        """
+        Decode a JSON document from the raw bytes of a response body.
+        """
+        return json.loads(content)
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode `obj` as a UTF-8 JSON document.
+        """
+        return json.dumps(obj).encode('utf-8')
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Encode and decode JSON using [orjson](https://github.com/ijl/orjson).
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        self._orjson = importlib.import_module('orjson')
+
+    def loads(self, content):
+        return self._orjson.loads(content)
+
+    def dumps(self, obj):
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            # orjson only supports string keys and 64 bits integers.
+            return super().dumps(obj)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Encode and decode JSON using [ujson](https://github.com/ultrajson/ultrajson).
+    """
+
+    name = 'ujson'
+
+    def __init__(self):
+        self._ujson = importlib.import_module('ujson')
+
+    def loads(self, content):
+        return self._ujson.loads(content)
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+JSON_CODECS = {
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+    JSONCodec.name: JSONCodec,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_codec_by_name(name):
+    if name != 'auto':
+        return JSON_CODECS[name]()
+    for codec_class in JSON_CODECS.values():
+        try:
+            return codec_class()
+        except ImportError:
+            pass
+
+
+def get_json_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Returns the JSON codec identified by `codec`.
+
+    Args:
+        codec (Union[str, JSONCodec]): (Optional) A `JSONCodec` instance or the name of the
+            library to use: `orjson`, `ujson` or `json`. If not provided or `auto`, the
+            fastest installed library is used.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    codec = codec or 'auto'
+    if codec != 'auto' and codec not in JSON_CODECS:
+        raise ValueError(
+            f'`json_codec` must be one of {", ".join(["auto", *JSON_CODECS])} '
+            'or a JSONCodec instance.',
+        )
+    return _get_codec_by_name(codec)
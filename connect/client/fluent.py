@@ -3,19 +3,24 @@
 #
 # Copyright (c) 2025 CloudBlue. All Rights Reserved.
 #
+import asyncio
+import contextlib
 import contextvars
 import ipaddress
 import threading
-from functools import cache
-from json.decoder import JSONDecodeError
+import weakref
 from typing import Union
 from urllib.request import getproxies
 
 import httpx
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
 
+from connect.client.cache import get_cache_key
+from connect.client.coalesce import AsyncRequestCoalescer, RequestCoalescer
+from connect.client.codec import get_json_codec
 from connect.client.constants import CONNECT_ENDPOINT_URL, CONNECT_SPECS_URL
+from connect.client.exceptions import ClientError
 from connect.client.help_formatter import DefaultFormatter
 from connect.client.mixins import AsyncClientMixin, SyncClientMixin
 from connect.client.models import (
@@ -25,11 +30,13 @@ from connect.client.models import (
     Collection,
 )
 from connect.client.openapi import OpenAPISpecs
+from connect.client.pool import PooledHTTPAdapter
+from connect.client.ratelimit import RateLimiter
+from connect.client.retry import RetryPolicy
 from connect.client.utils import get_headers
 
 
 _SYNC_TRANSPORTS = {}
-_ASYNC_TRANSPORTS = {}
 
 
 class _ConnectClientBase:
@@ -46,6 +53,11 @@ class _ConnectClientBase:
         logger=None,
         timeout=(15.0, 180.0),
         resourceset_append=True,
+        retry_policy=None,
+        rate_limiter=None,
+        cache=None,
+        coalesce_requests=False,
+        json_codec=None,
     ):
         if default_headers and 'Authorization' in default_headers:
             raise ValueError('`default_headers` cannot contains `Authorization`')
@@ -55,6 +67,12 @@ class _ConnectClientBase:
         self.default_headers = default_headers or {}
         self.default_limit = default_limit
         self.max_retries = max_retries
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.coalesce_requests = coalesce_requests
+        self.json_codec = get_json_codec(json_codec)
+        self._coalescer = self._get_coalescer_class()()
         self._use_specs = use_specs
         self._validate_using_specs = validate_using_specs
         self.specs_location = specs_location or CONNECT_SPECS_URL
@@ -133,6 +151,14 @@ class _ConnectClientBase:
             name,
         )
 
+    @property
+    def coalesced_calls(self) -> int:
+        """
+        Returns the number of GET calls that have been served by an identical call
+        already in progress instead of being sent.
+        """
+        return self._coalescer.coalesced
+
     def print_help(self, obj):
         print()
         print(self._help_formatter.format(obj))
@@ -147,6 +173,9 @@ class _ConnectClientBase:
     def _get_namespace_class(self):
         raise NotImplementedError()
 
+    def _get_coalescer_class(self):
+        return RequestCoalescer
+
     def _prepare_call_kwargs(self, kwargs):
         kwargs = kwargs or {}
         if 'headers' in kwargs:
@@ -159,13 +188,80 @@ class _ConnectClientBase:
             kwargs['headers'].update(self.default_headers)
         return kwargs
 
+    def _get_cache_entry(self, method, url, kwargs):
+        if self.cache is None or method.lower() != 'get':
+            return None, None
+        cache_key = get_cache_key(url, kwargs)
+        entry = self.cache.lookup(cache_key)
+        if entry and not self.cache.is_fresh(entry):
+            # The headers can be shared by several calls (i.e. the pages of a ResourceSet).
+            kwargs['headers'] = {**kwargs['headers'], **entry.get_conditional_headers()}
+        return cache_key, entry
+
+    def _get_response_body(self, path, cache_key, entry):
+        if entry and self.response.status_code == 304:
+            entry = self.cache.revalidate(cache_key, entry, self.response.headers)
+            self.response = self._build_cached_response(entry)
+            return entry.get_body()
+        body = self._decode_response_body()
+        if cache_key and self.response.status_code != 204:
+            self.cache.store(cache_key, path, body, self.response)
+        return body
+
+    def _decode_response_body(self):
+        if self.response.status_code == 304:
+            raise ClientError(
+                'The response has not been modified but it is not cached.',
+                status_code=304,
+            )
+        if self.response.status_code == 204:
+            return None
+        if not self.response.headers.get('Content-Type', '').startswith('application/json'):
+            return self.response.content
+        try:
+            return self.json_codec.loads(self.response.content)
+        except ValueError as error:
+            raise ClientError(
+                'The response body is not valid JSON.',
+                status_code=self.response.status_code,
+            ) from error
+
+    def _discard_cache_entry(self, cache_key):
+        # A resource that does not exist anymore must not be served from the cache.
+        if self.response is not None and self.response.status_code in (404, 410):
+            self.cache.delete(cache_key)
+
+    def _invalidate_cache(self, method, path):
+        if self.cache is not None and method.lower() not in ('get', 'head', 'options'):
+            self.cache.invalidate(path)
+
+    def _encode_json_payload(self, kwargs, content_kwarg):
+        """
+        Returns a copy of the request keyword arguments where the `json` payload
+        has been encoded with the client JSON codec and passed as `content_kwarg`.
+        """
+        if kwargs.get('json') is None:
+            return kwargs
+        kwargs = dict(kwargs)
+        kwargs[content_kwarg] = self.json_codec.dumps(kwargs.pop('json'))
+        headers = dict(kwargs.get('headers') or {})
+        if not any(name.lower() == 'content-type' for name in headers):
+            headers['Content-Type'] = 'application/json'
+        kwargs['headers'] = headers
+        return kwargs
+
+    def _get_path_from_url(self, url):
+        if url.startswith(self.endpoint):
+            return url[len(self.endpoint) :]
+        return url
+
     def _get_api_error_details(self):
         if self.response is not None:
             try:
-                error = self.response.json()
+                error = self.json_codec.loads(self.response.content)
                 if 'error_code' in error and 'errors' in error:
                     return error
-            except JSONDecodeError:
+            except (ValueError, TypeError):
                 pass
 
 
@@ -195,10 +291,41 @@ class ConnectClient(_ConnectClientBase, SyncClientMixin):
         logger: (Optional) HTTP Request logger class.
         timeout (int): (Optional) Timeout parameter to pass to the underlying HTTP client.
         resourceset_append: (Optional) Append all the pages to the current resourceset.
+        retry_policy (RetryPolicy): (Optional) The policy that rules how failed requests are
+            retried. If not provided, a default policy with exponential backoff and full jitter
+            that retries up to `max_retries` times is used.
+        rate_limiter (RateLimiter): (Optional) The client side rate limiter shared by all the
+            calls made through this client. If not provided, a rate limiter that only slows down
+            when the API returns `429` or `503` responses or rate limit headers is used.
+        cache (BaseCache): (Optional) The cache used to store and revalidate the responses to
+            GET calls. Entries are invalidated by the write calls made through this client.
+        coalesce_requests (bool): (Optional) Send only once identical GET calls made
+            concurrently by different threads, all the callers get the same result.
+        json_codec (Union[str, JSONCodec]): (Optional) The JSON library used to encode payloads
+            and decode responses: `orjson`, `ujson`, `json` or a `JSONCodec` instance.
+            Defaults to the fastest one installed.
+        pool_connections (int): (Optional) Number of connection pools to cache.
+        pool_maxsize (int): (Optional) Max number of connections to keep open for reuse for each
+            host. It should be at least the number of threads sharing this client.
+        pool_block (bool): (Optional) Wait for a connection to be released when all the
+            `pool_maxsize` connections are in use instead of opening a new one.
+        keep_alive (bool): (Optional) Keep connections open to reuse them for later requests.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        pool_connections=DEFAULT_POOLSIZE,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        pool_block=DEFAULT_POOLBLOCK,
+        keep_alive=True,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
         self._thread_locals = threading.local()
 
     @property
@@ -207,11 +334,10 @@ class ConnectClient(_ConnectClientBase, SyncClientMixin):
             self._thread_locals.session = requests.Session()
             self._thread_locals.session.mount(
                 self.endpoint,
-                _SYNC_TRANSPORTS.setdefault(
-                    self.endpoint,
-                    HTTPAdapter(),
-                ),
+                self._get_transport(),
             )
+            if not self.keep_alive:
+                self._thread_locals.session.headers['Connection'] = 'close'
 
         return self._thread_locals.session
 
@@ -230,6 +356,41 @@ class ConnectClient(_ConnectClientBase, SyncClientMixin):
     def response(self, value: requests.Response):
         self._thread_locals.response = value
 
+    def pool_stats(self):
+        """
+        Returns the statistics of the connection pools used by this client to
+        connect to its endpoint keyed by `scheme://host:port`.
+
+        Usage:
+
+        ```py3
+        stats = client.pool_stats()
+        ```
+
+        For each pool the returned dictionary contains the number of connections
+        in use (`in_use`), idle (`idle`), opened (`created`), closed because the
+        pool was full (`discarded`) and the total number of seconds spent waiting
+        for a connection (`wait_time`).
+
+        Returns:
+            (dict): The statistics of the connection pools.
+        """
+        return self._get_transport().get_stats()
+
+    def _get_transport(self):
+        key = (self.endpoint, self.pool_connections, self.pool_maxsize, self.pool_block)
+        transport = _SYNC_TRANSPORTS.get(key)
+        if not transport:
+            transport = _SYNC_TRANSPORTS.setdefault(
+                key,
+                PooledHTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                ),
+            )
+        return transport
+
     def _get_collection_class(self):
         return Collection
 
@@ -298,16 +459,83 @@ def _no_proxy_mount(hostname):
     return f'all://*{hostname}'
 
 
-@cache
-def _get_async_mounts():
+class _SharedAsyncTransport:
+    """
+    An `httpx.AsyncHTTPTransport` shared by the sessions of all the clients
+    that use it within an event loop, together with the number of its users.
+    """
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.users = 0
+
+
+class _AsyncTransportRef(httpx.AsyncBaseTransport):
+    """
+    The reference to a shared transport owned by a session. Closing the
+    session releases the reference and the transport is closed when the last
+    session using it is closed.
+    """
+
+    def __init__(self, transports, key, shared):
+        self._transports = transports
+        self._key = key
+        self._shared = shared
+        self._closed = False
+
+    @property
+    def transport(self):
+        return self._shared.transport
+
+    async def handle_async_request(self, request):
+        return await self._shared.transport.handle_async_request(request)
+
+    async def aclose(self):
+        if self._closed:
+            return
+        self._closed = True
+        with _ASYNC_TRANSPORTS_LOCK:
+            self._shared.users -= 1
+            if self._shared.users > 0:
+                return
+            if self._transports.get(self._key) is self._shared:
+                del self._transports[self._key]
+        await self._shared.transport.aclose()
+
+
+# Transports shared by the clients keyed by event loop, so that connections are
+# reused across client instances.
+_ASYNC_TRANSPORTS = weakref.WeakKeyDictionary()
+_ASYNC_TRANSPORTS_LOCK = threading.Lock()
+
+
+def _get_async_transport(loop, key, http2, proxy=None):
+    """
+    Returns a reference to the transport identified by `key` shared within `loop`,
+    creating it if it doesn't exist.
+    """
+    with _ASYNC_TRANSPORTS_LOCK:
+        transports = _ASYNC_TRANSPORTS.setdefault(loop, {})
+        shared = transports.get(key)
+        if shared is None:
+            shared = transports[key] = _SharedAsyncTransport(
+                httpx.AsyncHTTPTransport(
+                    verify=_SSL_CONTEXT,
+                    http2=http2,
+                    proxy=httpx.Proxy(url=proxy) if proxy else None,
+                ),
+            )
+        shared.users += 1
+    return _AsyncTransportRef(transports, key, shared)
+
+
+def _get_async_mounts(loop, http2=False):
     """
     This code based on how httpx.Client mounts proxies from environment.
-    This is cached to allow reusing the created transport objects.
+    Proxy transports are shared within `loop` like the endpoint transport.
     """
     return {
-        key: None
-        if url is None
-        else httpx.AsyncHTTPTransport(verify=_SSL_CONTEXT, proxy=httpx.Proxy(url=url))
+        key: None if url is None else _get_async_transport(loop, ('proxy', url, http2), http2, url)
         for key, url in _get_environment_proxies().items()
     }
 
@@ -324,6 +552,10 @@ class AsyncConnectClient(_ConnectClientBase, AsyncClientMixin):
     product = await client.products['PRD-001-002-003'].get()
     ```
 
+    The connections to an endpoint are shared by all the clients used within the same
+    event loop and are closed when the last of these clients is closed with `aclose()`
+    or by leaving its `async with` block.
+
     Args:
         api_key (str): The API key used for authentication.
         endpoint (str): (Optional) The API endpoint, defaults to
@@ -338,28 +570,110 @@ class AsyncConnectClient(_ConnectClientBase, AsyncClientMixin):
         logger: (Optional) HTTP Request logger class.
         timeout (int): (Optional) Timeout parameter to pass to the underlying HTTP client.
         resourceset_append: (Optional) Append all the pages to the current resourceset.
+        retry_policy (RetryPolicy): (Optional) The policy that rules how failed requests are
+            retried. If not provided, a default policy with exponential backoff and full jitter
+            that retries up to `max_retries` times is used.
+        rate_limiter (RateLimiter): (Optional) The client side rate limiter shared by all the
+            calls made through this client. If not provided, a rate limiter that only slows down
+            when the API returns `429` or `503` responses or rate limit headers is used.
+        cache (BaseCache): (Optional) The cache used to store and revalidate the responses to
+            GET calls. Entries are invalidated by the write calls made through this client.
+        coalesce_requests (bool): (Optional) Send only once identical GET calls made
+            concurrently by different tasks, all the callers get the same result.
+        json_codec (Union[str, JSONCodec]): (Optional) The JSON library used to encode payloads
+            and decode responses: `orjson`, `ujson`, `json` or a `JSONCodec` instance.
+            Defaults to the fastest one installed.
+        http2 (bool): (Optional) Use HTTP/2 to multiplex concurrent requests over a few
+            connections. It requires the `h2` package (`pip install httpx[http2]`).
+        max_concurrent_streams (int): (Optional) Max number of requests that can be in flight
+            at the same time through this client.
+        get_batcher (GetBatcher): (Optional) Batch the retrieval of resources of the same
+            collection made concurrently by different tasks into list queries.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        http2=False,
+        max_concurrent_streams=None,
+        get_batcher=None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
+        if max_concurrent_streams is not None and max_concurrent_streams <= 0:
+            raise ValueError('`max_concurrent_streams` must be a positive, non-zero integer.')
+        self.http2 = http2
+        self.max_concurrent_streams = max_concurrent_streams
+        self.get_batcher = get_batcher
         self._response = contextvars.ContextVar('response', default=None)
-        self._session = contextvars.ContextVar('session', default=None)
+        self._sessions = weakref.WeakKeyDictionary()
+        self._sessions_lock = threading.Lock()
+        self._streams_semaphores = weakref.WeakKeyDictionary()
+        self._refresh_tasks = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
 
     @property
     def session(self):
-        value = self._session.get()
-        if not value:
-            transport = _ASYNC_TRANSPORTS.get(self.endpoint)
-            if not transport:
-                transport = _ASYNC_TRANSPORTS[self.endpoint] = httpx.AsyncHTTPTransport(
-                    verify=_SSL_CONTEXT,
+        """
+        Returns the
+        [`httpx.AsyncClient`](https://www.python-httpx.org/api/#asyncclient)
+        used by this client within the running event loop.
+        All the tasks running in the same event loop share the same session.
+        """
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            value = self._sessions.get(loop)
+            if not value or value.is_closed:
+                # When passing a transport to httpx a Client/AsyncClient, proxies defined in
+                # environment (like HTTP_PROXY) are ignored, so let's pass them using mounts.
+                value = self._sessions[loop] = httpx.AsyncClient(
+                    transport=_get_async_transport(
+                        loop,
+                        (self.endpoint, self.http2),
+                        self.http2,
+                    ),
+                    mounts=_get_async_mounts(loop, self.http2),
                 )
-            # When passing a transport to httpx a Client/AsyncClient, proxies defined in environment
-            # (like HTTP_PROXY) are ignored, so let's pass them using mounts parameter.
-            value = httpx.AsyncClient(transport=transport, mounts=_get_async_mounts())
-            self._session.set(value)
         return value
 
+    async def aclose(self):
+        """
+        Close the session used by this client within the running event loop,
+        cancelling the pending background cache refreshes. The connections are closed
+        if no other client of the event loop is using them.
+
+        Usage:
+
+        ```py3
+        client = AsyncConnectClient('ApiKey SU-000-000-000:xxxxxxxxxxxxxxxx')
+        try:
+            product = await client.products['PRD-001-002-003'].get()
+        finally:
+            await client.aclose()
+        ```
+
+        or:
+
+        ```py3
+        async with AsyncConnectClient('ApiKey SU-000-000-000:xxxxxxxxxxxxxxxx') as client:
+            product = await client.products['PRD-001-002-003'].get()
+        ```
+        """
+        loop = asyncio.get_running_loop()
+        tasks = [task for task in self._refresh_tasks if task.get_loop() is loop]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        with self._sessions_lock:
+            session = self._sessions.pop(loop, None)
+        if session:
+            await session.aclose()
+
     @property
     def response(self):
         """
@@ -373,8 +687,22 @@ class AsyncConnectClient(_ConnectClientBase, AsyncClientMixin):
     def response(self, value):
         self._response.set(value)
 
+    def _get_streams_limiter(self):
+        if not self.max_concurrent_streams:
+            return contextlib.nullcontext()
+        loop = asyncio.get_running_loop()
+        semaphore = self._streams_semaphores.get(loop)
+        if not semaphore:
+            semaphore = self._streams_semaphores[loop] = asyncio.Semaphore(
+                self.max_concurrent_streams,
+            )
+        return semaphore
+
     def _get_collection_class(self):
         return AsyncCollection
 
     def _get_namespace_class(self):
         return AsyncNS
+
+    def _get_coalescer_class(self):
+        return AsyncRequestCoalescer
@@ -1,10 +1,13 @@
 import json
 import sys
 
+from connect.client.codec import get_json_codec
+
 
 class RequestLogger:
-    def __init__(self, file=sys.stdout):
+    def __init__(self, file=sys.stdout, json_codec=None):
         self._file = file
+        self._json_codec = get_json_codec(json_codec)
 
     def obfuscate(self, key: str, value: str) -> str:
         if key in ('authorization', 'authentication'):
@@ -57,7 +60,7 @@ class RequestLogger:
             lines.append(f'{k}: {v}')
 
         if response.headers.get('Content-Type', None) == 'application/json':
-            lines.append(json.dumps(response.json(), indent=4))
+            lines.append(json.dumps(self._json_codec.loads(response.content), indent=4))
 
         lines.append('')
 
@@ -3,12 +3,18 @@
 #
 # Copyright (c) 2025 CloudBlue. All Rights Reserved.
 #
+import asyncio
+import threading
 import time
 from typing import Any, Dict
 
+import httpx
+import requests
 from httpx import HTTPError
 from requests.exceptions import RequestException, Timeout
+from requests.structures import CaseInsensitiveDict
 
+from connect.client.cache import get_cache_key
 from connect.client.exceptions import ClientError
 
 
@@ -76,49 +82,130 @@ class SyncClientMixin:
 
         kwargs = self._prepare_call_kwargs(kwargs)
 
+        if self.coalesce_requests and method.lower() == 'get':
+            return self._execute_coalesced(method, path, url, kwargs)
+
+        return self._execute(method, path, url, kwargs)
+
+    def _execute_coalesced(self, method, path, url, kwargs):
+        key = get_cache_key(url, kwargs)
+        call, leader = self._coalescer.join(key)
+        if not leader:
+            call.event.wait()
+            if call.completed:
+                self.response = call.response
+                return call.get_result()
+            return self._execute(method, path, url, kwargs)
+        try:
+            result = self._execute(method, path, url, kwargs)
+            call.set_result(self.response, result)
+            return call.get_result()
+        except Exception as e:
+            call.set_exception(self.response, e)
+            raise
+        finally:
+            self._coalescer.leave(key, call)
+
+    def _execute(self, method, path, url, kwargs):
+        cache_key, entry = self._get_cache_entry(method, url, kwargs)
+
         self.response = None
 
+        if entry and self.cache.is_fresh(entry):
+            self.response = self._build_cached_response(entry)
+            return entry.get_body()
+
+        if entry and self.cache.can_serve_stale(entry):
+            self._schedule_cache_refresh(method, url, kwargs, path, cache_key, entry)
+            self.cache.incr('stale')
+            self.response = self._build_cached_response(entry)
+            return entry.get_body()
+
         try:
             self._execute_http_call(method, url, kwargs)
-
-            if self.response.status_code == 204:
-                return None
-            if self.response.headers.get('Content-Type', '').startswith('application/json'):
-                return self.response.json()
-            else:
-                return self.response.content
+            return self._get_response_body(path, cache_key, entry)
 
         except RequestException as re:
             api_error = self._get_api_error_details() or {}
             status_code = self.response.status_code if self.response is not None else None
             raise ClientError(status_code=status_code, **api_error) from re
 
-    def _execute_http_call(self, method, url, kwargs):  # noqa: CCR001
-        retry_count = 0
+        finally:
+            self._invalidate_cache(method, path)
+
+    def _execute_http_call(self, method, url, kwargs):
+        retries = 0
+        started = time.monotonic()
+        path = self._get_path_from_url(url)
+        request_kwargs = self._encode_json_payload(kwargs, 'data')
         while True:
+            wait = self.rate_limiter.acquire(path)
+            if wait:
+                time.sleep(wait)
             if self.logger:
                 self.logger.log_request(method, url, kwargs)
             try:
-                self.response = self.session.request(method, url, **kwargs)
+                self.response = self.session.request(method, url, **request_kwargs)
                 if self.logger:
                     self.logger.log_response(self.response)
-            except RequestException:
-                if retry_count < self.max_retries:
-                    retry_count += 1
-                    time.sleep(1)
-                    continue
-                raise
-
-            if (  # pragma: no branch
-                self.response.status_code >= 500 and retry_count < self.max_retries
-            ):
-                retry_count += 1
-                time.sleep(1)
+            except RequestException as re:
+                delay = self.retry_policy.get_delay(
+                    retries,
+                    time.monotonic() - started,
+                    exception=re,
+                )
+                if delay is None:
+                    raise
+                retries += 1
+                time.sleep(delay)
                 continue
-            break  # pragma: no cover
+
+            retry_after = self.rate_limiter.update(
+                path,
+                self.response.status_code,
+                self.response.headers,
+            )
+            delay = self.retry_policy.get_delay(
+                retries,
+                time.monotonic() - started,
+                status_code=self.response.status_code,
+                retry_after=retry_after,
+            )
+            if delay is None:
+                break
+            retries += 1
+            time.sleep(delay)
+
         if self.response.status_code >= 400:
             self.response.raise_for_status()
 
+    def _schedule_cache_refresh(self, method, url, kwargs, path, cache_key, entry):
+        if self.cache.begin_refresh(cache_key):
+            threading.Thread(
+                target=self._refresh_cache_entry,
+                args=(method, url, kwargs, path, cache_key, entry),
+                daemon=True,
+            ).start()
+
+    def _refresh_cache_entry(self, method, url, kwargs, path, cache_key, entry):
+        try:
+            self._execute_http_call(method, url, kwargs)
+            self._get_response_body(path, cache_key, entry)
+        except RequestException:
+            self._discard_cache_entry(cache_key)
+        finally:
+            self.cache.end_refresh(cache_key)
+
+    def _build_cached_response(self, entry):
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.url = self.response.url if self.response is not None else None
+        response.request = self.response.request if self.response is not None else None
+        response._content = entry.content
+        return response
+
 
 class AsyncClientMixin:
     async def get(self, url: str, **kwargs) -> Any:
@@ -186,50 +273,155 @@ class AsyncClientMixin:
 
         url, kwargs = self._fix_url_params(url, kwargs)
 
+        if self.coalesce_requests and method.lower() == 'get':
+            return await self._execute_coalesced(method, path, url, kwargs)
+
+        return await self._execute(method, path, url, kwargs)
+
+    async def _execute_coalesced(self, method, path, url, kwargs):
+        key = get_cache_key(url, kwargs)
+        call, leader = self._coalescer.join(key)
+        if not leader:
+            await call.event.wait()
+            if call.completed:
+                self.response = call.response
+                return call.get_result()
+            return await self._execute(method, path, url, kwargs)
+        try:
+            result = await self._execute(method, path, url, kwargs)
+            call.set_result(self.response, result)
+            return call.get_result()
+        except Exception as e:
+            call.set_exception(self.response, e)
+            raise
+        finally:
+            self._coalescer.leave(key, call)
+
+    async def _execute(self, method, path, url, kwargs):
+        cache_key, entry = await self._call_cache(self._get_cache_entry, method, url, kwargs)
+
         self.response = None
 
+        if entry and self.cache.is_fresh(entry):
+            self.response = self._build_cached_response(entry)
+            return entry.get_body()
+
+        if entry and self.cache.can_serve_stale(entry):
+            self._schedule_cache_refresh(method, url, kwargs, path, cache_key, entry)
+            self.cache.incr('stale')
+            self.response = self._build_cached_response(entry)
+            return entry.get_body()
+
         try:
             await self._execute_http_call(method, url, kwargs)
-            if self.response.status_code == 204:
-                return None
-            if self.response.headers.get('Content-Type', '').startswith('application/json'):
-                return self.response.json()
-            else:
-                return self.response.content
+            return await self._load_response_body(path, cache_key, entry)
 
         except HTTPError as re:
             api_error = self._get_api_error_details() or {}
             status_code = self.response.status_code if self.response is not None else None
             raise ClientError(status_code=status_code, **api_error) from re
 
+        finally:
+            await self._call_cache(self._invalidate_cache, method, path)
+
+    async def _call_cache(self, func, *args):
+        # The storage methods of a blocking cache (i.e. a database locked by another
+        # process) are called in a worker thread, so they don't stall the event loop.
+        if self.cache is not None and self.cache.blocking:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def _load_response_body(self, path, cache_key, entry):
+        # Same as `_get_response_body`, but the response is set outside of the
+        # worker thread since it's stored in a context variable.
+        if entry and self.response.status_code == 304:
+            entry = await self._call_cache(
+                self.cache.revalidate,
+                cache_key,
+                entry,
+                self.response.headers,
+            )
+            self.response = self._build_cached_response(entry)
+            return entry.get_body()
+        body = self._decode_response_body()
+        if cache_key and self.response.status_code != 204:
+            await self._call_cache(self.cache.store, cache_key, path, body, self.response)
+        return body
+
     async def _execute_http_call(self, method, url, kwargs):
-        retry_count = 0
+        retries = 0
+        started = time.monotonic()
+        path = self._get_path_from_url(url)
+        request_kwargs = self._encode_json_payload(kwargs, 'content')
         while True:
+            wait = self.rate_limiter.acquire(path)
+            if wait:
+                await asyncio.sleep(wait)
             if self.logger:
                 self.logger.log_request(method, url, kwargs)
 
             try:
-                self.response = await self.session.request(method, url, **kwargs)
+                async with self._get_streams_limiter():
+                    self.response = await self.session.request(method, url, **request_kwargs)
 
                 if self.logger:
                     self.logger.log_response(self.response)
-            except HTTPError:
-                if retry_count < self.max_retries:
-                    retry_count += 1
-                    time.sleep(1)
-                    continue
-                raise
-            if (  # pragma: no branch
-                self.response.status_code >= 500 and retry_count < self.max_retries
-            ):
-                retry_count += 1
-                time.sleep(1)
+            except HTTPError as he:
+                delay = self.retry_policy.get_delay(
+                    retries,
+                    time.monotonic() - started,
+                    exception=he,
+                )
+                if delay is None:
+                    raise
+                retries += 1
+                await asyncio.sleep(delay)
                 continue
-            break  # pragma: no cover
+
+            retry_after = self.rate_limiter.update(
+                path,
+                self.response.status_code,
+                self.response.headers,
+            )
+            delay = self.retry_policy.get_delay(
+                retries,
+                time.monotonic() - started,
+                status_code=self.response.status_code,
+                retry_after=retry_after,
+            )
+            if delay is None:
+                break
+            retries += 1
+            await asyncio.sleep(delay)
 
         if self.response.status_code >= 400:
             self.response.raise_for_status()
 
+    def _schedule_cache_refresh(self, method, url, kwargs, path, cache_key, entry):
+        if self.cache.begin_refresh(cache_key):
+            task = asyncio.create_task(
+                self._refresh_cache_entry(method, url, kwargs, path, cache_key, entry),
+            )
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+            # The task can be cancelled before it starts, so release the entry once done.
+            task.add_done_callback(lambda _: self.cache.end_refresh(cache_key))
+
+    async def _refresh_cache_entry(self, method, url, kwargs, path, cache_key, entry):
+        try:
+            await self._execute_http_call(method, url, kwargs)
+            await self._load_response_body(path, cache_key, entry)
+        except HTTPError:
+            await self._call_cache(self._discard_cache_entry, cache_key)
+
+    def _build_cached_response(self, entry):
+        return httpx.Response(
+            200,
+            headers=entry.headers,
+            content=entry.content,
+            request=self.response.request if self.response is not None else None,
+        )
+
     def _fix_url_params(self, url, kwargs):
         if 'params' in kwargs:
             params = kwargs.pop('params')
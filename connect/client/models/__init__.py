@@ -13,5 +13,11 @@ from connect.client.models.base import (  # noqa
     Collection,
     Resource,
 )
+from connect.client.models.batch import (  # noqa
+    BulkActionResult,
+    BulkResult,
+    ChunkError,
+    MultiGetResult,
+)
 from connect.client.models.exceptions import NotYetEvaluatedError  # noqa
 from connect.client.models.resourceset import AsyncResourceSet, ResourceSet  # noqa
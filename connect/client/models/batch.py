@@ -0,0 +1,166 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+from collections import namedtuple
+from urllib.parse import quote
+
+from connect.client.utils import resolve_attribute
+
+
+# Max length of the list of ids of an `in` filter, so that the request URL stays
+# well below the limits of servers and proxies.
+MAX_IN_FILTER_LENGTH = 2000
+
+
+ChunkError = namedtuple('ChunkError', ('items', 'error'))
+
+
+class MultiGetResult(dict):
+    """
+    The resources returned by `get_many`, keyed by id.
+
+    Attributes:
+        missing (list): The ids that don't match any resource.
+    """
+
+    def __init__(self, resources=None, missing=None):
+        super().__init__(resources or {})
+        self.missing = missing or []
+
+
+class BulkActionResult(dict):
+    """
+    The outcome of `bulk_action` keyed by resource id. Each value is the object
+    returned by the action or the `ClientError` raised executing it.
+    """
+
+    @property
+    def succeeded(self) -> list:
+        """
+        Returns the ids of the resources the action has been executed on.
+        """
+        return [id_ for id_, value in self.items() if not isinstance(value, Exception)]
+
+    @property
+    def failed(self) -> dict:
+        """
+        Returns the errors raised executing the action keyed by resource id.
+        """
+        return {id_: value for id_, value in self.items() if isinstance(value, Exception)}
+
+
+class BulkResult:
+    """
+    The outcome of a bulk operation whose payload has been sent in chunks.
+
+    Attributes:
+        succeeded (list): The items of the chunks that have been processed.
+        failed (list): The items of the chunks that failed.
+        results (list): The objects returned for the chunks that have been processed.
+        errors (List[ChunkError]): The items of each chunk that failed together with
+            the `ClientError` raised.
+    """
+
+    def __init__(self):
+        self.succeeded = []
+        self.failed = []
+        self.results = []
+        self.errors = []
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns True if all the chunks have been processed.
+        """
+        return not self.failed
+
+    def add_success(self, items, result):
+        self.succeeded.extend(items)
+        if isinstance(result, list):
+            self.results.extend(result)
+        elif result is not None:
+            self.results.append(result)
+
+    def add_failure(self, items, error):
+        self.failed.extend(items)
+        self.errors.append(ChunkError(items, error))
+
+    def __repr__(self):
+        return f'<BulkResult succeeded={len(self.succeeded)} failed={len(self.failed)}>'
+
+
+def validate_positive(name, value):
+    if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+        raise ValueError(f'`{name}` must be a positive, non-zero integer.')
+
+
+def get_unique_ids(ids):
+    if isinstance(ids, str) or not all(isinstance(id_, str) for id_ in ids):
+        raise TypeError('`ids` must be a list of strings.')
+    return list(dict.fromkeys(ids))
+
+
+def get_unique_items(items):
+    """
+    Returns the `(id, item)` pairs of `items`, that can be ids or resources.
+    """
+    unique_items = {}
+    for item in items:
+        if isinstance(item, str):
+            id_ = item
+        elif isinstance(item, dict) and isinstance(item.get('id'), str):
+            id_ = item['id']
+        else:
+            raise TypeError('`items` must be a list of ids or resources.')
+        unique_items.setdefault(id_, item)
+    return list(unique_items.items())
+
+
+def chunk_ids(ids, chunk_size, max_length=None):
+    """
+    Split `ids` in chunks of at most `chunk_size` ids whose URL-encoded
+    length does not exceed `max_length`.
+    """
+    max_length = max_length or MAX_IN_FILTER_LENGTH
+    chunk = []
+    length = 0
+    for id_ in ids:
+        size = len(quote(id_, safe='')) + 1
+        if chunk and (len(chunk) == chunk_size or length + size > max_length):
+            yield chunk
+            chunk = []
+            length = 0
+        chunk.append(id_)
+        length += size
+    if chunk:
+        yield chunk
+
+
+def chunk_payload(payload, chunk_size):
+    payload = list(payload)
+    return [payload[idx : idx + chunk_size] for idx in range(0, len(payload), chunk_size)]
+
+
+def get_bulk_result(outcomes):
+    """
+    Aggregate the `(items, result, error)` outcome of each chunk into a `BulkResult`.
+    """
+    bulk_result = BulkResult()
+    for items, result, error in outcomes:
+        if error is None:
+            bulk_result.add_success(items, result)
+        else:
+            bulk_result.add_failure(items, error)
+    return bulk_result
+
+
+def get_multi_get_result(ids, resources, field):
+    found = {}
+    for resource in resources:
+        found[resolve_attribute(field, resource)] = resource
+    return MultiGetResult(
+        {id_: found[id_] for id_ in ids if id_ in found},
+        [id_ for id_ in ids if id_ not in found],
+    )
@@ -0,0 +1,203 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+import csv
+import gzip
+import io
+import json
+import os
+
+from connect.client.utils import import_optional
+
+
+FORMATS = ('ndjson', 'csv', 'parquet')
+COMPRESSIONS = ('gzip', 'zstd')
+
+
+def _get_zstd_compress():
+    try:
+        # Python 3.14+
+        return import_optional('compression.zstd', 'zstd').compress
+    except ImportError:
+        return import_optional('zstandard', 'zstd').ZstdCompressor().compress
+
+
+class Checkpoint:
+    """
+    Record how many resources have been written to an export file, so that an
+    interrupted export can be resumed.
+
+    The checkpoint is saved after each page together with the size of the file,
+    so the resumed export can discard anything written after it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.size = 0
+        self.last = None
+
+    def load(self, format):
+        if not (self.path and os.path.exists(self.path)):
+            return False
+        with open(self.path) as f:
+            state = json.load(f)
+        if state['format'] != format:
+            raise ValueError(
+                f'The checkpoint `{self.path}` belongs to a `{state["format"]}` export.',
+            )
+        self.count = state['count']
+        self.size = state['size']
+        self.last = state['last']
+        return True
+
+    def save(self, format, count, size, last):
+        self.count = count
+        self.size = size
+        self.last = last
+        if not self.path:
+            return
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(
+                {'format': format, 'count': count, 'size': size, 'last': last},
+                f,
+            )
+        os.replace(tmp_path, self.path)
+
+    def remove(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class Exporter:
+    """
+    Write the pages of a ResourceSet to a file as soon as they are fetched.
+
+    Each page is encoded and, if requested, compressed on its own: gzip members
+    and zstd frames can be concatenated, so the file can be truncated to the size
+    recorded by the last checkpoint and appended to when the export is resumed.
+    """
+
+    def __init__(
+        self,
+        path,
+        format='ndjson',
+        fields=None,
+        compression=None,
+        checkpoint=None,
+        json_codec=None,
+    ):
+        if format not in FORMATS:
+            raise ValueError(f'`format` must be one of {", ".join(FORMATS)}.')
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f'`compression` must be one of {", ".join(COMPRESSIONS)}.')
+        if format == 'csv' and not fields:
+            raise ValueError('The csv format requires the `fields` to export.')
+        if format == 'parquet' and checkpoint:
+            raise ValueError('The parquet format does not support checkpoints.')
+        self.path = path
+        self.format = format
+        self.fields = fields
+        self.compression = compression
+        self.json_codec = json_codec
+        self.checkpoint = Checkpoint(checkpoint)
+        self._file = None
+        self._compress = None
+        self._parquet_writer = None
+
+    @property
+    def count(self):
+        return self.checkpoint.count
+
+    def open(self):
+        """
+        Open the export file, resuming the export if a checkpoint exists.
+        Returns the checkpoint.
+        """
+        if self.format == 'parquet':
+            self._pyarrow = import_optional('pyarrow', 'parquet export')
+            self._parquet = import_optional('pyarrow.parquet', 'parquet export')
+            return self.checkpoint
+        if self.compression == 'gzip':
+            self._compress = gzip.compress
+        elif self.compression == 'zstd':
+            self._compress = _get_zstd_compress()
+        if self.checkpoint.load(self.format):
+            self._file = open(self.path, 'r+b')
+            self._file.truncate(self.checkpoint.size)
+            self._file.seek(self.checkpoint.size)
+        else:
+            self._file = open(self.path, 'wb')
+            if self.format == 'csv':
+                self._write(self._encode_csv_rows([self.fields]))
+        return self.checkpoint
+
+    def write(self, items, last=None):
+        """
+        Write a page of resources, or of their values if `fields` was provided,
+        and save the checkpoint.
+        """
+        if not items:
+            return
+        if self.format == 'parquet':
+            self._write_parquet(items)
+        elif self.format == 'csv':
+            self._write(
+                self._encode_csv_rows(
+                    [[self._get_csv_value(item[field]) for field in self.fields] for item in items],
+                ),
+            )
+        else:
+            self._write(self._encode_ndjson(items))
+        size = self._file.tell() if self._file else 0
+        self.checkpoint.save(self.format, self.checkpoint.count + len(items), size, last)
+
+    def close(self, completed=True):
+        """
+        Close the export file. If the export has been completed the checkpoint is removed.
+        """
+        if self._parquet_writer:
+            self._parquet_writer.close()
+        if self._file:
+            self._file.close()
+        if completed:
+            self.checkpoint.remove()
+
+    def _write(self, data):
+        if self._compress:
+            data = self._compress(data)
+        self._file.write(data)
+        self._file.flush()
+
+    def _encode_ndjson(self, items):
+        if self.fields:
+            items = [{field: item[field] for field in self.fields} for item in items]
+        return b''.join(self.json_codec.dumps(item) + b'\n' for item in items)
+
+    def _get_csv_value(self, value):
+        if isinstance(value, (dict, list)):
+            return self.json_codec.dumps(value).decode('utf-8')
+        return value
+
+    def _encode_csv_rows(self, rows):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode('utf-8')
+
+    def _write_parquet(self, items):
+        if self.fields:
+            table = self._pyarrow.table(
+                {field: [item[field] for item in items] for field in self.fields}
+            )
+        else:
+            table = self._pyarrow.Table.from_pylist(items)
+        if self._parquet_writer is None:
+            self._parquet_writer = self._parquet.ParquetWriter(
+                self.path,
+                table.schema,
+                compression=self.compression or 'snappy',
+            )
+        self._parquet_writer.write_table(table)
@@ -3,7 +3,14 @@
 #
 # Copyright (c) 2025 CloudBlue. All Rights Reserved.
 #
-from connect.client.utils import get_values, parse_content_range
+import asyncio
+import copy
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from connect.client.exceptions import ClientError
+from connect.client.utils import compile_values, parse_content_range, resolve_attribute
 
 
 class aiter:
@@ -26,13 +33,21 @@ class AbstractBaseIterator:
         self._query = query
         self._config = config
         self._kwargs = kwargs
+        self._filter = None
         self._loaded = False
 
+    @property
+    def _append(self):
+        return self._client.resourceset_append and not self._rs._stream
+
     def get_item(self, item):
         raise NotImplementedError('get_item must be implemented in subclasses.')
 
 
 class AbstractIterator(AbstractBaseIterator):
+    def __iter__(self):
+        return self
+
     def _load(self):
         if not self._loaded:
             self._rs._results, self._rs._content_range = self._execute_request()
@@ -62,7 +77,7 @@ class AbstractIterator(AbstractBaseIterator):
             if not results:
                 raise
             self._rs._content_range = cr
-            if self._client.resourceset_append:
+            if self._append:
                 self._rs._results.extend(results)
             else:
                 self._rs._results = results
@@ -71,18 +86,27 @@ class AbstractIterator(AbstractBaseIterator):
 
         return self.get_item(item)
 
-    def _execute_request(self):
-        results = self._client.get(
-            f'{self._path}?{self._query}',
-            **self._config,
-        )
+    def _execute_request(self, config=None):
+        try:
+            results = self._client.get(
+                f'{self._path}?{self._query}',
+                **(config or self._config),
+            )
+        except ClientError as error:
+            if not self._rs._disable_projection(error):
+                raise
+            self._query = self._rs._build_qs(self._filter)
+            return self._execute_request(config)
         content_range = parse_content_range(
             self._client.response.headers.get('Content-Range'),
         )
-        return results, content_range
+        return self._rs._load_related(results), content_range
 
 
 class AbstractAsyncIterator(AbstractBaseIterator):
+    def __aiter__(self):
+        return self
+
     async def _load(self):
         if not self._loaded:
             self._rs._results, self._rs._content_range = await self._execute_request()
@@ -112,7 +136,7 @@ class AbstractAsyncIterator(AbstractBaseIterator):
             if not results:
                 raise StopAsyncIteration
             self._rs._content_range = cr
-            if self._client.resourceset_append:
+            if self._append:
                 self._rs._results.extend(results)
             else:
                 self._rs._results = results
@@ -121,15 +145,292 @@ class AbstractAsyncIterator(AbstractBaseIterator):
 
         return self.get_item(item)
 
-    async def _execute_request(self):
-        results = await self._client.get(
-            f'{self._path}?{self._query}',
-            **self._config,
-        )
+    async def _execute_request(self, config=None):
+        try:
+            results = await self._client.get(
+                f'{self._path}?{self._query}',
+                **(config or self._config),
+            )
+        except ClientError as error:
+            if not self._rs._disable_projection(error):
+                raise
+            self._query = self._rs._build_qs(self._filter)
+            return await self._execute_request(config)
         content_range = parse_content_range(
             self._client.response.headers.get('Content-Range'),
         )
-        return results, content_range
+        return await self._rs._load_related(results), content_range
+
+
+class ParallelMixin:
+    """
+    Fetch the pages that follow the first one concurrently, once the first response
+    tells how many resources have to be fetched.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._items = None
+
+    def _get_next_pages(self):
+        """
+        Returns the offset and the limit of each page that follows the first one.
+        """
+        content_range = self._rs._content_range
+        if not self._rs._results or content_range is None:
+            return
+        limit = self._config['params']['limit']
+        stop = content_range.count
+        if self._rs._slice:
+            stop = min(stop, self._rs._slice.stop)
+        offset = content_range.last + 1
+        while offset < stop:
+            yield offset, min(limit, self._rs._slice.stop - offset) if self._rs._slice else limit
+            offset += limit
+
+    def _get_page_config(self, offset, limit):
+        config = copy.deepcopy(self._config)
+        config['params']['offset'] = offset
+        config['params']['limit'] = limit
+        return config
+
+    def _add_page(self, results, content_range):
+        self._rs._content_range = content_range
+        if self._append:
+            self._rs._results.extend(results)
+        else:
+            self._rs._results = results
+
+
+class ParallelIterator(ParallelMixin, AbstractIterator):
+    def __next__(self):
+        if self._items is None:
+            self._items = self._iter_items()
+        return self.get_item(next(self._items))
+
+    def close(self):
+        """
+        Stop fetching pages and discard the ones already fetched.
+        """
+        if self._items is not None:
+            self._items.close()
+
+    def _iter_items(self):
+        self._load()
+        pages = self._get_next_pages()
+        executor = ThreadPoolExecutor(max_workers=self._kwargs['workers'])
+        pending = deque()
+        try:
+            for offset, limit in itertools.islice(pages, self._kwargs['max_buffered_pages']):
+                pending.append(self._submit(executor, offset, limit))
+            yield from self._rs._results or ()
+            while pending:
+                results, content_range = pending.popleft().result()
+                next_page = next(pages, None)
+                if next_page:
+                    pending.append(self._submit(executor, *next_page))
+                if results:
+                    self._add_page(results, content_range)
+                    yield from results
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, executor, offset, limit):
+        return executor.submit(self._execute_request, self._get_page_config(offset, limit))
+
+
+class AsyncParallelIterator(ParallelMixin, AbstractAsyncIterator):
+    async def __anext__(self):
+        if self._items is None:
+            self._items = self._iter_items()
+        return self.get_item(await self._items.__anext__())
+
+    async def aclose(self):
+        """
+        Stop fetching pages and discard the ones already fetched.
+        """
+        if self._items is not None:
+            await self._items.aclose()
+
+    async def _iter_items(self):
+        await self._load()
+        pages = self._get_next_pages()
+        semaphore = asyncio.Semaphore(self._kwargs['concurrency'])
+        pending = deque()
+        try:
+            for offset, limit in itertools.islice(pages, self._kwargs['max_buffered_pages']):
+                pending.append(self._create_task(semaphore, offset, limit))
+            for item in self._rs._results or ():
+                yield item
+            while pending:
+                results, content_range = await pending.popleft()
+                next_page = next(pages, None)
+                if next_page:
+                    pending.append(self._create_task(semaphore, *next_page))
+                if results:
+                    self._add_page(results, content_range)
+                    for item in results:
+                        yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _create_task(self, semaphore, offset, limit):
+        return asyncio.create_task(
+            self._execute_limited_request(semaphore, self._get_page_config(offset, limit)),
+        )
+
+    async def _execute_limited_request(self, semaphore, config):
+        async with semaphore:
+            return await self._execute_request(config)
+
+
+class KeysetMixin:
+    """
+    Fetch each page after the first one filtering the resources that follow the
+    last one of the previous page, according to the keyset field.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._fetched = 0
+
+    def _get_next_page_config(self, results):
+        """
+        Returns the keyword arguments to fetch the page that follows `results`
+        or None if `results` is the last page.
+        """
+        self._fetched += len(results)
+        limit = self._config['params']['limit']
+        content_range = self._rs._content_range
+        if content_range is not None:
+            if content_range.last >= content_range.count - 1:
+                return
+        elif len(results) < limit:
+            return
+        if self._rs._slice:
+            limit = min(limit, self._rs._slice.stop - self._rs._slice.start - self._fetched)
+            if limit <= 0:
+                return
+        field = self._kwargs['keyset'].lstrip('-')
+        value = resolve_attribute(field, results[-1])
+        if value is None:
+            raise ValueError(f'The keyset field `{field}` is missing from the results.')
+        self._filter = self._rs._get_keyset_query(value)
+        self._query = self._rs._build_qs(self._filter)
+        self._config['params']['offset'] = 0
+        self._config['params']['limit'] = limit
+        return self._config
+
+    def _add_page(self, results, content_range):
+        self._rs._content_range = content_range
+        if self._append:
+            self._rs._results.extend(results)
+        else:
+            self._rs._results = results
+        self._results_iterator = iter(results)
+        self._page = results
+
+
+class KeysetIterator(KeysetMixin, AbstractIterator):
+    def _load(self):
+        if not self._loaded:
+            super()._load()
+            self._page = self._rs._results
+
+    def __next__(self):
+        self._load()
+
+        while self._page:
+            try:
+                return self.get_item(next(self._results_iterator))
+            except StopIteration:
+                config = self._get_next_page_config(self._page)
+                if config is None:
+                    break
+                self._add_page(*self._execute_request(config))
+        raise StopIteration
+
+
+class AsyncKeysetIterator(KeysetMixin, AbstractAsyncIterator):
+    async def _load(self):
+        if not self._loaded:
+            await super()._load()
+            self._page = self._rs._results
+
+    async def __anext__(self):
+        await self._load()
+
+        while self._page:
+            try:
+                return self.get_item(next(self._results_iterator))
+            except StopIteration:
+                config = self._get_next_page_config(self._page)
+                if config is None:
+                    break
+                self._add_page(*(await self._execute_request(config)))
+        raise StopAsyncIteration
+
+
+class StreamIterator:
+    """
+    Iterate over the resources of a streaming ResourceSet releasing each page
+    once it has been consumed.
+    """
+
+    def __init__(self, rs, iterator):
+        self._rs = rs
+        self._iterator = iterator
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            self._rs._results = None
+            raise
+
+    def close(self):
+        """
+        Stop the iteration and release the current page.
+        """
+        if hasattr(self._iterator, 'close'):
+            self._iterator.close()
+        self._rs._results = None
+
+
+class AsyncStreamIterator:
+    """
+    Iterate over the resources of a streaming AsyncResourceSet releasing each page
+    once it has been consumed.
+    """
+
+    def __init__(self, rs, iterator):
+        self._rs = rs
+        self._iterator = iterator
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self._iterator.__anext__()
+        except StopAsyncIteration:
+            self._rs._results = None
+            raise
+
+    async def aclose(self):
+        """
+        Stop the iteration and release the current page.
+        """
+        if hasattr(self._iterator, 'aclose'):
+            await self._iterator.aclose()
+        self._rs._results = None
 
 
 class ResourceMixin:
@@ -138,8 +439,12 @@ class ResourceMixin:
 
 
 class ValueListMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._get_values = compile_values(self._kwargs['fields'])
+
     def get_item(self, item):
-        return get_values(item, self._kwargs['fields'])
+        return self._get_values(item)
 
 
 class ResourceIterator(ResourceMixin, AbstractIterator):
@@ -156,3 +461,35 @@ class AsyncResourceIterator(ResourceMixin, AbstractAsyncIterator):
 
 class AsyncValuesListIterator(ValueListMixin, AbstractAsyncIterator):
     pass
+
+
+class ParallelResourceIterator(ResourceMixin, ParallelIterator):
+    pass
+
+
+class ParallelValuesListIterator(ValueListMixin, ParallelIterator):
+    pass
+
+
+class AsyncParallelResourceIterator(ResourceMixin, AsyncParallelIterator):
+    pass
+
+
+class AsyncParallelValuesListIterator(ValueListMixin, AsyncParallelIterator):
+    pass
+
+
+class KeysetResourceIterator(ResourceMixin, KeysetIterator):
+    pass
+
+
+class KeysetValuesListIterator(ValueListMixin, KeysetIterator):
+    pass
+
+
+class AsyncKeysetResourceIterator(ResourceMixin, AsyncKeysetIterator):
+    pass
+
+
+class AsyncKeysetValuesListIterator(ValueListMixin, AsyncKeysetIterator):
+    pass
@@ -3,8 +3,12 @@
 #
 # Copyright (c) 2025 CloudBlue. All Rights Reserved.
 #
+import asyncio
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     Tuple,
@@ -12,7 +16,19 @@ from typing import (
 )
 
 from connect.client.exceptions import ClientError
-from connect.client.utils import resolve_attribute
+from connect.client.models.batch import (
+    BulkActionResult,
+    MultiGetResult,
+    chunk_ids,
+    chunk_payload,
+    get_bulk_result,
+    get_multi_get_result,
+    get_unique_ids,
+    get_unique_items,
+    validate_positive,
+)
+from connect.client.rql import R
+from connect.client.utils import compile_values, get_projection
 
 
 class CollectionMixin:
@@ -84,7 +100,13 @@ class CollectionMixin:
             **kwargs,
         )
 
-    def bulk_create(self, payload: Union[List, Tuple], **kwargs):
+    def bulk_create(
+        self,
+        payload: Union[List, Tuple],
+        chunk_size: int = None,
+        concurrency: int = 4,
+        **kwargs,
+    ):
         """
         Create a set of resources within this collection in a single call.
 
@@ -156,17 +178,39 @@ class CollectionMixin:
 
         Args:
             payload (list|tuple): The list of objects to create.
+            chunk_size (int): (Optional) Send the payload in chunks of `chunk_size` objects
+                instead of in a single call.
+            concurrency (int): (Optional) Number of chunks to send concurrently.
+
+        Returns:
+            (BulkResult): If `chunk_size` is provided, returns the items of the chunks that
+                have been processed and of the ones that failed.
         """
         if not isinstance(payload, (list, tuple)):
             raise TypeError('`payload` must be a list or tuple.')
 
+        if chunk_size is not None:
+            return self._execute_bulk(
+                self._client.create,
+                payload,
+                chunk_size,
+                concurrency,
+                kwargs,
+            )
+
         return self._client.create(
             self._path,
             payload=payload,
             **kwargs,
         )
 
-    def bulk_update(self, payload: Union[List, Tuple], **kwargs):
+    def bulk_update(
+        self,
+        payload: Union[List, Tuple],
+        chunk_size: int = None,
+        concurrency: int = 4,
+        **kwargs,
+    ):
         """
         Update a set of resources that belong to this collection in a single call.
 
@@ -212,17 +256,39 @@ class CollectionMixin:
 
         Args:
             payload (list|tuple): The list of objects to update.
+            chunk_size (int): (Optional) Send the payload in chunks of `chunk_size` objects
+                instead of in a single call.
+            concurrency (int): (Optional) Number of chunks to send concurrently.
+
+        Returns:
+            (BulkResult): If `chunk_size` is provided, returns the items of the chunks that
+                have been processed and of the ones that failed.
         """
         if not isinstance(payload, (list, tuple)):
             raise TypeError('`payload` must be a list or tuple.')
 
+        if chunk_size is not None:
+            return self._execute_bulk(
+                self._client.update,
+                payload,
+                chunk_size,
+                concurrency,
+                kwargs,
+            )
+
         return self._client.update(
             self._path,
             payload=payload,
             **kwargs,
         )
 
-    def bulk_delete(self, payload: Union[List, Tuple], **kwargs):
+    def bulk_delete(
+        self,
+        payload: Union[List, Tuple],
+        chunk_size: int = None,
+        concurrency: int = 4,
+        **kwargs,
+    ):
         """
         Delete a set of resources from within this collection in a single call.
 
@@ -258,16 +324,153 @@ class CollectionMixin:
 
         Args:
             payload (list|tuple): The list of objects to update.
+            chunk_size (int): (Optional) Send the payload in chunks of `chunk_size` objects
+                instead of in a single call.
+            concurrency (int): (Optional) Number of chunks to send concurrently.
+
+        Returns:
+            (BulkResult): If `chunk_size` is provided, returns the items of the chunks that
+                have been processed and of the ones that failed.
         """
         if not isinstance(payload, (list, tuple)):
             raise TypeError('`payload` must be a list or tuple.')
 
+        if chunk_size is not None:
+            return self._execute_bulk(
+                self._client.delete,
+                payload,
+                chunk_size,
+                concurrency,
+                kwargs,
+            )
+
         self._client.delete(
             self._path,
             payload=payload,
             **kwargs,
         )
 
+    def get_many(
+        self,
+        ids: List[str],
+        chunk_size: int = 100,
+        concurrency: int = 4,
+        field: str = 'id',
+    ) -> MultiGetResult:
+        """
+        Get the resources of this collection identified by `ids`.
+
+        Ids are sent in chunks using the RQL `in` operator, so thousands of resources
+        are fetched with a handful of requests, and the chunks are fetched concurrently.
+
+        Usage:
+
+        ```py3
+        assets = client.assets.get_many(['AS-0000-0000-0001', 'AS-0000-0000-0002'])
+        for asset_id in assets.missing:
+            ...
+        ```
+
+        Args:
+            ids (List[str]): The ids of the resources.
+            chunk_size (int): (Optional) Max number of ids per request. Chunks are
+                smaller if needed to keep the request URL short.
+            concurrency (int): (Optional) Number of chunks to fetch concurrently.
+            field (str): (Optional) The field that identifies the resources.
+
+        Returns:
+            (MultiGetResult): Returns a dictionary of the resources keyed by id. Its
+                `missing` attribute lists the ids that don't match any resource.
+        """
+        ids = get_unique_ids(ids)
+        validate_positive('chunk_size', chunk_size)
+        validate_positive('concurrency', concurrency)
+
+        def fetch(chunk):
+            return list(self.filter(R().n(field).oneof(chunk)).limit(len(chunk)))
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pages = list(executor.map(fetch, chunk_ids(ids, chunk_size)))
+
+        return get_multi_get_result(ids, itertools.chain.from_iterable(pages), field)
+
+    def bulk_action(
+        self,
+        name: str,
+        items: List[Union[str, Dict]],
+        payload_fn: Callable[[Any], Dict] = None,
+        concurrency: int = 4,
+        progress: Callable[[int, int], Any] = None,
+        **kwargs,
+    ) -> BulkActionResult:
+        """
+        Execute the action `name` on many resources of this collection concurrently.
+
+        An error executing the action on a resource doesn't stop the others. Calls
+        answered with `429` or `5xx` status codes are retried by the client according
+        to its `RetryPolicy`, and its `RateLimiter` slows down all the calls.
+
+        Usage:
+
+        ```py3
+        results = client.requests.bulk_action(
+            'approve',
+            ['PR-0000-0000-0000-001', 'PR-0000-0000-0000-002'],
+            payload_fn=lambda request_id: {'template_id': 'TL-000-000-000'},
+            progress=lambda done, total: print(f'{done}/{total}'),
+        )
+        for request_id, error in results.failed.items():
+            ...
+        ```
+
+        Args:
+            name (str): The name of the action to execute.
+            items (list): The ids of the resources or the resources.
+            payload_fn (callable): (Optional) A function that receives an item and returns
+                the payload of the action for it.
+            concurrency (int): (Optional) Number of actions to execute concurrently.
+            progress (callable): (Optional) A function called with the number of actions
+                executed and the total number of actions each time an action completes.
+
+        Returns:
+            (BulkActionResult): Returns a dictionary keyed by resource id whose values are
+                the objects returned by the action or the `ClientError` raised.
+        """
+        items = get_unique_items(items)
+        validate_positive('concurrency', concurrency)
+
+        def execute(id_, item):
+            payload = payload_fn(item) if payload_fn else None
+            try:
+                return self.resource(id_).action(name).post(payload=payload, **kwargs)
+            except ClientError as error:
+                return error
+
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {executor.submit(execute, id_, item): id_ for id_, item in items}
+            for done, future in enumerate(as_completed(futures), 1):
+                outcomes[futures[future]] = future.result()
+                if progress:
+                    progress(done, len(items))
+
+        return BulkActionResult((id_, outcomes[id_]) for id_, _ in items)
+
+    def _execute_bulk(self, method, payload, chunk_size, concurrency, kwargs):
+        validate_positive('chunk_size', chunk_size)
+        validate_positive('concurrency', concurrency)
+
+        def execute(items):
+            try:
+                return items, method(self._path, payload=items, **kwargs), None
+            except ClientError as error:
+                return items, None, error
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = list(executor.map(execute, chunk_payload(payload, chunk_size)))
+
+        return get_bulk_result(outcomes)
+
 
 class AsyncCollectionMixin:
     async def create(self, payload: Dict = None, **kwargs):
@@ -338,7 +541,13 @@ class AsyncCollectionMixin:
             **kwargs,
         )
 
-    async def bulk_create(self, payload: Union[List, Tuple], **kwargs):
+    async def bulk_create(
+        self,
+        payload: Union[List, Tuple],
+        chunk_size: int = None,
+        concurrency: int = 4,
+        **kwargs,
+    ):
         """
         Create a set of resources within this collection in a single call.
 
@@ -410,17 +619,39 @@ class AsyncCollectionMixin:
 
         Args:
             payload (list|tuple): The list of objects to create.
+            chunk_size (int): (Optional) Send the payload in chunks of `chunk_size` objects
+                instead of in a single call.
+            concurrency (int): (Optional) Number of chunks to send concurrently.
+
+        Returns:
+            (BulkResult): If `chunk_size` is provided, returns the items of the chunks that
+                have been processed and of the ones that failed.
         """
         if not isinstance(payload, (list, tuple)):
             raise TypeError('`payload` must be a list or tuple.')
 
+        if chunk_size is not None:
+            return await self._execute_bulk(
+                self._client.create,
+                payload,
+                chunk_size,
+                concurrency,
+                kwargs,
+            )
+
         return await self._client.create(
             self._path,
             payload=payload,
             **kwargs,
         )
 
-    async def bulk_update(self, payload: Union[List, Tuple], **kwargs):
+    async def bulk_update(
+        self,
+        payload: Union[List, Tuple],
+        chunk_size: int = None,
+        concurrency: int = 4,
+        **kwargs,
+    ):
         """
         Update a set of resources that belong to this collection in a single call.
 
@@ -466,17 +697,39 @@ class AsyncCollectionMixin:
 
         Args:
             payload (list|tuple): The list of objects to update.
+            chunk_size (int): (Optional) Send the payload in chunks of `chunk_size` objects
+                instead of in a single call.
+            concurrency (int): (Optional) Number of chunks to send concurrently.
+
+        Returns:
+            (BulkResult): If `chunk_size` is provided, returns the items of the chunks that
+                have been processed and of the ones that failed.
         """
         if not isinstance(payload, (list, tuple)):
             raise TypeError('`payload` must be a list or tuple.')
 
+        if chunk_size is not None:
+            return await self._execute_bulk(
+                self._client.update,
+                payload,
+                chunk_size,
+                concurrency,
+                kwargs,
+            )
+
         return await self._client.update(
             self._path,
             payload=payload,
             **kwargs,
         )
 
-    async def bulk_delete(self, payload: Union[List, Tuple], **kwargs):
+    async def bulk_delete(
+        self,
+        payload: Union[List, Tuple],
+        chunk_size: int = None,
+        concurrency: int = 4,
+        **kwargs,
+    ):
         """
         Delete a set of resources from within this collection in a single call.
 
@@ -512,16 +765,167 @@ class AsyncCollectionMixin:
 
         Args:
             payload (list|tuple): The list of objects to update.
+            chunk_size (int): (Optional) Send the payload in chunks of `chunk_size` objects
+                instead of in a single call.
+            concurrency (int): (Optional) Number of chunks to send concurrently.
+
+        Returns:
+            (BulkResult): If `chunk_size` is provided, returns the items of the chunks that
+                have been processed and of the ones that failed.
         """
         if not isinstance(payload, (list, tuple)):
             raise TypeError('`payload` must be a list or tuple.')
 
+        if chunk_size is not None:
+            return await self._execute_bulk(
+                self._client.delete,
+                payload,
+                chunk_size,
+                concurrency,
+                kwargs,
+            )
+
         return await self._client.delete(
             self._path,
             payload=payload,
             **kwargs,
         )
 
+    async def get_many(
+        self,
+        ids: List[str],
+        chunk_size: int = 100,
+        concurrency: int = 4,
+        field: str = 'id',
+    ) -> MultiGetResult:
+        """
+        Get the resources of this collection identified by `ids`.
+
+        Ids are sent in chunks using the RQL `in` operator, so thousands of resources
+        are fetched with a handful of requests, and the chunks are fetched concurrently.
+
+        Usage:
+
+        ```py3
+        assets = await client.assets.get_many(['AS-0000-0000-0001', 'AS-0000-0000-0002'])
+        for asset_id in assets.missing:
+            ...
+        ```
+
+        Args:
+            ids (List[str]): The ids of the resources.
+            chunk_size (int): (Optional) Max number of ids per request. Chunks are
+                smaller if needed to keep the request URL short.
+            concurrency (int): (Optional) Number of chunks to fetch concurrently.
+            field (str): (Optional) The field that identifies the resources.
+
+        Returns:
+            (MultiGetResult): Returns a dictionary of the resources keyed by id. Its
+                `missing` attribute lists the ids that don't match any resource.
+        """
+        ids = get_unique_ids(ids)
+        validate_positive('chunk_size', chunk_size)
+        validate_positive('concurrency', concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(chunk):
+            async with semaphore:
+                rs = self.filter(R().n(field).oneof(chunk)).limit(len(chunk))
+                return [resource async for resource in rs]
+
+        pages = await asyncio.gather(*(fetch(chunk) for chunk in chunk_ids(ids, chunk_size)))
+
+        return get_multi_get_result(ids, itertools.chain.from_iterable(pages), field)
+
+    async def bulk_action(
+        self,
+        name: str,
+        items: List[Union[str, Dict]],
+        payload_fn: Callable[[Any], Dict] = None,
+        concurrency: int = 4,
+        progress: Callable[[int, int], Any] = None,
+        **kwargs,
+    ) -> BulkActionResult:
+        """
+        Execute the action `name` on many resources of this collection concurrently.
+
+        An error executing the action on a resource doesn't stop the others. Calls
+        answered with `429` or `5xx` status codes are retried by the client according
+        to its `RetryPolicy`, and its `RateLimiter` slows down all the calls.
+
+        Usage:
+
+        ```py3
+        results = await client.requests.bulk_action(
+            'approve',
+            ['PR-0000-0000-0000-001', 'PR-0000-0000-0000-002'],
+            payload_fn=lambda request_id: {'template_id': 'TL-000-000-000'},
+            progress=lambda done, total: print(f'{done}/{total}'),
+        )
+        for request_id, error in results.failed.items():
+            ...
+        ```
+
+        Args:
+            name (str): The name of the action to execute.
+            items (list): The ids of the resources or the resources.
+            payload_fn (callable): (Optional) A function that receives an item and returns
+                the payload of the action for it.
+            concurrency (int): (Optional) Number of actions to execute concurrently.
+            progress (callable): (Optional) A function called with the number of actions
+                executed and the total number of actions each time an action completes.
+
+        Returns:
+            (BulkActionResult): Returns a dictionary keyed by resource id whose values are
+                the objects returned by the action or the `ClientError` raised.
+        """
+        items = get_unique_items(items)
+        validate_positive('concurrency', concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+        done = 0
+
+        async def execute(id_, item):
+            nonlocal done
+            async with semaphore:
+                payload = payload_fn(item) if payload_fn else None
+                try:
+                    outcome = (
+                        await self.resource(id_)
+                        .action(name)
+                        .post(
+                            payload=payload,
+                            **kwargs,
+                        )
+                    )
+                except ClientError as error:
+                    outcome = error
+            done += 1
+            if progress:
+                progress(done, len(items))
+            return outcome
+
+        outcomes = await asyncio.gather(*(execute(id_, item) for id_, item in items))
+
+        return BulkActionResult(zip((id_ for id_, _ in items), outcomes))
+
+    async def _execute_bulk(self, method, payload, chunk_size, concurrency, kwargs):
+        validate_positive('chunk_size', chunk_size)
+        validate_positive('concurrency', concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def execute(items):
+            async with semaphore:
+                try:
+                    return items, await method(self._path, payload=items, **kwargs), None
+                except ClientError as error:
+                    return items, None, error
+
+        outcomes = await asyncio.gather(
+            *(execute(items) for items in chunk_payload(payload, chunk_size)),
+        )
+
+        return get_bulk_result(outcomes)
+
 
 class ResourceMixin:
     def exists(self) -> bool:
@@ -632,6 +1036,8 @@ class ResourceMixin:
 
         !!! note
             Nested field can be specified using dot notation.
+            The fields are requested using the RQL `select` operator, so the server
+            only returns them.
 
         Usage:
 
@@ -643,11 +1049,15 @@ class ResourceMixin:
             (dict): Returns a flat dictionary containing only the fields of this resource
                 passed as arguments.
         """
-        results = {}
-        item = self.get()
-        for field in fields:
-            results[field] = resolve_attribute(field, item)
-        return results
+        get_values = compile_values(fields)
+        select = ','.join(get_projection(fields))
+        try:
+            item = self._client.get(f'{self._path}?select({select})')
+        except ClientError as error:
+            if error.status_code != 400:
+                raise
+            item = self.get()
+        return get_values(item)
 
 
 class AsyncResourceMixin:
@@ -696,9 +1106,15 @@ class AsyncResourceMixin:
         product = await client.products['PRD-000-111-222'].get()
         ```
 
+        !!! note
+            If the client has a `GetBatcher`, gets without arguments are batched with
+            the other gets of resources of the same collection.
+
         Returns:
             (dict): Returns the resource this `Resource` object refers to.
         """
+        if self._client.get_batcher and not kwargs:
+            return await self._client.get_batcher.get(self._client, self._path)
         return await self._client.get(self._path, **kwargs)
 
     async def update(self, payload=None, **kwargs) -> Dict:
@@ -765,6 +1181,8 @@ class AsyncResourceMixin:
 
         !!! note
             Nested field can be specified using dot notation.
+            The fields are requested using the RQL `select` operator, so the server
+            only returns them.
 
         Usage:
 
@@ -776,11 +1194,15 @@ class AsyncResourceMixin:
             (dict): Returns a flat dictionary containing only the fields of this resource
                 passed as arguments.
         """
-        results = {}
-        item = await self.get()
-        for field in fields:
-            results[field] = resolve_attribute(field, item)
-        return results
+        get_values = compile_values(fields)
+        select = ','.join(get_projection(fields))
+        try:
+            item = await self._client.get(f'{self._path}?select({select})')
+        except ClientError as error:
+            if error.status_code != 400:
+                raise
+            item = await self.get()
+        return get_values(item)
 
 
 class ActionMixin:
@@ -3,21 +3,46 @@
 #
 # Copyright (c) 2025 CloudBlue. All Rights Reserved.
 #
+import asyncio
 import copy
+from collections import OrderedDict
+from typing import Dict, List
 
+from connect.client.exceptions import ClientError
 from connect.client.models.exceptions import NotYetEvaluatedError
+from connect.client.models.export import Exporter
 from connect.client.models.iterators import (
+    AsyncKeysetResourceIterator,
+    AsyncKeysetValuesListIterator,
+    AsyncParallelResourceIterator,
+    AsyncParallelValuesListIterator,
     AsyncResourceIterator,
+    AsyncStreamIterator,
     AsyncValuesListIterator,
+    KeysetResourceIterator,
+    KeysetValuesListIterator,
+    ParallelResourceIterator,
+    ParallelValuesListIterator,
     ResourceIterator,
+    StreamIterator,
     ValuesListIterator,
     aiter,
 )
 from connect.client.rql import R
-from connect.client.utils import parse_content_range, resolve_attribute
+from connect.client.utils import (
+    compile_field_path,
+    compile_values,
+    get_projection,
+    import_optional,
+    parse_content_range,
+    resolve_attribute,
+)
 
 
 class _ResourceSetBase:
+    # Max number of pages kept in memory to serve indexed access.
+    MAX_CACHED_PAGES = 10
+
     def __init__(
         self,
         client,
@@ -37,6 +62,14 @@ class _ResourceSetBase:
         self._select = []
         self._ordering = []
         self._config = {}
+        self._workers = None
+        self._max_buffered_pages = None
+        self._keyset = None
+        self._stream = False
+        self._projection = True
+        self._pages = OrderedDict()
+        self._related = []
+        self._related_cache = {}
 
     @property
     def path(self):
@@ -208,33 +241,359 @@ class _ResourceSetBase:
 
         Nested field can be specified using dot notation.
 
+        The fields are added to the RQL `select` operator so that the server only
+        returns them. If the server rejects them, the full resources are requested.
+
         Usage:
 
         ```py3
         values = rs.values_list('field', 'nested.field')
         ```
         """
+        get_values = compile_values(fields)
         if self._results:
             self._fields = fields
-            return [self._get_values(item) for item in self._results]
+            return [get_values(item) for item in self._results]
 
         copy = self._copy()
         copy._fields = fields
         return copy
 
+    def keyset(self, field: str = 'id'):
+        """
+        Paginate this ResourceSet by the value of a unique field instead of by offset.
+
+        Resources are ordered by `field` and each page after the first one is
+        fetched adding the `gt(field,last_value)` filter to the query, where
+        `last_value` is the value of `field` of the last resource of the previous page,
+        so the cost of a page does not grow with its depth and resources created or deleted
+        during the iteration don't cause other resources to be skipped or returned twice.
+
+        Usage:
+
+        ```py3
+        for asset in client('subscriptions').assets.all().keyset('id'):
+            ...
+        ```
+
+        !!! note
+            The ordering of the ResourceSet is replaced by `field`. To iterate in
+            descending order the name of the field must be prefixed with
+            a `-` (minus) sign.
+
+        Args:
+            field (str): (Optional) The unique, monotonic field used to paginate.
+
+        Returns:
+            (ResourceSet): Returns a copy of the current ResourceSet that uses keyset
+                pagination.
+        """
+        if not isinstance(field, str):
+            raise TypeError('`field` must be a string.')
+
+        if not field.lstrip('-'):
+            raise ValueError('`field` must not be blank.')
+
+        if self._workers:
+            raise ValueError('Keyset pagination cannot be combined with `parallel` or `prefetch`.')
+
+        copy = self._copy()
+        copy._keyset = field
+        return copy
+
+    def stream(self, chunk_size: int = None):
+        """
+        Iterate over this ResourceSet without retaining the pages already consumed.
+
+        Each page replaces the previous one regardless of the `resourceset_append`
+        option of the client and is released once the iteration ends, so memory usage
+        does not grow with the number of resources. Iterating again over the ResourceSet
+        fetches its pages again.
+
+        Usage:
+
+        ```py3
+        for record in client.ns('usage').records.all().stream(chunk_size=1000):
+            ...
+        ```
+
+        Args:
+            chunk_size (int): (Optional) Number of resources fetched per page,
+                defaults to the current limit.
+
+        Returns:
+            (ResourceSet): Returns a copy of the current ResourceSet that doesn't retain
+                its pages.
+        """
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size <= 0):
+            raise ValueError('`chunk_size` must be a positive, non-zero integer.')
+
+        copy = self._copy()
+        copy._stream = True
+        if chunk_size:
+            copy._limit = chunk_size
+        return copy
+
+    def prefetch(self, pages: int = 1):
+        """
+        Fetch the next `pages` pages in background while the current one
+        is being consumed.
+
+        Pages are requested by a pool of threads for the `ResourceSet` or by
+        asyncio tasks for the `AsyncResourceSet`, so the network round trips overlap
+        with the processing of the resources. At most `pages` pages are kept in memory
+        waiting to be consumed and closing the iterator cancels the outstanding requests.
+
+        Usage:
+
+        ```py3
+        for request in client.requests.all().limit(1000).prefetch(2):
+            ...
+        ```
+
+        Args:
+            pages (int): (Optional) Number of pages to fetch ahead.
+
+        Returns:
+            (ResourceSet): Returns a copy of the current ResourceSet that fetches its pages
+                in background.
+        """
+        if not isinstance(pages, int):
+            raise TypeError('`pages` must be an integer.')
+
+        if pages <= 0:
+            raise ValueError('`pages` must be a positive, non-zero integer.')
+
+        if self._keyset:
+            raise ValueError('Keyset pagination cannot be combined with `parallel` or `prefetch`.')
+
+        copy = self._copy()
+        copy._workers = min(self._workers or pages, pages)
+        copy._max_buffered_pages = pages
+        return copy
+
+    def prefetch_related(self, field: str, collection: str):
+        """
+        Replace the reference to a related resource with the full resource
+        for each resource of this ResourceSet.
+
+        As pages are fetched, the distinct ids of the related resources are collected
+        and the related resources are fetched from `collection` in batches using the
+        RQL `in` operator. Related resources already fetched during the iteration are
+        not fetched again, so resources referencing the same related resource share
+        the same object.
+
+        Usage:
+
+        ```py3
+        requests = (
+            client.requests.filter(status='pending')
+            .prefetch_related('asset.product', collection='products')
+            .prefetch_related('asset.connection', collection='connections')
+        )
+        for request in requests:
+            print(request['asset']['product']['name'])
+        ```
+
+        Args:
+            field (str): The dot notation path of the reference to the related resource,
+                an object with the `id` of the related resource.
+            collection (str): The path of the collection of the related resources,
+                i.e. `products` or `subscriptions/assets`.
+
+        Returns:
+            (ResourceSet): Returns a copy of the current ResourceSet that fetches the
+                related resources.
+        """
+        if not isinstance(field, str) or not isinstance(collection, str):
+            raise TypeError('`field` and `collection` must be strings.')
+
+        if not field or not collection:
+            raise ValueError('`field` and `collection` must not be blank.')
+
+        if compile_field_path(field).projection != field:
+            raise ValueError('`field` must be a dot notation path.')
+
+        copy = self._copy()
+        copy._related.append((field, collection))
+        return copy
+
+    def _parallel(self, workers, max_buffered_pages, name):
+        if not isinstance(workers, int):
+            raise TypeError(f'`{name}` must be an integer.')
+
+        if workers <= 0:
+            raise ValueError(f'`{name}` must be a positive, non-zero integer.')
+
+        if max_buffered_pages is not None and (
+            not isinstance(max_buffered_pages, int) or max_buffered_pages < workers
+        ):
+            raise ValueError(
+                f'`max_buffered_pages` must be an integer greater than or equal to `{name}`.'
+            )
+
+        if self._keyset:
+            raise ValueError('Keyset pagination cannot be combined with `parallel` or `prefetch`.')
+
+        copy = self._copy()
+        copy._workers = workers
+        copy._max_buffered_pages = max_buffered_pages or 2 * workers
+        return copy
+
+    def _get_columns(self, fields):
+        fields = fields or self._fields
+        if not fields:
+            raise ValueError('At least one field must be specified.')
+        columns = {field: [] for field in fields}
+        appenders = tuple((field, columns[field].append) for field in fields)
+        return self.stream().values_list(*fields), columns, appenders
+
+    def _get_export(self, path, format, fields, compression, concurrency, checkpoint):
+        fields = fields or self._fields
+        exporter = Exporter(
+            path,
+            format=format,
+            fields=fields,
+            compression=compression,
+            checkpoint=checkpoint,
+            json_codec=self._client.json_codec,
+        )
+        rs = self.stream()
+        if concurrency:
+            rs = rs._parallel(concurrency, None, 'concurrency')
+        if fields:
+            key = self._keyset.lstrip('-') if self._keyset else None
+            rs = rs.values_list(*fields, *([key] if key and key not in fields else []))
+        state = exporter.open()
+        if state.count and self._keyset and state.last is not None:
+            rs = rs.filter(rs._get_keyset_query(state.last))
+        elif state.count:
+            rs._offset += state.count
+        return exporter, rs
+
+    def _get_export_last(self, item):
+        if not self._keyset:
+            return
+        key = self._keyset.lstrip('-')
+        return item[key] if key in item else resolve_attribute(key, item)
+
+    def _get_page_copy(self, page):
+        copy = self._copy()
+        copy._offset = page * self._limit
+        copy._related_cache = self._related_cache
+        return copy
+
+    def _get_missing_related(self, results):
+        """
+        Returns the ids of the related resources referenced by `results` that
+        have not been fetched yet keyed by collection.
+        """
+        missing = {}
+        for field, collection in self._related:
+            get_related = compile_field_path(field)
+            cache = self._related_cache.setdefault(collection, {})
+            ids = missing.setdefault(collection, {})
+            for item in results:
+                related = get_related(item)
+                if isinstance(related, dict) and isinstance(related.get('id'), str):
+                    if related['id'] not in cache:
+                        ids[related['id']] = None
+        return {collection: list(ids) for collection, ids in missing.items() if ids}
+
+    def _cache_related(self, collection, ids, resources):
+        cache = self._related_cache[collection]
+        for id_ in ids:
+            cache[id_] = resources.get(id_)
+
+    def _attach_related(self, results):
+        # The results and the objects they contain can be shared with the response
+        # cache, so a new list is returned and the items with a related resource are
+        # copied, together with the objects along the path, instead of being modified.
+        results = list(results)
+        for field, collection in self._related:
+            get_related = compile_field_path(field)
+            keys = field.split('.')
+            cache = self._related_cache[collection]
+            for idx, item in enumerate(results):
+                related = get_related(item)
+                if not isinstance(related, dict):
+                    continue
+                resource = cache.get(related.get('id'))
+                if resource is None:
+                    continue
+                parent = results[idx] = copy.copy(item)
+                for key in keys[:-1]:
+                    parent[key] = copy.copy(parent[key])
+                    parent = parent[key]
+                parent[keys[-1]] = resource
+        return results
+
+    def _get_related_collection(self, collection):
+        return self._client._get_collection_class()(self._client, collection)
+
+    def _get_cached_page(self, page):
+        results = self._pages.get(page)
+        if results is not None:
+            self._pages.move_to_end(page)
+        return results
+
+    def _cache_page(self, page, results):
+        self._pages[page] = results or []
+        while len(self._pages) > self.MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+        return self._pages[page]
+
     def _get_values(self, item):
-        return {field: resolve_attribute(field, item) for field in self._fields}
+        return compile_values(self._fields)(item)
 
-    def _build_qs(self):
+    def _get_select(self):
+        """
+        Returns the fields of the RQL `select` operator, including the ones
+        requested through `values_list` so that the server only returns them.
+        """
+        if not (self._fields and self._projection):
+            return self._select
+        select = list(self._select)
+        fields = [*self._fields, *(f'{field}.id' for field, _ in self._related)]
+        if self._keyset:
+            fields.append(self._keyset.lstrip('-'))
+        for field in get_projection(fields):
+            if field not in select:
+                select.append(field)
+        return select
+
+    def _disable_projection(self, error):
+        """
+        Stop adding the `values_list` fields to the RQL `select` operator if the
+        server rejected them. Returns True if the request must be sent again.
+        """
+        if error.status_code != 400 or self._get_select() == self._select:
+            return False
+        self._projection = False
+        return True
+
+    def _build_qs(self, query=None):
         qs = ''
-        if self._select:
-            qs += f'&select({",".join(self._select)})'
-        if self._query:
-            qs += f'&{str(self._query)}'
-        if self._ordering:
-            qs += f'&ordering({",".join(self._ordering)})'
+        select = self._get_select()
+        if select:
+            qs += f'&select({",".join(select)})'
+        query = self._query & query if query else self._query
+        if query:
+            qs += f'&{str(query)}'
+        ordering = [self._keyset] if self._keyset else self._ordering
+        if ordering:
+            qs += f'&ordering({",".join(ordering)})'
         return qs[1:] if qs else ''
 
+    def _get_keyset_query(self, value):
+        """
+        Returns the filter that selects the resources that follow `value`
+        according to the keyset ordering.
+        """
+        if self._keyset.startswith('-'):
+            return R().n(self._keyset[1:]).lt(value)
+        return R().n(self._keyset).gt(value)
+
     def _get_request_url(self):
         url = f'{self._path}'
         qs = self._build_qs()
@@ -269,6 +628,12 @@ class _ResourceSetBase:
         rs._select = copy.copy(self._select)
         rs._ordering = copy.copy(self._ordering)
         rs._config = copy.deepcopy(self._config)
+        rs._workers = self._workers
+        rs._max_buffered_pages = self._max_buffered_pages
+        rs._keyset = self._keyset
+        rs._stream = self._stream
+        rs._projection = self._projection
+        rs._related = list(self._related)
 
         return rs
 
@@ -307,6 +672,8 @@ class ResourceSet(_ResourceSetBase):
     """
 
     def __iter__(self):
+        if self._stream:
+            return StreamIterator(self, self._iterator())
         if self._results is None:
             return self._iterator()
         return iter(self._results)
@@ -325,11 +692,13 @@ class ResourceSet(_ResourceSetBase):
             return self._results[key]
 
         if isinstance(key, int):
-            copy = self._copy()
-            copy._limit = 1
-            copy._offset = key
-            copy._fetch_all()
-            return copy._results[0] if copy._results else None
+            page, position = divmod(key, self._limit)
+            results = self._get_cached_page(page)
+            if results is None:
+                copy = self._get_page_copy(page)
+                copy._fetch_all()
+                results = self._cache_page(page, copy._results)
+            return results[position] if position < len(results) else None
 
         copy = self._copy()
         copy._offset = key.start
@@ -361,6 +730,169 @@ class ResourceSet(_ResourceSetBase):
             return copy._content_range.count
         return self._content_range.count
 
+    def parallel(self, workers: int = 4, max_buffered_pages: int = None):
+        """
+        Fetch the pages of this ResourceSet concurrently using a pool of threads.
+
+        The first page is fetched as usual to know how many resources have to be
+        fetched, then the following pages are requested by `workers` threads.
+        Resources are still returned in order and at most `max_buffered_pages` pages
+        are kept in memory waiting to be consumed.
+
+        Usage:
+
+        ```py3
+        for subscription in client('subscriptions').assets.all().limit(1000).parallel(workers=8):
+            ...
+        ```
+
+        Args:
+            workers (int): (Optional) Number of pages to fetch concurrently.
+            max_buffered_pages (int): (Optional) Max number of pages fetched ahead,
+                defaults to twice the number of workers.
+
+        Returns:
+            (ResourceSet): Returns a copy of the current ResourceSet that fetches its pages
+                concurrently.
+        """
+        return self._parallel(workers, max_buffered_pages, 'workers')
+
+    def iterator(self, chunk_size: int = None):
+        """
+        Returns an iterator over the resources of this ResourceSet that holds
+        at most one page in memory.
+
+        Usage:
+
+        ```py3
+        for asset in client.assets.all().iterator(chunk_size=500):
+            ...
+        ```
+
+        Args:
+            chunk_size (int): (Optional) Number of resources fetched per page,
+                defaults to the current limit.
+        """
+        return iter(self.stream(chunk_size))
+
+    def to_columns(self, *fields) -> Dict[str, List]:
+        """
+        Returns the values of the `fields` of the resources of this ResourceSet
+        as a dictionary of lists, one per field.
+
+        Pages are streamed and only the values of the requested fields are kept,
+        so memory usage is proportional to the selected columns rather than
+        to the full resources.
+
+        Usage:
+
+        ```py3
+        columns = client.ns('usage').records.all().to_columns('id', 'usage.amount')
+        ```
+
+        Args:
+            fields (str): The fields to extract, using the same notation as `values_list`.
+                Defaults to the fields of `values_list`, if any.
+
+        Returns:
+            (dict): Returns a dictionary with a list of values for each field.
+        """
+        values, columns, appenders = self._get_columns(fields)
+        for item in values:
+            for field, append in appenders:
+                append(item[field])
+        return columns
+
+    def to_arrow(self, *fields):
+        """
+        Returns the `fields` of the resources of this ResourceSet as a `pyarrow.Table`.
+
+        !!! note
+            It requires the [pyarrow](https://arrow.apache.org/docs/python/) package.
+
+        Args:
+            fields (str): The fields to extract, see `to_columns`.
+        """
+        pyarrow = import_optional('pyarrow', 'to_arrow')
+        return pyarrow.table(self.to_columns(*fields))
+
+    def to_pandas(self, *fields):
+        """
+        Returns the `fields` of the resources of this ResourceSet as a `pandas.DataFrame`.
+
+        !!! note
+            It requires the [pandas](https://pandas.pydata.org/) package.
+
+        Args:
+            fields (str): The fields to extract, see `to_columns`.
+        """
+        pandas = import_optional('pandas', 'to_pandas')
+        return pandas.DataFrame(self.to_columns(*fields))
+
+    def export(
+        self,
+        path: str,
+        format: str = 'ndjson',
+        fields: List[str] = None,
+        compression: str = None,
+        concurrency: int = None,
+        checkpoint: str = None,
+    ) -> int:
+        """
+        Export the resources of this ResourceSet to a file.
+
+        Each page is written to the file as soon as it is fetched and then released,
+        so memory usage does not depend on the number of resources.
+
+        Usage:
+
+        ```py3
+        client('subscriptions').assets.all().export(
+            'assets.csv.gz',
+            format='csv',
+            fields=['id', 'status', 'product.id', 'items.*.id'],
+            compression='gzip',
+            checkpoint='assets.checkpoint',
+        )
+        ```
+
+        !!! note
+            If `checkpoint` is provided, the number of resources written is saved to
+            the checkpoint file after each page and an interrupted export is resumed
+            from there when `export` is called again. The checkpoint file is removed
+            once the export completes. Use `keyset` or a stable ordering so resumed
+            exports don't skip or duplicate resources.
+
+        Args:
+            path (str): The path of the file.
+            format (str): (Optional) The format of the file: `ndjson`, `csv` or `parquet`.
+                The `parquet` format requires the `pyarrow` package.
+            fields (List[str]): (Optional) The fields to export, using the same notation
+                as `values_list`. Required by the `csv` format.
+            compression (str): (Optional) Compress the file using `gzip` or `zstd`. The zstd
+                compression requires Python 3.14+ or the `zstandard` package.
+            concurrency (int): (Optional) Number of pages to fetch concurrently.
+            checkpoint (str): (Optional) The path of the checkpoint file. Not supported by
+                the `parquet` format.
+
+        Returns:
+            (int): Returns the number of exported resources.
+        """
+        exporter, rs = self._get_export(path, format, fields, compression, concurrency, checkpoint)
+        page = []
+        try:
+            for item in rs:
+                page.append(item)
+                if len(page) == rs._limit:
+                    exporter.write(page, self._get_export_last(item))
+                    page = []
+            exporter.write(page, self._get_export_last(page[-1]) if page else None)
+        except BaseException:
+            exporter.close(completed=False)
+            raise
+        exporter.close()
+        return exporter.count
+
     def first(self):
         """
         Returns the first resource that belongs to this ResourceSet object
@@ -390,6 +922,15 @@ class ResourceSet(_ResourceSetBase):
             self._build_qs(),
             self._get_request_kwargs(),
         )
+        if self._keyset:
+            if self._fields:
+                return KeysetValuesListIterator(*args, fields=self._fields, keyset=self._keyset)
+            return KeysetResourceIterator(*args, keyset=self._keyset)
+        if self._workers:
+            kwargs = {'workers': self._workers, 'max_buffered_pages': self._max_buffered_pages}
+            if self._fields:
+                return ParallelValuesListIterator(*args, fields=self._fields, **kwargs)
+            return ParallelResourceIterator(*args, **kwargs)
         iterator = (
             ValuesListIterator(*args, fields=self._fields)
             if self._fields
@@ -398,11 +939,24 @@ class ResourceSet(_ResourceSetBase):
         return iterator
 
     def _execute_request(self, url, kwargs):
-        results = self._client.get(url, **kwargs)
+        try:
+            results = self._client.get(url, **kwargs)
+        except ClientError as error:
+            if not self._disable_projection(error):
+                raise
+            return self._execute_request(self._get_request_url(), kwargs)
         self._content_range = parse_content_range(
             self._client.response.headers.get('Content-Range'),
         )
-        return results
+        return self._load_related(results)
+
+    def _load_related(self, results):
+        if not (self._related and results):
+            return results
+        for collection, ids in self._get_missing_related(results).items():
+            resources = self._get_related_collection(collection).get_many(ids)
+            self._cache_related(collection, ids, resources)
+        return self._attach_related(results)
 
     def _fetch_all(self):
         if self._results is None:
@@ -429,6 +983,8 @@ class AsyncResourceSet(_ResourceSetBase):
     """
 
     def __aiter__(self):
+        if self._stream:
+            return AsyncStreamIterator(self, self._iterator())
         if self._results is None:
             return self._iterator()
         return aiter(self._results)
@@ -455,6 +1011,41 @@ class AsyncResourceSet(_ResourceSetBase):
 
         return copy
 
+    async def aget(self, index: int):
+        """
+        Returns the resource at position `index` of this ResourceSet or None
+        if the ResourceSet has less resources.
+
+        The page of `limit` resources that contains `index` is fetched and kept
+        in memory, so accessing the resources of the same page doesn't send other
+        requests. Only the last accessed pages are kept.
+
+        Usage:
+
+        ```py3
+        rs = client.products.all().limit(50)
+        first = await rs.aget(0)
+        second = await rs.aget(1)
+        ```
+
+        Args:
+            index (int): The position of the resource.
+        """
+        if not isinstance(index, int):
+            raise TypeError('ResourceSet indices must be integers.')
+        self._validate_key(index)
+
+        if self._results is not None:
+            return self._results[index]
+
+        page, position = divmod(index, self._limit)
+        results = self._get_cached_page(page)
+        if results is None:
+            copy = self._get_page_copy(page)
+            await copy._fetch_all()
+            results = self._cache_page(page, copy._results)
+        return results[position] if position < len(results) else None
+
     async def count(self) -> int:
         """
         Returns the total number of resources within this ResourceSet object.
@@ -475,6 +1066,175 @@ class AsyncResourceSet(_ResourceSetBase):
             await self._execute_request(url, kwargs)
         return self._content_range.count
 
+    def parallel(self, concurrency: int = 4, max_buffered_pages: int = None):
+        """
+        Fetch the pages of this ResourceSet concurrently.
+
+        The first page is fetched as usual to know how many resources have to be
+        fetched, then up to `concurrency` of the following pages are requested at once.
+        Resources are still returned in order and at most `max_buffered_pages` pages
+        are kept in memory waiting to be consumed.
+
+        Usage:
+
+        ```py3
+        async for subscription in (
+            client('subscriptions').assets.all().limit(1000).parallel(concurrency=8)
+        ):
+            ...
+        ```
+
+        Args:
+            concurrency (int): (Optional) Number of pages to fetch concurrently.
+            max_buffered_pages (int): (Optional) Max number of pages fetched ahead,
+                defaults to twice the concurrency.
+
+        Returns:
+            (AsyncResourceSet): Returns a copy of the current ResourceSet that fetches its pages
+                concurrently.
+        """
+        return self._parallel(concurrency, max_buffered_pages, 'concurrency')
+
+    def iterator(self, chunk_size: int = None):
+        """
+        Returns an asynchronous iterator over the resources of this ResourceSet that holds
+        at most one page in memory.
+
+        Usage:
+
+        ```py3
+        async for asset in client.assets.all().iterator(chunk_size=500):
+            ...
+        ```
+
+        Args:
+            chunk_size (int): (Optional) Number of resources fetched per page,
+                defaults to the current limit.
+        """
+        return self.stream(chunk_size).__aiter__()
+
+    async def to_columns(self, *fields) -> Dict[str, List]:
+        """
+        Returns the values of the `fields` of the resources of this ResourceSet
+        as a dictionary of lists, one per field.
+
+        Pages are streamed and only the values of the requested fields are kept,
+        so memory usage is proportional to the selected columns rather than
+        to the full resources.
+
+        Usage:
+
+        ```py3
+        columns = await client.ns('usage').records.all().to_columns('id', 'usage.amount')
+        ```
+
+        Args:
+            fields (str): The fields to extract, using the same notation as `values_list`.
+                Defaults to the fields of `values_list`, if any.
+
+        Returns:
+            (dict): Returns a dictionary with a list of values for each field.
+        """
+        values, columns, appenders = self._get_columns(fields)
+        async for item in values:
+            for field, append in appenders:
+                append(item[field])
+        return columns
+
+    async def to_arrow(self, *fields):
+        """
+        Returns the `fields` of the resources of this ResourceSet as a `pyarrow.Table`.
+
+        !!! note
+            It requires the [pyarrow](https://arrow.apache.org/docs/python/) package.
+
+        Args:
+            fields (str): The fields to extract, see `to_columns`.
+        """
+        pyarrow = import_optional('pyarrow', 'to_arrow')
+        return pyarrow.table(await self.to_columns(*fields))
+
+    async def to_pandas(self, *fields):
+        """
+        Returns the `fields` of the resources of this ResourceSet as a `pandas.DataFrame`.
+
+        !!! note
+            It requires the [pandas](https://pandas.pydata.org/) package.
+
+        Args:
+            fields (str): The fields to extract, see `to_columns`.
+        """
+        pandas = import_optional('pandas', 'to_pandas')
+        return pandas.DataFrame(await self.to_columns(*fields))
+
+    async def export(
+        self,
+        path: str,
+        format: str = 'ndjson',
+        fields: List[str] = None,
+        compression: str = None,
+        concurrency: int = None,
+        checkpoint: str = None,
+    ) -> int:
+        """
+        Export the resources of this ResourceSet to a file.
+
+        Each page is written to the file as soon as it is fetched and then released,
+        so memory usage does not depend on the number of resources.
+
+        Usage:
+
+        ```py3
+        await client('subscriptions').assets.all().export(
+            'assets.csv.gz',
+            format='csv',
+            fields=['id', 'status', 'product.id', 'items.*.id'],
+            compression='gzip',
+            checkpoint='assets.checkpoint',
+        )
+        ```
+
+        !!! note
+            If `checkpoint` is provided, the number of resources written is saved to
+            the checkpoint file after each page and an interrupted export is resumed
+            from there when `export` is called again. The checkpoint file is removed
+            once the export completes. Use `keyset` or a stable ordering so resumed
+            exports don't skip or duplicate resources.
+
+        Args:
+            path (str): The path of the file.
+            format (str): (Optional) The format of the file: `ndjson`, `csv` or `parquet`.
+                The `parquet` format requires the `pyarrow` package.
+            fields (List[str]): (Optional) The fields to export, using the same notation
+                as `values_list`. Required by the `csv` format.
+            compression (str): (Optional) Compress the file using `gzip` or `zstd`. The zstd
+                compression requires Python 3.14+ or the `zstandard` package.
+            concurrency (int): (Optional) Number of pages to fetch concurrently.
+            checkpoint (str): (Optional) The path of the checkpoint file. Not supported by
+                the `parquet` format.
+
+        Returns:
+            (int): Returns the number of exported resources.
+        """
+        exporter, rs = self._get_export(path, format, fields, compression, concurrency, checkpoint)
+        page = []
+        try:
+            async for item in rs:
+                page.append(item)
+                if len(page) == rs._limit:
+                    await asyncio.to_thread(exporter.write, page, self._get_export_last(item))
+                    page = []
+            await asyncio.to_thread(
+                exporter.write,
+                page,
+                self._get_export_last(page[-1]) if page else None,
+            )
+        except BaseException:
+            exporter.close(completed=False)
+            raise
+        exporter.close()
+        return exporter.count
+
     async def first(self):
         """
         Returns the first resource that belongs to this ResourceSet object
@@ -505,6 +1265,22 @@ class AsyncResourceSet(_ResourceSetBase):
             self._get_request_kwargs(),
         )
 
+        if self._keyset:
+            if self._fields:
+                return AsyncKeysetValuesListIterator(
+                    *args,
+                    fields=self._fields,
+                    keyset=self._keyset,
+                )
+            return AsyncKeysetResourceIterator(*args, keyset=self._keyset)
+        if self._workers:
+            kwargs = {
+                'concurrency': self._workers,
+                'max_buffered_pages': self._max_buffered_pages,
+            }
+            if self._fields:
+                return AsyncParallelValuesListIterator(*args, fields=self._fields, **kwargs)
+            return AsyncParallelResourceIterator(*args, **kwargs)
         iterator = (
             AsyncValuesListIterator(*args, fields=self._fields)
             if self._fields
@@ -513,11 +1289,24 @@ class AsyncResourceSet(_ResourceSetBase):
         return iterator
 
     async def _execute_request(self, url, kwargs):
-        results = await self._client.get(url, **kwargs)
+        try:
+            results = await self._client.get(url, **kwargs)
+        except ClientError as error:
+            if not self._disable_projection(error):
+                raise
+            return await self._execute_request(self._get_request_url(), kwargs)
         self._content_range = parse_content_range(
             self._client.response.headers.get('Content-Range'),
         )
-        return results
+        return await self._load_related(results)
+
+    async def _load_related(self, results):
+        if not (self._related and results):
+            return results
+        for collection, ids in self._get_missing_related(results).items():
+            resources = await self._get_related_collection(collection).get_many(ids)
+            self._cache_related(collection, ids, resources)
+        return self._attach_related(results)
 
     async def _fetch_all(self):
         if self._results is None:  # pragma: no branch
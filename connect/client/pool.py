@@ -0,0 +1,112 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+import queue
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class PoolStats:
+    """
+    Counters of a connection pool.
+
+    Attributes:
+        created (int): Number of connections opened by the pool.
+        discarded (int): Number of connections closed because the pool was full.
+        in_use (int): Number of connections currently checked out of the pool.
+        wait_time (float): Total number of seconds spent waiting for a connection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.created = 0
+        self.discarded = 0
+        self.in_use = 0
+        self.wait_time = 0.0
+
+    def incr(self, name, value=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+
+class _StatsMixin:
+    def __init__(self, *args, **kwargs):
+        self.stats = PoolStats()
+        super().__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        self.stats.incr('created')
+        return conn
+
+    def _get_conn(self, timeout=None):
+        started = time.perf_counter()
+        try:
+            conn = super()._get_conn(timeout=timeout)
+        finally:
+            self.stats.incr('wait_time', time.perf_counter() - started)
+        self.stats.incr('in_use')
+        return conn
+
+    def _put_conn(self, conn):
+        self.stats.incr('in_use', -1)
+        if self.pool is not None and conn is not None:
+            try:
+                self.pool.put(conn, block=False)
+                return
+            except queue.Full:
+                self.stats.incr('discarded')
+        super()._put_conn(conn)
+
+    def get_stats(self):
+        idle = 0
+        if self.pool is not None:
+            idle = sum(1 for conn in list(self.pool.queue) if conn is not None)
+        return {
+            'maxsize': self.pool.maxsize if self.pool is not None else 0,
+            'in_use': self.stats.in_use,
+            'idle': idle,
+            'created': self.stats.created,
+            'discarded': self.stats.discarded,
+            'wait_time': self.stats.wait_time,
+        }
+
+
+class _HTTPConnectionPool(_StatsMixin, HTTPConnectionPool):
+    pass
+
+
+class _HTTPSConnectionPool(_StatsMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    A `requests` transport adapter that keeps track of the usage
+    of its connection pools.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _HTTPConnectionPool,
+            'https': _HTTPSConnectionPool,
+        }
+
+    def get_stats(self):
+        """
+        Returns a dictionary with the statistics of each connection pool
+        managed by this adapter keyed by `scheme://host:port`.
+        """
+        stats = {}
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if isinstance(pool, _StatsMixin):
+                stats[f'{pool.scheme}://{pool.host}:{pool.port}'] = pool.get_stats()
+        return stats
@@ -0,0 +1,230 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+# Values of the rate limit reset headers greater than this threshold are
+# unix timestamps, lower values are a number of seconds.
+_EPOCH_THRESHOLD = 10**9
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse the value of a `Retry-After` header, expressed either as a number of
+    seconds or as an HTTP date, and return the number of seconds to wait.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _get_header(headers, *names):
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    Each call to `reserve` takes a token from the bucket and returns how long the
+    caller has to wait before sending its request. When the bucket is empty
+    tokens are borrowed from the future, so concurrent callers are spread over time
+    instead of being released all together.
+
+    Args:
+        rate (float): (Optional) Number of tokens added to the bucket each second.
+            If not provided the bucket never runs out of tokens.
+        capacity (float): (Optional) Max number of tokens the bucket can hold.
+            Defaults to `rate`.
+    """
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None):
+        self._lock = threading.Lock()
+        self._rate = None
+        self._capacity = None
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self.set_rate(rate, capacity)
+
+    @property
+    def rate(self) -> Optional[float]:
+        return self._rate
+
+    def set_rate(self, rate: Optional[float], capacity: Optional[float] = None):
+        """
+        Change the rate of this bucket.
+
+        Args:
+            rate (float): Number of tokens added to the bucket each second or None
+                to remove the limit.
+            capacity (float): (Optional) Max number of tokens the bucket can hold.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            was_limited = bool(self._rate)
+            self._rate = rate
+            self._capacity = capacity or max(rate or 0.0, 1.0)
+            self._tokens = min(self._tokens, self._capacity) if was_limited else self._capacity
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket and return the number of seconds the caller must
+        wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            # Tokens can be used only once the bucket is no longer blocked, so the
+            # callers waiting for the block to expire are spread over time too.
+            start = max(now, self._blocked_until)
+            wait = start - now
+            if not self._rate:
+                return wait
+            self._refill(start)
+            self._tokens -= 1
+            if self._tokens < 0:
+                wait += -self._tokens / self._rate
+            return wait
+
+    def block(self, seconds: float):
+        """
+        Prevent any caller from sending requests for the next `seconds` seconds.
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def _refill(self, now):
+        if now < self._updated:
+            return
+        if self._rate:
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated) * self._rate,
+            )
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    Client side rate limiter shared by all the threads of a `ConnectClient` or by all the
+    tasks of an `AsyncConnectClient`.
+
+    A token bucket is kept for each endpoint, identified by the first component of the
+    request path (i.e. `products`, `subscriptions`, `devops` etc).
+    Buckets adapt to the `Retry-After` header returned with `429 Too Many Requests` or
+    `503 Service Unavailable` responses and to the `X-RateLimit-*` / `RateLimit-*`
+    headers, so once a caller gets throttled the others slow down too.
+
+    Usage:
+
+    ```py3
+    from connect.client import ConnectClient, RateLimiter
+
+    client = ConnectClient(
+        'ApiKey SU-000-000-000:xxxxxxxxxxxxxxxx',
+        rate_limiter=RateLimiter(rate=10, burst=20),
+    )
+    ```
+
+    Args:
+        rate (float): (Optional) Initial number of requests per second allowed for
+            each endpoint. By default requests are not limited until the API
+            asks to slow down.
+        burst (float): (Optional) Max number of requests that can be sent at once.
+        throttled_rate (float): (Optional) Number of requests per second allowed for an
+            endpoint throttled by the API whose rate is not known yet.
+        max_retry_after (float): (Optional) Max number of seconds requested through the
+            `Retry-After` header the callers are held back for.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        throttled_rate: float = 1.0,
+        max_retry_after: Optional[float] = 60.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.throttled_rate = throttled_rate
+        self.max_retry_after = max_retry_after
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get_key(self, path: str) -> str:
+        """
+        Returns the key of the bucket that rules calls to `path`.
+        """
+        return path.split('?', 1)[0].strip('/').split('/', 1)[0]
+
+    def get_bucket(self, key: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if not bucket:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def acquire(self, path: str) -> float:
+        """
+        Take a token for a call to `path` and returns the number of seconds
+        the caller must wait before sending it.
+        """
+        return self.get_bucket(self.get_key(path)).reserve()
+
+    def update(self, path: str, status_code: int, headers) -> Optional[float]:
+        """
+        Update the bucket that rules calls to `path` given the response status code and
+        headers. Returns the number of seconds to wait, as requested by the `Retry-After`
+        header, or None.
+        """
+        bucket = self.get_bucket(self.get_key(path))
+
+        retry_after = None
+        if status_code in (429, 503):
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            if retry_after:
+                block = retry_after
+                if self.max_retry_after is not None:
+                    block = min(block, self.max_retry_after)
+                bucket.block(block)
+
+        remaining = _to_float(_get_header(headers, 'X-RateLimit-Remaining', 'RateLimit-Remaining'))
+        reset = _to_float(_get_header(headers, 'X-RateLimit-Reset', 'RateLimit-Reset'))
+        if reset is not None and reset > _EPOCH_THRESHOLD:
+            reset = max(0.0, reset - time.time())
+
+        if remaining is not None and reset:
+            if remaining < 1:
+                bucket.block(reset)
+            # Spread the remaining quota over the current window.
+            bucket.set_rate(max(remaining, 1.0) / reset, self.burst or max(remaining, 1.0))
+        elif status_code in (429, 503) and not bucket.rate:
+            bucket.set_rate(self.throttled_rate, self.burst or 1.0)
+        elif status_code == 429 and not retry_after:
+            bucket.set_rate(bucket.rate / 2, self.burst)
+
+        return retry_after
@@ -0,0 +1,162 @@
+#
+# This file is part of the CloudBlue Connect Python OpenAPI Client.
+#
+# Copyright (c) 2025 CloudBlue. All Rights Reserved.
+#
+import random
+from typing import (
+    Dict,
+    Iterable,
+    Optional,
+    Type,
+    Union,
+)
+
+from httpx import HTTPError
+from requests.exceptions import RequestException
+
+
+class RetryPolicy:
+    """
+    Decide whether a failed HTTP call must be retried and how long to wait
+    before the next attempt.
+
+    The delay before the retry number `n` (starting from 1) is computed using
+    an exponential backoff `backoff_factor * 2 ** (n - 1)` capped to `max_backoff`.
+    If `jitter` is enabled, the *full jitter* strategy is applied, so the
+    actual delay is a random value between 0 and the computed backoff.
+    If the server sends a `Retry-After` header the client waits at least the
+    requested amount of time, unless it exceeds `max_retry_after`: in that case
+    the call is not retried.
+
+    Usage:
+
+    ```py3
+    from connect.client import ConnectClient, RetryPolicy
+
+    client = ConnectClient(
+        'ApiKey SU-000-000-000:xxxxxxxxxxxxxxxx',
+        retry_policy=RetryPolicy(
+            max_retries=5,
+            backoff_factor=0.5,
+            max_retry_time=60,
+            status_codes={502: 5, 503: 5, 504: 2},
+        ),
+    )
+    ```
+
+    Args:
+        max_retries (int): (Optional) Max number of retries for a request before raising an error.
+        backoff_factor (float): (Optional) Base delay in seconds of the exponential backoff.
+        max_backoff (float): (Optional) Upper bound in seconds for a single delay.
+        jitter (bool): (Optional) Apply full jitter to the computed delay.
+        max_retry_time (float): (Optional) Max number of seconds that can be spent retrying
+            a single request, measured from the first attempt.
+        max_retry_after (float): (Optional) Max number of seconds requested through the
+            `Retry-After` header the client waits before retrying.
+        status_codes (Iterable[int] | Dict[int, int]): (Optional) HTTP status codes that must be
+            retried. If a dictionary is provided, it maps each status code to its own max
+            number of retries. Defaults to `429 Too Many Requests` and all the 5xx status codes.
+        exceptions (Iterable[Type[Exception]] | Dict[Type[Exception], int]): (Optional)
+            Exception classes raised by the underlying HTTP client that must be retried.
+            If a dictionary is provided, it maps each exception class to its own max number of
+            retries. Defaults to any `requests` or `httpx` transport error.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 1.0,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        max_retry_time: Optional[float] = None,
+        max_retry_after: Optional[float] = 60.0,
+        status_codes: Union[Iterable[int], Dict[int, int], None] = None,
+        exceptions: Union[
+            Iterable[Type[Exception]],
+            Dict[Type[Exception], int],
+            None,
+        ] = None,
+    ):
+        if max_retries < 0:
+            raise ValueError('`max_retries` must be a positive integer or zero.')
+        if backoff_factor < 0:
+            raise ValueError('`backoff_factor` must be a positive number or zero.')
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.max_retry_time = max_retry_time
+        self.max_retry_after = max_retry_after
+        self.status_codes = self._to_rules(status_codes)
+        self.exceptions = self._to_rules(
+            exceptions if exceptions is not None else (RequestException, HTTPError),
+        )
+
+    def get_delay(
+        self,
+        retries: int,
+        elapsed: float,
+        status_code: Optional[int] = None,
+        exception: Optional[Exception] = None,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Returns the number of seconds to wait before retrying or None if the
+        call must not be retried.
+
+        Args:
+            retries (int): Number of retries already performed for this call.
+            elapsed (float): Number of seconds elapsed since the first attempt.
+            status_code (int): (Optional) The HTTP status code of the failed attempt.
+            exception (Exception): (Optional) The exception raised by the failed attempt.
+            retry_after (float): (Optional) The number of seconds to wait requested by
+                the server through the `Retry-After` header.
+        """
+        if exception is not None:
+            max_retries = self._get_exception_max_retries(exception)
+        else:
+            max_retries = self._get_status_max_retries(status_code)
+
+        if retries >= max_retries:
+            return None
+
+        delay = self.compute_backoff(retries + 1)
+        if retry_after is not None:
+            if self.max_retry_after is not None and retry_after > self.max_retry_after:
+                return None
+            delay = max(delay, retry_after)
+        if self.max_retry_time is not None and elapsed + delay > self.max_retry_time:
+            return None
+        return delay
+
+    def compute_backoff(self, attempt: int) -> float:
+        """
+        Returns the delay in seconds before the retry number `attempt`.
+
+        Args:
+            attempt (int): The retry number, starting from 1.
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    def _get_status_max_retries(self, status_code):
+        if status_code is None:
+            return 0
+        if self.status_codes is None:
+            return self.max_retries if status_code >= 500 or status_code == 429 else 0
+        return self.status_codes.get(status_code, 0)
+
+    def _get_exception_max_retries(self, exception):
+        for exc_class, max_retries in self.exceptions.items():
+            if isinstance(exception, exc_class):
+                return max_retries
+        return 0
+
+    def _to_rules(self, rules):
+        if rules is None or isinstance(rules, dict):
+            return rules
+        return {rule: self.max_retries for rule in rules}
@@ -116,7 +116,7 @@ class ConnectClientMocker(_ConnectClientBase):
         headers=None,
         match_body=None,
     ):
-        url = f'{self.endpoint}/{path}'
+        url = self._get_mock_url(path)
 
         kwargs = {
             'method': method.upper(),
@@ -145,6 +145,11 @@ class ConnectClientMocker(_ConnectClientBase):
     def start(self):
         _mocker.start()
 
+    def _get_mock_url(self, path):
+        if isinstance(path, re.Pattern):
+            return re.compile(f'{re.escape(self.endpoint)}/{path.pattern}')
+        return f'{self.endpoint}/{path}'
+
     def reset(self, success=True):
         try:
             _mocker.stop(allow_assert=success)
@@ -219,7 +224,7 @@ class AsyncConnectClientMocker(ConnectClientMocker):
         headers=None,
         match_body=None,
     ):
-        url = f'{self.endpoint}/{path}'
+        url = self._get_mock_url(path)
 
         kwargs = {
             'method': method.upper(),
@@ -3,6 +3,9 @@
 #
 # Copyright (c) 2025 CloudBlue. All Rights Reserved.
 #
+import re
+
+from connect.client.utils import get_projection
 
 
 class CollectionMixin:
@@ -114,12 +117,17 @@ class ResourceMixin:
 
     def values(
         self,
+        *fields,
         status_code=200,
         return_value=None,
         headers=None,
     ):
+        if fields:
+            path = f'{self._path}?select({",".join(get_projection(fields))})'
+        else:
+            path = re.compile(rf'{re.escape(self._path)}(\?.*)?$')
         return self._client.get(
-            self._path,
+            path,
             status_code=status_code,
             return_value=return_value,
             headers=headers,
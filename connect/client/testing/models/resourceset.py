@@ -1,6 +1,29 @@
+import re
+import string
+
 from connect.client.models.resourceset import _ResourceSetBase
 
 
+# Characters that are never percent-encoded in a URL.
+_UNRESERVED = frozenset(f'{string.ascii_letters}{string.digits}-._~')
+
+
+def _get_quoted_pattern(text):
+    """
+    Returns a pattern that matches `text` in a URL whether or not its
+    characters have been percent-encoded.
+    """
+    pattern = ''
+    for char in text:
+        if char in _UNRESERVED:
+            pattern += char
+            continue
+        quoted = ''.join(f'%{byte:02X}' for byte in char.encode('utf-8'))
+        plus = r'|\+' if char == ' ' else ''
+        pattern += f'(?:{re.escape(char)}|(?i:{quoted}){plus})'
+    return pattern
+
+
 class ResourceSetMock(_ResourceSetBase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -10,10 +33,7 @@ class ResourceSetMock(_ResourceSetBase):
         self._validate_key(key)
 
         if isinstance(key, int):
-            copy = self._copy()
-            copy._limit = 1
-            copy._offset = key
-            return copy
+            return self._get_page_copy(key // self._limit)
 
         copy = self._copy()
         copy._offset = key.start
@@ -108,8 +128,10 @@ class ResourceSetMock(_ResourceSetBase):
             return
 
         def pages_iterator():
-            for i in range(0, total, self._limit):
-                yield return_value[i : i + self._limit], i
+            for i in range(0, len(return_value), self._limit):
+                yield return_value[i : i + self._limit], self._offset + i
+
+        total += self._offset
 
         for page, offset in pages_iterator():
             url = self._build_full_url(
@@ -188,7 +210,23 @@ class ResourceSetMock(_ResourceSetBase):
         if search:
             params = f'{params}&search={search}'
 
-        return f'{url}{params}'
+        if self._fields:
+            return f'{url}{params}'
+        # values_list adds its fields to the RQL select operator, so the calls
+        # must match with or without them.
+        return self._get_projection_pattern(f'{url}{params}')
+
+    def _get_projection_pattern(self, url):
+        path, _, qs = url.partition('?')
+        if self._select:
+            select = ','.join(self._select)
+            qs = qs[len(f'select({select})&') :]
+            select_pattern = rf'select\({_get_quoted_pattern(select)}(?:,[^)]*)?\)&'
+        else:
+            select_pattern = r'(?:select\([^)]*\)&)?'
+        return re.compile(
+            rf'{_get_quoted_pattern(path)}\?{select_pattern}{_get_quoted_pattern(qs)}$',
+        )
 
     def _copy(self):
         rs = super()._copy()
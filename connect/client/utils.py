@@ -3,8 +3,18 @@
 #
 # Copyright (c) 2025 CloudBlue. All Rights Reserved.
 #
+import functools
+import importlib
 import platform
+import re
 from collections import namedtuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+)
 
 from connect.client.version import get_version
 
@@ -28,6 +38,16 @@ def get_headers(api_key):
     return headers
 
 
+def import_optional(module, feature):
+    """
+    Import an optional dependency required by `feature`.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(f'`{feature}` requires the `{module}` package to be installed.') from None
+
+
 def parse_content_range(value):
     if not value:
         return
@@ -46,5 +66,163 @@ def resolve_attribute(attr, data):
         pass
 
 
+_FIELD_PATH_TOKEN = re.compile(r'([^.\[\]]+)|\*|\[([^=\]]+)=([^\]]*)\]')
+_WILDCARD = object()
+
+
+def _parse_field_path(path):
+    steps = []
+    position = 0
+    while position < len(path):
+        if steps and path[position] == '.':
+            position += 1
+        match = _FIELD_PATH_TOKEN.match(path, position)
+        if not match or (steps and match.group(2) is None and path[position - 1] != '.'):
+            raise ValueError(f'Invalid field path: `{path}`.')
+        if match.group(0) == '*':
+            steps.append(_WILDCARD)
+        elif match.group(2) is not None:
+            steps.append((match.group(2), match.group(3)))
+        else:
+            steps.append(match.group(1))
+        position = match.end()
+    if not steps or path.endswith('.'):
+        raise ValueError(f'Invalid field path: `{path}`.')
+    return steps
+
+
+def _get_keys_extractor(keys):
+    if len(keys) == 1:
+        key = keys[0]
+
+        def extract(data):
+            try:
+                return data[key]
+            except (KeyError, TypeError):
+                return None
+
+        return extract
+
+    def extract(data):
+        try:
+            for key in keys:
+                data = data[key]
+            return data
+        except (KeyError, TypeError):
+            return None
+
+    return extract
+
+
+def _split_keys(steps):
+    """
+    Returns the leading dictionary keys of `steps` and the remaining steps.
+    """
+    for idx, step in enumerate(steps):
+        if not isinstance(step, str):
+            return steps[:idx], steps[idx:]
+    return steps, []
+
+
+def _compile_steps(steps):
+    keys, steps = _split_keys(steps)
+    if not steps:
+        return _get_keys_extractor(keys)
+
+    step, steps = steps[0], steps[1:]
+    get_parent = _get_keys_extractor(keys) if keys else lambda data: data
+    extract_rest = _compile_steps(steps) if steps else lambda data: data
+
+    if step is _WILDCARD:
+
+        def extract(data):
+            data = get_parent(data)
+            if not isinstance(data, list):
+                return None
+            return [extract_rest(item) for item in data]
+
+        return extract
+
+    attr, value = step
+
+    def extract(data):
+        data = get_parent(data)
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict) and str(item.get(attr)) == value:
+                    return extract_rest(item)
+
+    return extract
+
+
+class FieldPath:
+    """
+    A field path compiled once to extract the value of a field from many resources.
+
+    Nested fields are specified using dot notation. Lists can be traversed with
+    the `*` wildcard (i.e. `items.*.id` returns the list of the ids of the items) or
+    filtered by the value of an attribute of their elements (i.e. `params[id=x].value`
+    returns the value of the first parameter whose id is `x`).
+
+    Attributes:
+        path (str): The field path.
+        projection (str): The part of the path before the first list traversal,
+            that can be used with the RQL `select` operator.
+    """
+
+    __slots__ = ('path', 'projection', 'extract')
+
+    def __init__(self, path: str):
+        steps = _parse_field_path(path)
+        keys, _ = _split_keys(steps)
+        self.path = path
+        self.projection = '.'.join(keys) or None
+        self.extract = _compile_steps(steps)
+
+    def __call__(self, data: Any) -> Any:
+        return self.extract(data)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_field_path(path: str) -> FieldPath:
+    """
+    Returns the compiled `FieldPath` for `path`.
+    """
+    return FieldPath(path)
+
+
+def compile_values(fields: Iterable[str]) -> Callable[[Dict], Dict]:
+    """
+    Returns a function that extracts `fields` from a resource into a flat dictionary.
+    """
+    field_paths = [compile_field_path(field) for field in fields]
+    if all(field_path.projection == field_path.path for field_path in field_paths) and not any(
+        '.' in field for field in fields
+    ):
+        fields = tuple(fields)
+
+        def get_values(item):
+            if isinstance(item, dict):
+                return {field: item.get(field) for field in fields}
+            return dict.fromkeys(fields)
+
+        return get_values
+
+    extractors = tuple((field_path.path, field_path.extract) for field_path in field_paths)
+
+    def get_values(item):
+        return {field: extract(item) for field, extract in extractors}
+
+    return get_values
+
+
+def get_projection(fields: Iterable[str]) -> List[str]:
+    """
+    Returns the fields to pass to the RQL `select` operator to fetch `fields`.
+    """
+    projections = (compile_field_path(field).projection for field in fields)
+    return list(dict.fromkeys(projection for projection in projections if projection))
+
+
 def get_values(item, fields):
-    return {field: resolve_attribute(field, item) for field in fields}
+    return compile_values(fields)(item)
@@ -1,11 +1,24 @@
 import asyncio
 import io
+import threading
+import time
 
+import httpx
 import pytest
-
-from connect.client import AsyncConnectClient, ClientError
+import responses
+
+from connect.client import (
+    AsyncConnectClient,
+    ClientError,
+    ConnectClient,
+    ResponseCache,
+    SQLiteCache,
+)
+from connect.client.cache import CacheEntry, get_cache_key
+from connect.client.fluent import _get_async_mounts
 from connect.client.logger import RequestLogger
 from connect.client.models import AsyncCollection, AsyncNS
+from connect.client.retry import RetryPolicy
 
 
 @pytest.mark.asyncio
@@ -236,6 +249,328 @@ async def test_execute_max_retries_exceeded(httpx_mock):
         await c.execute('get', 'resources')
 
 
+@pytest.mark.asyncio
+async def test_execute_retry_policy_does_not_block(httpx_mock, mocker):
+    blocking_sleep = mocker.patch('connect.client.mixins.time.sleep')
+    sleep = mocker.patch('connect.client.mixins.asyncio.sleep')
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources',
+        status_code=502,
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources',
+        status_code=502,
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources',
+        status_code=200,
+        json=[],
+    )
+
+    c = AsyncConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        retry_policy=RetryPolicy(backoff_factor=0.25, jitter=False),
+    )
+
+    assert await c.execute('get', 'resources') == []
+    assert [call.args[0] for call in sleep.call_args_list] == [0.25, 0.5]
+    blocking_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_retry_policy_max_retry_time(httpx_mock, mocker):
+    sleep = mocker.patch('connect.client.mixins.asyncio.sleep')
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources',
+        status_code=502,
+    )
+
+    c = AsyncConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        retry_policy=RetryPolicy(jitter=False, max_retry_time=0.5),
+    )
+
+    with pytest.raises(ClientError) as cv:
+        await c.execute('get', 'resources')
+
+    assert cv.value.status_code == 502
+    sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_retry_after(httpx_mock, mocker):
+    sleep = mocker.patch('connect.client.mixins.asyncio.sleep')
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources',
+        status_code=503,
+        headers={'Retry-After': '2'},
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources',
+        status_code=200,
+        json=[],
+    )
+
+    c = AsyncConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        retry_policy=RetryPolicy(backoff_factor=0.5, jitter=False),
+    )
+
+    assert await c.execute('get', 'resources') == []
+    assert sleep.call_args_list[0].args[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_conditional_get(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources?limit=10&offset=0',
+        json=[{'id': 1}],
+        headers={'ETag': '"v1"', 'Content-Range': 'items 0-0/1'},
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources?limit=10&offset=0',
+        status_code=304,
+        match_headers={'If-None-Match': '"v1"'},
+    )
+
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache())
+
+    assert await c.get('resources', params={'limit': 10, 'offset': 0}) == [{'id': 1}]
+    assert await c.get('resources', params={'limit': 10, 'offset': 0}) == [{'id': 1}]
+    assert c.response.status_code == 200
+    assert c.response.headers['Content-Range'] == 'items 0-0/1'
+    assert c.response.json() == [{'id': 1}]
+
+
+@pytest.mark.asyncio
+async def test_execute_cache_ttl_and_invalidation(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources/RES-1',
+        json={'id': 1, 'name': 'old'},
+    )
+    httpx_mock.add_response(
+        method='POST',
+        url='https://localhost/resources/RES-1/rename',
+        json={'id': 1, 'name': 'new'},
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources/RES-1',
+        json={'id': 1, 'name': 'new'},
+    )
+
+    c = AsyncConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        cache=ResponseCache(ttls={'resources': 60}),
+    )
+
+    assert (await c.resources['RES-1'].get())['name'] == 'old'
+    assert (await c.resources['RES-1'].get())['name'] == 'old'
+    assert c.response.json() == {'id': 1, 'name': 'old'}
+    await c.resources['RES-1'].action('rename').post()
+    assert (await c.resources['RES-1'].get())['name'] == 'new'
+    assert len(httpx_mock.get_requests()) == 3
+    assert c.cache.stats['hits'] == 1
+    assert c.cache.stats['invalidations'] == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_sqlite_cache_shared_with_sync_client(httpx_mock, mocked_responses, tmp_path):
+    filename = str(tmp_path / 'cache.db')
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources/RES-1',
+        json={'id': 1},
+    )
+
+    sync_client = ConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        cache=SQLiteCache(filename, ttl=60),
+    )
+    c = AsyncConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        cache=SQLiteCache(filename, ttl=60),
+    )
+
+    assert sync_client.resources['RES-1'].get() == {'id': 1}
+    assert await c.resources['RES-1'].get() == {'id': 1}
+    assert c.cache.stats['hits'] == 1
+    assert httpx_mock.get_requests() == []
+
+
+@pytest.mark.asyncio
+async def test_execute_sqlite_cache_does_not_block(httpx_mock, mocker, tmp_path):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources',
+        json=[{'id': 1}],
+        headers={'ETag': '"v1"'},
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources',
+        status_code=304,
+        match_headers={'If-None-Match': '"v1"'},
+    )
+    httpx_mock.add_response(
+        method='POST',
+        url='https://localhost/resources',
+        json={'id': 2},
+    )
+    cache = SQLiteCache(str(tmp_path / 'cache.db'))
+    threads = set()
+
+    def record_thread(method):
+        def wrapper(*args):
+            threads.add(threading.get_ident())
+            return method(*args)
+
+        return wrapper
+
+    for name in ('get', 'set', 'invalidate'):
+        mocker.patch.object(cache, name, record_thread(getattr(cache, name)))
+
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost', cache=cache)
+
+    assert await c.get('resources') == [{'id': 1}]
+    assert await c.get('resources') == [{'id': 1}]
+    assert c.response.status_code == 200
+    assert await c.create('resources', payload={}) == {'id': 2}
+    assert len(cache) == 0
+    assert threads and threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_execute_cache_stale_while_revalidate(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/products/PRD-000',
+        json={'id': 'PRD-000', 'version': 2},
+        headers={'ETag': '"v2"'},
+        match_headers={'If-None-Match': '"v1"'},
+    )
+
+    cache = ResponseCache(ttl=60, stale_while_revalidate={'products': 60})
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost', cache=cache)
+    cache.set(
+        get_cache_key(
+            'https://localhost/products/PRD-000',
+            {'headers': {'Authorization': 'API_KEY'}},
+        ),
+        CacheEntry(
+            'products/PRD-000',
+            {'id': 'PRD-000', 'version': 1},
+            b'{}',
+            {'ETag': '"v1"'},
+            stored_at=time.time() - 90,
+        ),
+    )
+
+    assert await c.products['PRD-000'].get() == {'id': 'PRD-000', 'version': 1}
+    assert await c.products['PRD-000'].get() == {'id': 'PRD-000', 'version': 1}
+    assert len(c._refresh_tasks) == 1
+    await asyncio.gather(*c._refresh_tasks)
+    assert await c.products['PRD-000'].get() == {'id': 'PRD-000', 'version': 2}
+    assert cache.stats['stale'] == 2
+    assert cache.stats['hits'] == 1
+    assert not cache._refreshing
+
+
+@pytest.mark.asyncio
+async def test_aclose_cancels_cache_refresh(httpx_mock):
+    cache = ResponseCache(stale_while_revalidate={'products': 60})
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost', cache=cache)
+    cache.set(
+        get_cache_key(
+            'https://localhost/products/PRD-000',
+            {'headers': {'Authorization': 'API_KEY'}},
+        ),
+        CacheEntry('products/PRD-000', {'id': 'PRD-000'}, b'{}', {}),
+    )
+
+    await c.products['PRD-000'].get()
+    await c.aclose()
+
+    assert not c._refresh_tasks
+    assert not cache._refreshing
+
+
+@pytest.mark.asyncio
+async def test_execute_coalesce_requests(httpx_mock):
+    async def callback(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=[{'id': 1}])
+
+    httpx_mock.add_callback(callback, method='GET', url='https://localhost/resources')
+
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost', coalesce_requests=True)
+
+    async def get():
+        result = await c.get('resources')
+        return result, c.response.status_code
+
+    results = await asyncio.gather(*[get() for _ in range(10)])
+
+    assert results == [([{'id': 1}], 200)] * 10
+    assert len(httpx_mock.get_requests()) == 1
+    assert c.coalesced_calls == 9
+
+
+@pytest.mark.asyncio
+async def test_execute_coalesce_requests_leader_cancelled(httpx_mock):
+    async def callback(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=[])
+
+    httpx_mock.add_callback(
+        callback,
+        method='GET',
+        url='https://localhost/resources',
+        is_reusable=True,
+    )
+
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost', coalesce_requests=True)
+
+    leader = asyncio.create_task(c.get('resources'))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(c.get('resources'))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == []
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_json_codec(httpx_mock):
+    httpx_mock.add_response(
+        method='PUT',
+        url='https://localhost/resources/RES-1',
+        json={'id': 1},
+        match_json={'name': 'test'},
+        match_headers={'Content-Type': 'application/json'},
+    )
+
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost', json_codec='json')
+
+    assert await c.resources['RES-1'].update({'name': 'test'}) == {'id': 1}
+
+
 @pytest.mark.asyncio
 async def test_execute_default_headers(httpx_mock):
     httpx_mock.add_response(
@@ -486,6 +821,156 @@ async def test_concurrency(httpx_mock):
 
     assert res1 != res2
     assert resp1.json() != resp2.json()
-    assert ses1 != ses2
-    assert ses1._transport == ses2._transport
+    assert ses1 is ses2
     assert c.response is None
+
+
+@pytest.mark.asyncio
+async def test_session_shared_by_tasks(httpx_mock):
+    httpx_mock.add_response(method='GET', json={}, is_reusable=True)
+
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    async def io_func(idx):
+        await c.resources[str(idx)].get()
+        return c.session
+
+    sessions = await asyncio.gather(*[io_func(idx) for idx in range(50)])
+
+    assert len({id(session) for session in sessions}) == 1
+    assert len(c._sessions) == 1
+
+
+def test_session_per_event_loop():
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    async def get_session():
+        session = c.session
+        await c.aclose()
+        return session
+
+    ses1 = asyncio.run(get_session())
+    ses2 = asyncio.run(get_session())
+
+    assert ses1 is not ses2
+    assert ses1.is_closed and ses2.is_closed
+
+
+@pytest.mark.asyncio
+async def test_aclose():
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+    session = c.session
+
+    await c.aclose()
+
+    assert session.is_closed
+    assert c.session is not session
+    assert not c.session.is_closed
+
+    await c.aclose()
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager(httpx_mock):
+    httpx_mock.add_response(method='GET', json={'id': 'PRD-000'})
+
+    async with AsyncConnectClient('API_KEY', endpoint='https://localhost') as c:
+        assert await c.products['PRD-000'].get() == {'id': 'PRD-000'}
+        session = c.session
+
+    assert session.is_closed
+    assert not c._sessions
+
+
+@pytest.mark.asyncio
+async def test_http2_transport():
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost', http2=True)
+
+    assert c.session._transport.transport._pool._http2 is True
+    assert (
+        AsyncConnectClient(
+            'API_KEY',
+            endpoint='https://localhost',
+        ).session._transport.transport._pool._http2
+        is False
+    )
+
+
+@pytest.mark.asyncio
+async def test_http2_proxy_mounts(mocker):
+    mocker.patch(
+        'connect.client.fluent.getproxies',
+        return_value={'https': 'http://proxy.example.org:8080'},
+    )
+    loop = asyncio.get_running_loop()
+    http1_mounts = _get_async_mounts(loop)
+    http2_mounts = _get_async_mounts(loop, True)
+
+    assert http1_mounts['https://'].transport._pool._http2 is False
+    assert http2_mounts['https://'].transport._pool._http2 is True
+
+
+@pytest.mark.asyncio
+async def test_transport_shared_by_clients(httpx_mock):
+    httpx_mock.add_response(method='GET', json={}, is_reusable=True)
+    clients = [AsyncConnectClient('API_KEY', endpoint='https://localhost') for _ in range(3)]
+    other = AsyncConnectClient('API_KEY', endpoint='https://other')
+
+    for c in clients:
+        await c.resources['RES-1'].get()
+    transports = {c.session._transport.transport for c in clients}
+
+    assert len(transports) == 1
+    assert other.session._transport.transport not in transports
+
+    transport = transports.pop()
+    close = []
+    original_aclose = transport.aclose
+
+    async def aclose():
+        close.append(True)
+        await original_aclose()
+
+    transport.aclose = aclose
+    await clients[0].aclose()
+    await clients[1].aclose()
+
+    assert not clients[0]._sessions
+    assert not close
+    assert await clients[2].resources['RES-1'].get() == {}
+
+    await clients[2].aclose()
+
+    assert close == [True]
+    new_client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+    assert new_client.session._transport.transport is not transport
+    await new_client.aclose()
+    await other.aclose()
+
+
+def test_invalid_max_concurrent_streams():
+    with pytest.raises(ValueError):
+        AsyncConnectClient('API_KEY', max_concurrent_streams=0)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_streams(httpx_mock):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    httpx_mock.add_callback(handler, is_reusable=True)
+
+    c = AsyncConnectClient('API_KEY', endpoint='https://localhost', max_concurrent_streams=3)
+
+    await asyncio.gather(*[c.resources[str(idx)].get() for idx in range(20)])
+
+    assert max_in_flight == 3
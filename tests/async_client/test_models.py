@@ -1,5 +1,11 @@
+import asyncio
+import gzip
+import sys
+
+import httpx
 import pytest
 
+from connect.client import AsyncConnectClient
 from connect.client.exceptions import ClientError
 from connect.client.models import (
     AsyncAction,
@@ -216,6 +222,73 @@ async def test_collection_bulk_create(async_client_mock, async_col_factory):
     )
 
 
+@pytest.mark.asyncio
+async def test_collection_bulk_create_chunks(async_client_mock, async_col_factory):
+    client = async_client_mock(methods=['create'])
+    collection = async_col_factory(client=client, path='resource')
+    payload = [{'name': f'test {idx}'} for idx in range(5)]
+    error = ClientError(status_code=400, error_code='VAL_001', errors=['Invalid.'])
+
+    async def create(path, payload=None, **kwargs):
+        if payload[0]['name'] == 'test 2':
+            raise error
+        return [dict(item, id=item['name']) for item in payload]
+
+    client.create.side_effect = create
+
+    result = await collection.bulk_create(payload, chunk_size=2, concurrency=2)
+
+    assert client.create.await_count == 3
+    assert result.ok is False
+    assert result.succeeded == payload[:2] + payload[4:]
+    assert result.failed == payload[2:4]
+    assert result.results == [dict(item, id=item['name']) for item in result.succeeded]
+    assert result.errors == [(payload[2:4], error)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('method', ('update', 'delete'))
+async def test_collection_bulk_update_delete_chunks(async_client_mock, async_col_factory, method):
+    client = async_client_mock(methods=[method])
+    collection = async_col_factory(client=client, path='resource')
+    getattr(client, method).return_value = None
+
+    result = await getattr(collection, f'bulk_{method}')(
+        [{'id': 1}, {'id': 2}, {'id': 3}],
+        chunk_size=2,
+    )
+
+    assert result.ok is True
+    assert result.succeeded == [{'id': 1}, {'id': 2}, {'id': 3}]
+    assert getattr(client, method).await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_collection_bulk_action(httpx_mock):
+    for request_id, status in (('PR-1', 200), ('PR-2', 400)):
+        httpx_mock.add_response(
+            method='POST',
+            url=f'https://localhost/requests/{request_id}/approve',
+            status_code=status,
+            json={'id': request_id} if status == 200 else {'error_code': 'REQ_003'},
+            match_json={'template_id': 'TL-1'},
+        )
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+    progress = []
+
+    results = await client.requests.bulk_action(
+        'approve',
+        ['PR-1', 'PR-2'],
+        payload_fn=lambda item: {'template_id': 'TL-1'},
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert results['PR-1'] == {'id': 'PR-1'}
+    assert results.succeeded == ['PR-1']
+    assert results.failed['PR-2'].status_code == 400
+    assert progress == [(1, 2), (2, 2)]
+
+
 @pytest.mark.asyncio
 async def test_collection_bulk_create_invalid_type(async_client_mock, async_col_factory):
     client = async_client_mock(methods=['create'])
@@ -273,6 +346,34 @@ async def test_collection_bulk_delete_invalid_type(async_client_mock, async_col_
     assert str(excinfo.value) == '`payload` must be a list or tuple.'
 
 
+@pytest.mark.asyncio
+async def test_collection_get_many(httpx_mock):
+    for query, ids in (('in(id,(A,B))&limit=2', ['A', 'B']), ('in(id,(C,D))&limit=2', ['C'])):
+        httpx_mock.add_response(
+            method='GET',
+            url=f'https://localhost/resources?{query}&offset=0',
+            json=[{'id': id_} for id_ in ids],
+            headers={'Content-Range': f'items 0-{len(ids) - 1}/{len(ids)}'},
+        )
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    result = await client.resources.get_many(['A', 'B', 'C', 'A', 'D'], chunk_size=2)
+
+    assert result == {'A': {'id': 'A'}, 'B': {'id': 'B'}, 'C': {'id': 'C'}}
+    assert list(result) == ['A', 'B', 'C']
+    assert result.missing == ['D']
+
+
+@pytest.mark.asyncio
+async def test_collection_get_many_invalid(async_col_factory):
+    collection = async_col_factory(path='resource')
+
+    with pytest.raises(ValueError) as excinfo:
+        await collection.get_many(['A'], concurrency=0)
+
+    assert str(excinfo.value) == '`concurrency` must be a positive, non-zero integer.'
+
+
 def test_collection_filter(async_col_factory):
     collection = async_col_factory(path='resource')
 
@@ -537,8 +638,7 @@ async def test_resource_values(async_mocker, async_client_mock, async_res_factor
     resource = async_res_factory(
         client=async_client_mock(methods=['get']),
     )
-    resource.get = async_mocker.AsyncMock()
-    resource.get.return_value = {
+    resource._client.get.return_value = {
         'id': 'ID',
         'not_choosen': 'value',
         'sub_object': {
@@ -547,12 +647,34 @@ async def test_resource_values(async_mocker, async_client_mock, async_res_factor
     }
 
     result = await resource.values('id', 'sub_object.name')
+    resource._client.get.assert_awaited_once_with('{item_id}?select(id,sub_object.name)')
     assert isinstance(result, dict)
     assert 'not_choosen' not in result
     assert 'id' in result and result['id'] == 'ID'
     assert 'sub_object.name' in result and result['sub_object.name'] == 'ok'
 
 
+@pytest.mark.asyncio
+async def test_resource_values_select_not_supported(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources/RES-1?select(id,events.created.at)',
+        status_code=400,
+        json={'error_code': 'RQL_000', 'errors': ['Invalid select.']},
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources/RES-1',
+        json={'id': 'RES-1', 'events': {'created': {'at': 'now'}}},
+    )
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    assert await client.resources['RES-1'].values('id', 'events.created.at') == {
+        'id': 'RES-1',
+        'events.created.at': 'now',
+    }
+
+
 def test_resource_help(async_res_factory):
     res = async_res_factory()
     res1 = res.help()
@@ -1275,3 +1397,405 @@ async def test_rs_iterate_already_evaluated(mocker, async_client_mock, async_rs_
     rs._client.get.return_value = expected
     assert [item async for item in rs] == expected
     assert [item async for item in rs] == expected
+
+
+def _add_pages(httpx_mock, count, limit, offset=0, stop=None, query=''):
+    while offset < min(count, stop or count):
+        page_limit = min(limit, stop - offset) if stop else limit
+        last = min(offset + page_limit, count) - 1
+        httpx_mock.add_response(
+            method='GET',
+            url=f'https://localhost/resources?{query}limit={page_limit}&offset={offset}',
+            json=[{'id': idx} for idx in range(offset, last + 1)],
+            headers={'Content-Range': f'items {offset}-{last}/{count}'},
+        )
+        offset += page_limit
+
+
+@pytest.mark.asyncio
+async def test_rs_parallel(httpx_mock):
+    _add_pages(httpx_mock, 95, 10)
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).parallel(concurrency=3)
+
+    assert [item async for item in rs] == [{'id': idx} for idx in range(95)]
+    assert len(httpx_mock.get_requests()) == 10
+    assert rs._results == [{'id': idx} for idx in range(95)]
+
+
+@pytest.mark.asyncio
+async def test_rs_parallel_slice_values_list(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources?select(id)&limit=10&offset=5',
+        json=[{'id': idx} for idx in range(5, 15)],
+        headers={'Content-Range': 'items 5-14/100'},
+    )
+    _add_pages(httpx_mock, 100, 10, offset=15, stop=37, query='select(id)&')
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).parallel(concurrency=2).values_list('id')[5:37]
+
+    assert [item async for item in rs] == [{'id': idx} for idx in range(5, 37)]
+
+
+@pytest.mark.asyncio
+async def test_rs_parallel_concurrency(httpx_mock):
+    running = 0
+    max_running = 0
+
+    async def callback(request):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        offset = int(request.url.params['offset'])
+        return httpx.Response(
+            200,
+            json=[{'id': idx} for idx in range(offset, offset + 10)],
+            headers={'Content-Range': f'items {offset}-{offset + 9}/200'},
+        )
+
+    httpx_mock.add_callback(callback, is_reusable=True)
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).parallel(concurrency=3)
+
+    assert [item['id'] async for item in rs] == list(range(200))
+    assert max_running == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_responses_were_requested=False)
+async def test_rs_parallel_aclose(httpx_mock):
+    _add_pages(httpx_mock, 200, 10, stop=60)
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    iterator = client.resources.all().limit(10).parallel(concurrency=2).__aiter__()
+    for _ in range(11):
+        await iterator.__anext__()
+    await iterator.aclose()
+
+    assert len(httpx_mock.get_requests()) <= 6
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'exception', 'message'),
+    (
+        ({'concurrency': None}, TypeError, '`concurrency` must be an integer.'),
+        ({'concurrency': -1}, ValueError, '`concurrency` must be a positive, non-zero integer.'),
+    ),
+)
+def test_rs_parallel_invalid(async_rs_factory, kwargs, exception, message):
+    with pytest.raises(exception) as cv:
+        async_rs_factory().parallel(**kwargs)
+
+    assert str(cv.value) == message
+
+
+@pytest.mark.asyncio
+async def test_rs_prefetch(httpx_mock):
+    _add_pages(httpx_mock, 50, 10)
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    iterator = client.resources.all().limit(10).prefetch(1).__aiter__()
+    assert await iterator.__anext__() == {'id': 0}
+    await asyncio.sleep(0.05)
+    assert len(httpx_mock.get_requests()) == 2
+
+    assert [item['id'] async for item in iterator] == list(range(1, 50))
+    assert len(httpx_mock.get_requests()) == 5
+
+
+def test_rs_prefetch_invalid(async_rs_factory):
+    with pytest.raises(ValueError) as cv:
+        async_rs_factory().prefetch(-1)
+
+    assert str(cv.value) == '`pages` must be a positive, non-zero integer.'
+
+
+def _add_keyset_pages(httpx_mock, ids, limit, field='id', select=''):
+    descending = field.startswith('-')
+    name = field.lstrip('-')
+    for offset in range(0, len(ids), limit):
+        page = ids[offset : offset + limit]
+        query = f'{"lt" if descending else "gt"}({name},{ids[offset - 1]})&' if offset else ''
+        httpx_mock.add_response(
+            method='GET',
+            url=(
+                f'https://localhost/resources?{select}{query}ordering({field})'
+                f'&limit={limit}&offset=0'
+            ),
+            json=[{name: value} for value in page],
+            headers={'Content-Range': f'items 0-{len(page) - 1}/{len(ids) - offset}'},
+        )
+
+
+@pytest.mark.asyncio
+async def test_rs_keyset(httpx_mock):
+    ids = [f'RES-{idx:03d}' for idx in range(25)]
+    _add_keyset_pages(httpx_mock, ids, 10)
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().order_by('name').limit(10).keyset()
+
+    assert [item['id'] async for item in rs] == ids
+    assert len(httpx_mock.get_requests()) == 3
+    assert rs._results == [{'id': value} for value in ids]
+
+
+@pytest.mark.asyncio
+async def test_rs_keyset_descending_values_list(httpx_mock):
+    ids = list(range(24, 0, -1))
+    _add_keyset_pages(httpx_mock, ids, 10, field='-created', select='select(created)&')
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).keyset('-created').values_list('created')
+
+    assert [item['created'] async for item in rs] == ids
+
+
+@pytest.mark.asyncio
+async def test_rs_keyset_slice(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources?ordering(id)&limit=10&offset=0',
+        json=[{'id': idx} for idx in range(10)],
+        headers={'Content-Range': 'items 0-9/30'},
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources?gt(id,9)&ordering(id)&limit=5&offset=0',
+        json=[{'id': idx} for idx in range(10, 15)],
+        headers={'Content-Range': 'items 0-4/20'},
+    )
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).keyset()[0:15]
+
+    assert [item['id'] async for item in rs] == list(range(15))
+
+
+@pytest.mark.parametrize(
+    'factory',
+    (
+        lambda rs: rs.keyset().parallel(),
+        lambda rs: rs.parallel().keyset(),
+    ),
+)
+def test_rs_keyset_parallel(async_rs_factory, factory):
+    with pytest.raises(ValueError) as cv:
+        factory(async_rs_factory())
+
+    assert str(cv.value) == 'Keyset pagination cannot be combined with `parallel` or `prefetch`.'
+
+
+@pytest.mark.asyncio
+async def test_rs_stream(httpx_mock):
+    _add_pages(httpx_mock, 25, 10)
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().stream(chunk_size=10)
+    page_sizes = []
+    async for _ in rs:
+        page_sizes.append(len(rs._results))
+
+    assert page_sizes == [10] * 20 + [5] * 5
+    assert rs._results is None
+
+
+@pytest.mark.asyncio
+async def test_rs_iterator_parallel(httpx_mock):
+    _add_pages(httpx_mock, 30, 10)
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    iterator = client.resources.all().parallel(concurrency=2).iterator(chunk_size=10)
+
+    assert [item['id'] async for item in iterator] == list(range(30))
+    assert iterator._rs._results is None
+
+
+@pytest.mark.asyncio
+async def test_rs_values_list_select_not_supported(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources?select(id)&limit=10&offset=0',
+        status_code=400,
+        json={'error_code': 'RQL_000', 'errors': ['Invalid select.']},
+    )
+    _add_pages(httpx_mock, 15, 10)
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).values_list('id')
+
+    assert [item async for item in rs] == [{'id': idx} for idx in range(15)]
+    assert rs._projection is False
+
+
+@pytest.mark.asyncio
+async def test_rs_first_values_list_select_not_supported(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources?select(-items,id)&limit=1&offset=0',
+        status_code=400,
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources?select(-items)&limit=1&offset=0',
+        json=[{'id': 'RES-1'}],
+    )
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    assert await client.resources.all().select('-items').values_list('id').first() == {
+        'id': 'RES-1',
+    }
+
+
+@pytest.mark.asyncio
+async def test_rs_to_columns(httpx_mock):
+    _add_pages(httpx_mock, 25, 10, query='select(id)&')
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    columns = await client.resources.all().limit(10).to_columns('id')
+
+    assert columns == {'id': list(range(25))}
+
+
+@pytest.mark.asyncio
+async def test_rs_to_pandas(mocker, httpx_mock):
+    pandas = mocker.MagicMock()
+    mocker.patch.dict(sys.modules, {'pandas': pandas})
+    _add_pages(httpx_mock, 5, 10, query='select(id)&')
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    assert await client.resources.all().limit(10).to_pandas('id') == pandas.DataFrame.return_value
+    pandas.DataFrame.assert_called_once_with({'id': list(range(5))})
+
+
+@pytest.mark.asyncio
+async def test_rs_to_arrow_not_installed(mocker, async_rs_factory):
+    mocker.patch.dict(sys.modules, {'pyarrow': None})
+
+    with pytest.raises(ImportError) as cv:
+        await async_rs_factory().to_arrow('id')
+
+    assert str(cv.value) == '`to_arrow` requires the `pyarrow` package to be installed.'
+
+
+@pytest.mark.asyncio
+async def test_rs_export(httpx_mock, tmp_path):
+    _add_pages(httpx_mock, 25, 10, query='select(id,name)&')
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+    path = tmp_path / 'resources.csv.gz'
+    checkpoint = tmp_path / 'resources.checkpoint'
+
+    count = (
+        await client.resources.all()
+        .limit(10)
+        .export(
+            str(path),
+            format='csv',
+            fields=['id', 'name'],
+            compression='gzip',
+            concurrency=2,
+            checkpoint=str(checkpoint),
+        )
+    )
+
+    assert count == 25
+    assert not checkpoint.exists()
+    with gzip.open(path, 'rt') as f:
+        assert f.read().split() == ['id,name', *[f'{idx},' for idx in range(25)]]
+
+
+@pytest.mark.asyncio
+async def test_rs_export_error(httpx_mock, tmp_path):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/resources?limit=100&offset=0',
+        status_code=403,
+    )
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+    checkpoint = tmp_path / 'resources.checkpoint'
+
+    with pytest.raises(ClientError):
+        await client.resources.all().export(
+            str(tmp_path / 'resources.ndjson'),
+            checkpoint=str(checkpoint),
+        )
+
+    assert not checkpoint.exists()
+
+
+@pytest.mark.asyncio
+async def test_rs_aget(httpx_mock):
+    _add_pages(httpx_mock, 15, 10)
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10)
+
+    assert [await rs.aget(idx) for idx in (0, 9, 10, 14, 15, 1)] == [
+        {'id': 0},
+        {'id': 9},
+        {'id': 10},
+        {'id': 14},
+        None,
+        {'id': 1},
+    ]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_rs_aget_evaluated(async_rs_factory):
+    rs = async_rs_factory()
+    rs._results = [{'id': 0}]
+
+    assert await rs.aget(0) == {'id': 0}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('index', 'exception', 'message'),
+    (
+        ('0', TypeError, 'ResourceSet indices must be integers.'),
+        (slice(0, 1), TypeError, 'ResourceSet indices must be integers.'),
+        (-1, ValueError, 'Negative indexing is not supported.'),
+    ),
+)
+async def test_rs_aget_invalid(async_rs_factory, index, exception, message):
+    with pytest.raises(exception) as cv:
+        await async_rs_factory().aget(index)
+
+    assert str(cv.value) == message
+
+
+@pytest.mark.asyncio
+async def test_rs_prefetch_related(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/subscriptions/assets?limit=100&offset=0',
+        json=[
+            {'id': 'AS-1', 'connection': {'id': 'CT-1'}},
+            {'id': 'AS-2', 'connection': {'id': 'CT-2'}},
+            {'id': 'AS-3', 'connection': {'id': 'CT-1'}},
+        ],
+        headers={'Content-Range': 'items 0-2/3'},
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/connections?in(id,(CT-1,CT-2))&limit=2&offset=0',
+        json=[{'id': 'CT-1', 'type': 'test'}, {'id': 'CT-2', 'type': 'production'}],
+        headers={'Content-Range': 'items 0-1/2'},
+    )
+    client = AsyncConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client('subscriptions').assets.all().prefetch_related('connection', 'connections')
+
+    assert [item['connection'] async for item in rs] == [
+        {'id': 'CT-1', 'type': 'test'},
+        {'id': 'CT-2', 'type': 'production'},
+        {'id': 'CT-1', 'type': 'test'},
+    ]
+    assert rs.content_range == ContentRange(0, 2, 3)
@@ -426,3 +426,48 @@ async def test_exclude(mocker, exclude):
 
 def test_get_httpx_mocker():
     assert get_httpx_mocker() == _async_mocker
+
+
+@pytest.mark.asyncio
+async def test_resource_values_fields():
+    with AsyncConnectClientMocker('http://localhost') as mocker:
+        mocker.products['product_id'].values(
+            'id',
+            'name',
+            return_value={'id': 'PRD-000', 'name': 'my_product'},
+        )
+        client = AsyncConnectClient('api_key', endpoint='http://localhost')
+        assert await client.products['product_id'].values('id', 'name') == {
+            'id': 'PRD-000',
+            'name': 'my_product',
+        }
+
+
+@pytest.mark.asyncio
+async def test_values_list_all_mock():
+    return_value = [{'id': f'PRD-{idx}', 'name': f'Product {idx}'} for idx in range(3)]
+
+    with AsyncConnectClientMocker('http://localhost') as mocker:
+        mocker.products.all().mock(return_value=return_value)
+
+        client = AsyncConnectClient('api_key', endpoint='http://localhost')
+
+        assert [item async for item in client.products.all().values_list('id')] == [
+            {'id': f'PRD-{idx}'} for idx in range(3)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_all_mock_quoted_query():
+    return_value = [{'id': 'PRD-0', 'name': "Big 'product' é"}]
+
+    with AsyncConnectClientMocker('http://localhost') as mocker:
+        mocker.products.filter(R().name.eq("Big 'product' é")).mock(return_value=return_value)
+        mocker.products.all().search('big product').mock(return_value=return_value)
+
+        client = AsyncConnectClient('api_key', endpoint='http://localhost')
+
+        assert [
+            item async for item in client.products.filter(R().name.eq("Big 'product' é"))
+        ] == return_value
+        assert [item async for item in client.products.all().search('big product')] == return_value
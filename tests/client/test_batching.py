@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from connect.client import AsyncConnectClient, ClientError, GetBatcher
+
+
+def _get_client(**kwargs):
+    return AsyncConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        get_batcher=GetBatcher(**kwargs),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_batcher_batches_gets(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/products?in(id,(PRD-1,PRD-2,PRD-3))&limit=3&offset=0',
+        json=[{'id': 'PRD-2'}, {'id': 'PRD-1'}],
+        headers={'Content-Range': 'items 0-1/2'},
+    )
+    client = _get_client()
+
+    results = await asyncio.gather(
+        client.products['PRD-1'].get(),
+        client.products['PRD-2'].get(),
+        client.products['PRD-1'].get(),
+        client.products['PRD-3'].get(),
+        return_exceptions=True,
+    )
+
+    assert results[:3] == [{'id': 'PRD-1'}, {'id': 'PRD-2'}, {'id': 'PRD-1'}]
+    assert results[0] is not results[2]
+    assert isinstance(results[3], ClientError)
+    assert results[3].status_code == 404
+    assert str(results[3]) == 'The resource `products/PRD-3` does not exist.'
+    assert client.get_batcher.batched == 3
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_batcher_max_size(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/products?in(id,(PRD-1,PRD-2))&limit=2&offset=0',
+        json=[{'id': 'PRD-1'}, {'id': 'PRD-2'}],
+        headers={'Content-Range': 'items 0-1/2'},
+    )
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/products/PRD-3',
+        json={'id': 'PRD-3'},
+        is_reusable=True,
+    )
+    client = _get_client(window=0.05, max_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            client.products['PRD-1'].get(),
+            client.products['PRD-2'].get(),
+            client.products['PRD-3'].get(),
+            client.products['PRD-3'].get(),
+            client.products['PRD-3'].get(headers={'X-Custom': 'value'}),
+        ),
+        timeout=1,
+    )
+
+    assert results == [{'id': 'PRD-1'}, {'id': 'PRD-2'}] + [{'id': 'PRD-3'}] * 3
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_batcher_single_get(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/products/PRD-1',
+        json={'id': 'PRD-1'},
+    )
+    client = _get_client()
+
+    assert await client.products['PRD-1'].get() == {'id': 'PRD-1'}
+    assert client.get_batcher.batched == 0
+
+
+@pytest.mark.asyncio
+async def test_get_batcher_fallback(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/products/PRD-1/items?in(id,(ITM-1,ITM-2))&limit=2&offset=0',
+        status_code=400,
+        json={'error_code': 'VAL_001', 'errors': ['Invalid filter.']},
+    )
+    for item_id in ('ITM-1', 'ITM-2'):
+        httpx_mock.add_response(
+            method='GET',
+            url=f'https://localhost/products/PRD-1/items/{item_id}',
+            json={'id': item_id},
+        )
+    client = _get_client()
+
+    results = await asyncio.gather(
+        client.products['PRD-1'].items['ITM-1'].get(),
+        client.products['PRD-1'].items['ITM-2'].get(),
+    )
+
+    assert results == [{'id': 'ITM-1'}, {'id': 'ITM-2'}]
+
+
+@pytest.mark.asyncio
+async def test_get_batcher_error(httpx_mock):
+    httpx_mock.add_response(
+        method='GET',
+        url='https://localhost/products?in(id,(PRD-1,PRD-2))&limit=2&offset=0',
+        status_code=500,
+        json={'error_code': 'SYS_001', 'errors': ['Internal error.']},
+    )
+    client = AsyncConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        max_retries=0,
+        get_batcher=GetBatcher(),
+    )
+
+    results = await asyncio.gather(
+        client.products['PRD-1'].get(),
+        client.products['PRD-2'].get(),
+        return_exceptions=True,
+    )
+
+    assert results[0] is results[1]
+    assert results[0].status_code == 500
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'message'),
+    (
+        ({'window': -1}, '`window` must be a positive number.'),
+        ({'max_size': 0}, '`max_size` must be a positive, non-zero integer.'),
+    ),
+)
+def test_get_batcher_invalid(kwargs, message):
+    with pytest.raises(ValueError) as excinfo:
+        GetBatcher(**kwargs)
+
+    assert str(excinfo.value) == message
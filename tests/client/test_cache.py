@@ -0,0 +1,409 @@
+import pytest
+
+from connect.client.cache import (
+    BaseCache,
+    CacheEntry,
+    ResponseCache,
+    SQLiteCache,
+    get_cache_key,
+)
+
+
+def test_get_cache_key():
+    key1 = get_cache_key(
+        'https://localhost/products',
+        {'params': {'offset': 0, 'limit': 10}, 'headers': {'Authorization': 'key1'}},
+    )
+    key2 = get_cache_key(
+        'https://localhost/products',
+        {'params': {'limit': 10, 'offset': 0}, 'headers': {'Authorization': 'key1'}},
+    )
+    key3 = get_cache_key(
+        'https://localhost/products',
+        {'params': {'limit': 10, 'offset': 0}, 'headers': {'Authorization': 'key2'}},
+    )
+
+    assert key1 == key2
+    assert key1 != key3
+    assert key1.endswith(':https://localhost/products?limit=10&offset=0')
+    assert 'key1' not in key1
+
+
+def test_get_cache_key_with_query():
+    key = get_cache_key(
+        'https://localhost/products?eq(status,published)',
+        {'params': {'limit': 10}, 'headers': {}},
+    )
+
+    assert key.endswith(':https://localhost/products?eq(status,published)&limit=10')
+
+
+def test_get_cache_key_no_params():
+    key = get_cache_key('https://localhost/products/PRD-000', {'headers': {}})
+
+    assert key.endswith(':https://localhost/products/PRD-000')
+
+
+def test_cache_entry_conditional_headers():
+    entry = CacheEntry(
+        'products',
+        [],
+        b'[]',
+        {'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'},
+    )
+
+    assert entry.get_conditional_headers() == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT',
+    }
+    assert CacheEntry('products', [], b'[]', {}).get_conditional_headers() == {}
+
+
+def test_cache_entry_get_body_is_a_copy():
+    entry = CacheEntry('products', [{'id': 'PRD-000'}], b'', {})
+
+    body = entry.get_body()
+    body.append({'id': 'PRD-001'})
+
+    assert entry.body == [{'id': 'PRD-000'}]
+
+
+def test_cache_entry_revalidated():
+    entry = CacheEntry(
+        'products',
+        {'id': 'PRD-000'},
+        b'{}',
+        {'ETag': '"v1"', 'Content-Type': 'application/json'},
+        stored_at=1,
+    )
+
+    revalidated = entry.revalidated({'ETag': '"v2"'})
+
+    assert revalidated.etag == '"v2"'
+    assert revalidated.headers['Content-Type'] == 'application/json'
+    assert revalidated.body is entry.body
+    assert revalidated.stored_at > 1
+    assert entry.etag == '"v1"'
+
+
+def test_cache_entry_from_response(mocker):
+    response = mocker.MagicMock()
+    response.headers = {
+        'Content-Type': 'application/json',
+        'ETag': '"v1"',
+        'Set-Cookie': 'value',
+    }
+    response.content = b'{}'
+
+    entry = CacheEntry.from_response('products/PRD-000?select(items)', {}, response)
+
+    assert entry.path == 'products/PRD-000'
+    assert entry.headers == {'Content-Type': 'application/json', 'ETag': '"v1"'}
+    assert entry.size == 2
+
+
+@pytest.mark.parametrize(
+    ('headers', 'expected'),
+    (
+        ({}, False),
+        ({'ETag': '"v1"'}, True),
+        ({'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}, True),
+    ),
+)
+def test_should_store(headers, expected):
+    assert ResponseCache().should_store(CacheEntry('products', {}, b'{}', headers)) is expected
+
+
+def test_response_cache():
+    cache = ResponseCache()
+    entry = CacheEntry('products', {}, b'{}', {'ETag': '"v1"'})
+
+    cache.set('key', entry)
+    assert cache.get('key') is entry
+    assert len(cache) == 1
+
+    cache.delete('key')
+    cache.delete('key')
+    assert cache.get('key') is None
+
+    cache.set('key', entry)
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize(
+    ('method', 'args'),
+    (
+        ('get', ('key',)),
+        ('set', ('key', None)),
+        ('delete', ('key',)),
+        ('invalidate', ('products',)),
+        ('clear', ()),
+    ),
+)
+def test_base_cache_not_implemented(method, args):
+    with pytest.raises(NotImplementedError):
+        getattr(BaseCache(), method)(*args)
+
+
+def test_should_store_with_ttl():
+    cache = ResponseCache(ttls={'products': 60})
+
+    assert cache.should_store(CacheEntry('products/PRD-000', {}, b'{}', {})) is True
+    assert cache.should_store(CacheEntry('marketplaces', {}, b'{}', {})) is False
+
+
+def test_get_ttl():
+    cache = ResponseCache(
+        ttl=10,
+        ttls={'products': 60, 'products/PRD-000/items': 0, '/marketplaces/': 3600},
+    )
+
+    assert cache.get_ttl('products') == 60
+    assert cache.get_ttl('products/PRD-000?limit=10') == 60
+    assert cache.get_ttl('products/PRD-000/items') == 0
+    assert cache.get_ttl('products/PRD-000/items/PRD-000-0001') == 0
+    assert cache.get_ttl('marketplaces/MP-000') == 3600
+    assert cache.get_ttl('products-legacy') == 10
+    assert cache.get_ttl('accounts') == 10
+
+
+def test_is_fresh(mocker):
+    mocker.patch('connect.client.cache.time.time', return_value=1000)
+    cache = ResponseCache(ttl=30)
+
+    assert cache.is_fresh(CacheEntry('products', {}, b'{}', {}, stored_at=980)) is True
+    assert cache.is_fresh(CacheEntry('products', {}, b'{}', {}, stored_at=960)) is False
+
+
+def test_stale_while_revalidate(mocker):
+    mocker.patch('connect.client.cache.time.time', return_value=1000)
+    cache = ResponseCache(ttl=30, stale_while_revalidate={'products': 60})
+    product = CacheEntry('products/PRD-000', {}, b'{}', {}, stored_at=950)
+    marketplace = CacheEntry('marketplaces/MP-000', {}, b'{}', {}, stored_at=950)
+
+    assert cache.get_max_staleness('products/PRD-000') == 60
+    assert cache.get_max_staleness('marketplaces') == 0
+    assert cache.get_lifetime('products') == 90
+    assert cache.is_fresh(product) is False
+    assert cache.can_serve_stale(product) is True
+    assert cache.can_serve_stale(marketplace) is False
+    assert cache.can_serve_stale(CacheEntry('products', {}, b'{}', {}, stored_at=900)) is False
+
+
+def test_should_store_with_stale_while_revalidate():
+    cache = ResponseCache(stale_while_revalidate={'products': 60})
+
+    assert cache.should_store(CacheEntry('products', {}, b'{}', {})) is True
+    assert cache.should_store(CacheEntry('marketplaces', {}, b'{}', {})) is False
+
+
+def test_begin_refresh():
+    cache = ResponseCache()
+
+    assert cache.begin_refresh('key') is True
+    assert cache.begin_refresh('key') is False
+    cache.end_refresh('key')
+    assert cache.begin_refresh('key') is True
+
+
+def test_lookup_stats():
+    cache = ResponseCache(ttl=30)
+    cache.set('fresh', CacheEntry('products', {}, b'{}', {}))
+    cache.set('stale', CacheEntry('products', {}, b'{}', {'ETag': '"v1"'}, stored_at=1))
+
+    assert cache.lookup('missing') is None
+    assert cache.lookup('fresh') is not None
+    assert cache.lookup('stale') is not None
+    cache.revalidate('stale', cache.get('stale'), {'ETag': '"v2"'})
+
+    assert cache.get('stale').etag == '"v2"'
+    assert cache.stats == {
+        'hits': 1,
+        'misses': 1,
+        'stale': 0,
+        'revalidations': 1,
+        'evictions': 0,
+        'invalidations': 0,
+    }
+
+
+def test_response_cache_lru_max_entries():
+    cache = ResponseCache(max_entries=2)
+    for key in ('a', 'b'):
+        cache.set(key, CacheEntry('products', {}, b'{}', {}))
+
+    cache.get('a')
+    cache.set('c', CacheEntry('products', {}, b'{}', {}))
+
+    assert cache.get('a') is not None
+    assert cache.get('b') is None
+    assert cache.get('c') is not None
+    assert cache.stats['evictions'] == 1
+
+
+def test_response_cache_max_bytes():
+    cache = ResponseCache(max_bytes=10)
+    cache.set('a', CacheEntry('products', {}, b'x' * 4, {}))
+    cache.set('b', CacheEntry('products', {}, b'x' * 4, {}))
+    assert cache.size == 8
+
+    cache.set('c', CacheEntry('products', {}, b'x' * 4, {}))
+    assert len(cache) == 2
+    assert cache.size == 8
+    assert cache.get('a') is None
+
+    cache.set('d', CacheEntry('products', {}, b'x' * 20, {}))
+    assert len(cache) == 1
+    assert cache.size == 20
+    assert cache.stats['evictions'] == 3
+
+
+def test_response_cache_replace_entry():
+    cache = ResponseCache()
+    cache.set('a', CacheEntry('products', {}, b'x' * 4, {}))
+    cache.set('a', CacheEntry('products', {}, b'x' * 6, {}))
+
+    assert len(cache) == 1
+    assert cache.size == 6
+
+
+def test_response_cache_invalidate():
+    cache = ResponseCache()
+    paths = (
+        'products',
+        'products/PRD-000',
+        'products/PRD-000/items',
+        'products/PRD-001',
+        'products-legacy',
+        'marketplaces',
+    )
+    for path in paths:
+        cache.set(path, CacheEntry(path, {}, b'{}', {}))
+
+    cache.invalidate('products/PRD-000')
+
+    assert sorted(cache._entries.keys()) == ['marketplaces', 'products-legacy', 'products/PRD-001']
+    assert cache.stats['invalidations'] == 3
+
+
+def test_sqlite_cache(tmp_path):
+    cache = SQLiteCache(str(tmp_path / 'cache.db'))
+    entry = CacheEntry(
+        'products/PRD-000',
+        {'id': 'PRD-000'},
+        b'{"id": "PRD-000"}',
+        {'Content-Type': 'application/json', 'ETag': '"v1"'},
+    )
+
+    cache.set('key', entry)
+    cached = cache.get('key')
+
+    assert cached.path == 'products/PRD-000'
+    assert cached.body == {'id': 'PRD-000'}
+    assert cached.content == b'{"id": "PRD-000"}'
+    assert cached.etag == '"v1"'
+    assert cached.stored_at == entry.stored_at
+    assert len(cache) == 1
+    assert 0 < cache.size
+
+    cache.delete('key')
+    assert cache.get('key') is None
+
+    cache.set('key', entry)
+    cache.clear()
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_sqlite_cache_binary_content(tmp_path):
+    cache = SQLiteCache(str(tmp_path / 'cache.db'), ttl=60)
+    cache.set('key', CacheEntry('files/FL-000', b'\x00\x01', b'\x00\x01', {}))
+
+    assert cache.get('key').body == b'\x00\x01'
+
+
+def test_sqlite_cache_shared_between_instances(tmp_path):
+    filename = str(tmp_path / 'cache.db')
+    cache1 = SQLiteCache(filename)
+    cache2 = SQLiteCache(filename)
+
+    cache1.set('key', CacheEntry('products', [], b'[]', {'ETag': '"v1"'}))
+
+    assert cache2.get('key').etag == '"v1"'
+    assert cache2._connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+
+def test_sqlite_cache_invalidate(tmp_path):
+    cache = SQLiteCache(str(tmp_path / 'cache.db'))
+    paths = (
+        'products',
+        'products/PRD-000',
+        'products/PRD-000/items',
+        'products/PRD-001',
+        'products-legacy',
+        'products_legacy',
+    )
+    for path in paths:
+        cache.set(path, CacheEntry(path, {}, b'{}', {'ETag': '"v1"'}))
+
+    cache.invalidate('/products/PRD-000/')
+
+    assert len(cache) == 3
+    assert cache.get('products/PRD-001') is not None
+    assert cache.get('products_legacy') is not None
+    assert cache.stats['invalidations'] == 3
+
+
+def _get_stored_size(cache):
+    return cache._connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+
+def test_sqlite_cache_size(tmp_path):
+    cache = SQLiteCache(str(tmp_path / 'cache.db'))
+    statements = []
+    cache._connection.set_trace_callback(statements.append)
+
+    for path in ('products/PRD-000', 'products/PRD-001', 'marketplaces'):
+        cache.set(path, CacheEntry(path, {}, b'{"id": "value"}', {'ETag': '"v1"'}))
+    cache.set('marketplaces', CacheEntry('marketplaces', {}, bytes(range(200)), {}))
+
+    assert not any('SUM' in statement for statement in statements)
+    assert cache.size == _get_stored_size(cache) > 0
+
+    cache.delete('marketplaces')
+    assert cache.size == _get_stored_size(cache) > 0
+
+    cache.invalidate('products')
+    assert cache.size == 0
+
+    cache.set('products', CacheEntry('products', [], b'[]', {}))
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_sqlite_cache_size_existing_database(tmp_path):
+    filename = str(tmp_path / 'cache.db')
+    cache = SQLiteCache(filename)
+    cache.set('products', CacheEntry('products', [], bytes(range(100)), {}))
+    with cache._connection as conn:
+        conn.execute('DROP TABLE meta')
+    cache.close()
+
+    cache = SQLiteCache(filename)
+
+    assert cache.size == _get_stored_size(cache) > 0
+
+
+def test_sqlite_cache_eviction(tmp_path, mocker):
+    mocker.patch('connect.client.cache.time.time', return_value=1000)
+    cache = SQLiteCache(str(tmp_path / 'cache.db'), ttl=10, max_bytes=150)
+    content = bytes(range(100))
+    cache.set('expired', CacheEntry('products', {}, b'{}', {}, stored_at=900))
+    cache.set('old', CacheEntry('products', content, content, {'ETag': '"v1"'}, stored_at=950))
+    cache.set('new', CacheEntry('products', content, content, {'ETag': '"v1"'}, stored_at=990))
+
+    assert cache.get('expired') is None
+    assert cache.get('old') is None
+    assert cache.get('new') is not None
+    assert cache.stats['evictions'] == 2
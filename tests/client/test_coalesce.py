@@ -0,0 +1,62 @@
+import asyncio
+import gc
+
+import pytest
+
+from connect.client.coalesce import AsyncRequestCoalescer, InFlightCall, RequestCoalescer
+
+
+def test_coalescer_join_leave():
+    coalescer = RequestCoalescer()
+
+    call, leader = coalescer.join('key')
+    assert leader is True
+
+    same_call, leader = coalescer.join('key')
+    assert same_call is call
+    assert leader is False
+    assert coalescer.coalesced == 1
+
+    call.set_result('response', [{'id': 1}])
+    coalescer.leave('key', call)
+
+    assert call.event.is_set()
+    new_call, leader = coalescer.join('key')
+    assert new_call is not call
+    assert leader is True
+
+
+def test_in_flight_call_result_is_a_copy():
+    call = InFlightCall(None)
+    body = [{'id': 1}]
+    call.set_result('response', body)
+
+    result = call.get_result()
+    result.append({'id': 2})
+
+    assert call.completed is True
+    assert call.get_result() == [{'id': 1}]
+
+
+def test_in_flight_call_exception():
+    call = InFlightCall(None)
+    call.set_exception('response', ValueError('error'))
+
+    assert call.completed is True
+    with pytest.raises(ValueError):
+        call.get_result()
+
+
+def test_async_coalescer_keys_by_event_loop():
+    coalescer = AsyncRequestCoalescer()
+
+    async def join():
+        call, leader = coalescer.join('key')
+        assert isinstance(call.event, asyncio.Event)
+        return leader
+
+    assert asyncio.run(join()) is True
+    assert asyncio.run(join()) is True
+    assert coalescer.coalesced == 0
+    gc.collect()
+    assert len(coalescer._calls) == 0
@@ -0,0 +1,87 @@
+import importlib.util
+
+import pytest
+
+from connect.client.codec import (
+    JSONCodec,
+    OrjsonCodec,
+    UjsonCodec,
+    _get_codec_by_name,
+    get_json_codec,
+)
+
+
+requires_orjson = pytest.mark.skipif(
+    importlib.util.find_spec('orjson') is None,
+    reason='orjson is not installed',
+)
+
+
+@requires_orjson
+def test_get_json_codec_auto():
+    assert isinstance(get_json_codec(), OrjsonCodec)
+    assert get_json_codec('auto') is get_json_codec()
+
+
+def test_get_json_codec_auto_fallback(mocker):
+    mocker.patch('connect.client.codec.importlib.import_module', side_effect=ImportError())
+    _get_codec_by_name.cache_clear()
+    try:
+        codec = get_json_codec()
+        assert type(codec) is JSONCodec
+    finally:
+        _get_codec_by_name.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ('name', 'codec_class'),
+    (
+        pytest.param('orjson', OrjsonCodec, marks=requires_orjson),
+        ('json', JSONCodec),
+    ),
+)
+def test_get_json_codec_by_name(name, codec_class):
+    assert type(get_json_codec(name)) is codec_class
+
+
+def test_get_json_codec_instance():
+    codec = JSONCodec()
+
+    assert get_json_codec(codec) is codec
+
+
+def test_get_json_codec_invalid():
+    with pytest.raises(ValueError) as cv:
+        get_json_codec('simplejson')
+
+    assert str(cv.value) == (
+        '`json_codec` must be one of auto, orjson, ujson, json or a JSONCodec instance.'
+    )
+
+
+def test_get_json_codec_not_installed(mocker):
+    mocker.patch('connect.client.codec.importlib.import_module', side_effect=ImportError())
+
+    with pytest.raises(ImportError):
+        UjsonCodec()
+
+
+@pytest.mark.parametrize(
+    'codec_class',
+    (JSONCodec, pytest.param(OrjsonCodec, marks=requires_orjson)),
+)
+def test_codec_round_trip(codec_class):
+    codec = codec_class()
+    obj = {'id': 'PRD-000', 'name': 'Prodotto è', 'items': [1, 2.5, None, True]}
+
+    content = codec.dumps(obj)
+
+    assert isinstance(content, bytes)
+    assert codec.loads(content) == obj
+
+
+@requires_orjson
+def test_orjson_codec_fallback():
+    codec = OrjsonCodec()
+
+    assert codec.loads(codec.dumps({1: 2**70})) == {'1': 2**70}
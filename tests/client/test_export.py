@@ -0,0 +1,168 @@
+import csv
+import gzip
+import json
+import sys
+
+import pytest
+
+from connect.client.codec import JSONCodec
+from connect.client.models.export import Checkpoint, Exporter
+
+
+def _read_ndjson(path, opener=open):
+    with opener(path, 'rt') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_exporter_ndjson(tmp_path):
+    path = tmp_path / 'export.ndjson'
+    exporter = Exporter(str(path), json_codec=JSONCodec())
+
+    exporter.open()
+    exporter.write([{'id': 1, 'tags': ['a']}, {'id': 2}])
+    exporter.write([])
+    exporter.write([{'id': 3}])
+    exporter.close()
+
+    assert exporter.count == 3
+    assert _read_ndjson(path) == [{'id': 1, 'tags': ['a']}, {'id': 2}, {'id': 3}]
+
+
+def test_exporter_ndjson_fields_gzip(tmp_path):
+    path = tmp_path / 'export.ndjson.gz'
+    exporter = Exporter(str(path), fields=['id'], compression='gzip', json_codec=JSONCodec())
+
+    exporter.open()
+    exporter.write([{'id': 1, 'extra': 'x'}])
+    exporter.write([{'id': 2, 'extra': 'y'}])
+    exporter.close()
+
+    assert _read_ndjson(path, opener=gzip.open) == [{'id': 1}, {'id': 2}]
+
+
+def test_exporter_csv(tmp_path):
+    path = tmp_path / 'export.csv'
+    exporter = Exporter(
+        str(path),
+        format='csv',
+        fields=['id', 'items.*.id', 'name'],
+        json_codec=JSONCodec(),
+    )
+
+    exporter.open()
+    exporter.write([{'id': 1, 'items.*.id': ['A', 'B'], 'name': None}])
+    exporter.close()
+
+    with open(path, newline='') as f:
+        assert list(csv.reader(f)) == [
+            ['id', 'items.*.id', 'name'],
+            ['1', '["A", "B"]', ''],
+        ]
+
+
+def test_exporter_resume(tmp_path):
+    path = tmp_path / 'export.csv.gz'
+    checkpoint = tmp_path / 'export.checkpoint'
+    exporter = Exporter(
+        str(path),
+        format='csv',
+        fields=['id'],
+        compression='gzip',
+        checkpoint=str(checkpoint),
+        json_codec=JSONCodec(),
+    )
+    exporter.open()
+    exporter.write([{'id': 1}, {'id': 2}], last=2)
+    exporter._file.write(b'partial page')
+    exporter.close(completed=False)
+
+    assert json.loads(checkpoint.read_text()) == {
+        'format': 'csv',
+        'count': 2,
+        'size': exporter.checkpoint.size,
+        'last': 2,
+    }
+
+    exporter = Exporter(
+        str(path),
+        format='csv',
+        fields=['id'],
+        compression='gzip',
+        checkpoint=str(checkpoint),
+        json_codec=JSONCodec(),
+    )
+    state = exporter.open()
+    assert (state.count, state.last) == (2, 2)
+    exporter.write([{'id': 3}], last=3)
+    exporter.close()
+
+    assert exporter.count == 3
+    assert not checkpoint.exists()
+    with gzip.open(path, 'rt', newline='') as f:
+        assert list(csv.reader(f)) == [['id'], ['1'], ['2'], ['3']]
+
+
+def test_checkpoint_other_format(tmp_path):
+    path = tmp_path / 'export.checkpoint'
+    Checkpoint(str(path)).save('csv', 10, 100, None)
+
+    with pytest.raises(ValueError) as cv:
+        Checkpoint(str(path)).load('ndjson')
+
+    assert str(cv.value) == f'The checkpoint `{path}` belongs to a `csv` export.'
+
+
+def test_exporter_parquet(mocker, tmp_path):
+    pyarrow = mocker.MagicMock()
+    mocker.patch.dict(sys.modules, {'pyarrow': pyarrow, 'pyarrow.parquet': pyarrow.parquet})
+    path = str(tmp_path / 'export.parquet')
+    exporter = Exporter(path, format='parquet', fields=['id'], compression='zstd')
+
+    exporter.open()
+    exporter.write([{'id': 1}])
+    exporter.write([{'id': 2}])
+    exporter.close()
+
+    assert pyarrow.table.call_args_list == [mocker.call({'id': [1]}), mocker.call({'id': [2]})]
+    pyarrow.parquet.ParquetWriter.assert_called_once_with(
+        path,
+        pyarrow.table.return_value.schema,
+        compression='zstd',
+    )
+    assert pyarrow.parquet.ParquetWriter.return_value.write_table.call_count == 2
+    pyarrow.parquet.ParquetWriter.return_value.close.assert_called_once()
+
+
+def test_exporter_zstd_not_installed(mocker, tmp_path):
+    mocker.patch.dict(sys.modules, {'compression.zstd': None, 'zstandard': None})
+    exporter = Exporter(str(tmp_path / 'export.zst'), compression='zstd')
+
+    with pytest.raises(ImportError) as cv:
+        exporter.open()
+
+    assert str(cv.value) == '`zstd` requires the `zstandard` package to be installed.'
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'message'),
+    (
+        ({'format': 'xlsx'}, '`format` must be one of ndjson, csv, parquet.'),
+        ({'compression': 'bz2'}, '`compression` must be one of gzip, zstd.'),
+        ({'format': 'csv'}, 'The csv format requires the `fields` to export.'),
+        (
+            {'format': 'parquet', 'checkpoint': 'export.checkpoint'},
+            'The parquet format does not support checkpoints.',
+        ),
+    ),
+)
+def test_exporter_invalid(kwargs, message):
+    with pytest.raises(ValueError) as cv:
+        Exporter('export', **kwargs)
+
+    assert str(cv.value) == message
+
+
+def test_encode_csv_rows():
+    exporter = Exporter('export.csv', format='csv', fields=['a'])
+
+    assert exporter._encode_csv_rows([['a,b', 'c']]) == b'"a,b",c\r\n'
@@ -1,14 +1,20 @@
 import io
-from threading import Thread
+import time
+from threading import Barrier, Thread
 
 import pytest
 import responses
 from requests import RequestException, Timeout
+from responses import matchers
 
+from connect.client.cache import CacheEntry, ResponseCache, get_cache_key
+from connect.client.codec import JSONCodec
 from connect.client.exceptions import ClientError
 from connect.client.fluent import ConnectClient, _get_environment_proxies
 from connect.client.logger import RequestLogger
 from connect.client.models import NS, Collection
+from connect.client.ratelimit import RateLimiter
+from connect.client.retry import RetryPolicy
 
 
 def test_default_headers():
@@ -311,6 +317,514 @@ def test_execute_max_retries_exceeded(mocked_responses, mock_config):
         c.execute('get', 'resources')
 
 
+def test_execute_retry_policy(mocked_responses, mocker):
+    sleep = mocker.patch('connect.client.mixins.time.sleep')
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=503,
+    )
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=503,
+    )
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=200,
+        json=[],
+    )
+
+    c = ConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        retry_policy=RetryPolicy(
+            backoff_factor=0.5,
+            jitter=False,
+            status_codes={503: 2},
+        ),
+        rate_limiter=RateLimiter(rate=10, burst=10),
+    )
+
+    assert c.execute('get', 'resources') == []
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0]
+
+
+def test_execute_retry_policy_status_not_retried(mocked_responses, mocker):
+    sleep = mocker.patch('connect.client.mixins.time.sleep')
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=500,
+    )
+
+    c = ConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        retry_policy=RetryPolicy(status_codes=(503,)),
+    )
+
+    with pytest.raises(ClientError) as cv:
+        c.execute('get', 'resources')
+
+    assert cv.value.status_code == 500
+    sleep.assert_not_called()
+
+
+def test_execute_retry_after(mocked_responses, mocker):
+    sleep = mocker.patch('connect.client.mixins.time.sleep')
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=429,
+        headers={'Retry-After': '5'},
+    )
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=200,
+        json=[],
+    )
+
+    c = ConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        retry_policy=RetryPolicy(backoff_factor=0.5, jitter=False),
+    )
+
+    assert c.execute('get', 'resources') == []
+    assert sleep.call_args_list[0].args[0] == 5
+    assert c.rate_limiter.get_bucket('resources')._blocked_until > 0
+
+
+def test_execute_retry_after_exceeds_max_retry_after(mocked_responses, mocker):
+    sleep = mocker.patch('connect.client.mixins.time.sleep')
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=429,
+        headers={'Retry-After': '86400'},
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    with pytest.raises(ClientError) as cv:
+        c.execute('get', 'resources')
+
+    assert cv.value.status_code == 429
+    sleep.assert_not_called()
+
+
+def test_execute_rate_limiter_shared(mocked_responses, mocker):
+    sleep = mocker.patch('connect.client.mixins.time.sleep')
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=200,
+        json=[],
+    )
+
+    c = ConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        rate_limiter=RateLimiter(),
+    )
+    c.rate_limiter.get_bucket('resources').block(30)
+
+    c.execute('get', 'resources')
+
+    assert 29 < sleep.call_args_list[0].args[0] <= 30
+
+
+def test_execute_conditional_get(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        json=[{'id': 1}],
+        headers={'ETag': '"v1"', 'Content-Range': 'items 0-0/1'},
+    )
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=304,
+        headers={'ETag': '"v1"'},
+        match=[matchers.header_matcher({'If-None-Match': '"v1"'})],
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache())
+
+    assert c.get('resources') == [{'id': 1}]
+    assert c.get('resources') == [{'id': 1}]
+    assert c.response.status_code == 200
+    assert c.response.headers['Content-Range'] == 'items 0-0/1'
+    assert c.response.json() == [{'id': 1}]
+
+
+def test_execute_conditional_get_last_modified(mocked_responses):
+    last_modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources/RES-1',
+        json={'id': 1},
+        headers={'Last-Modified': last_modified},
+    )
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources/RES-1',
+        json={'id': 2},
+        headers={'Last-Modified': 'Thu, 22 Oct 2015 07:28:00 GMT'},
+        match=[matchers.header_matcher({'If-Modified-Since': last_modified})],
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache())
+
+    assert c.resources['RES-1'].get() == {'id': 1}
+    assert c.resources['RES-1'].get() == {'id': 2}
+    assert len(c.cache) == 1
+    key = get_cache_key(
+        'https://localhost/resources/RES-1',
+        {'headers': {'Authorization': 'API_KEY'}},
+    )
+    assert c.cache.get(key).body == {'id': 2}
+
+
+def test_execute_conditional_get_no_validators(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        json=[],
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache())
+
+    c.get('resources')
+
+    assert len(c.cache) == 0
+
+
+def test_execute_conditional_get_shared_headers(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        json=[{'id': 1}],
+        headers={'ETag': '"v1"'},
+    )
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=304,
+        headers={'ETag': '"v1"'},
+        match=[matchers.header_matcher({'If-None-Match': '"v1"'})],
+    )
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/others',
+        json=[{'id': 2}],
+    )
+    headers = {'X-Custom': 'value'}
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache())
+
+    assert c.get('resources', headers=headers) == [{'id': 1}]
+    assert c.get('resources', headers=headers) == [{'id': 1}]
+    assert c.get('others', headers=headers) == [{'id': 2}]
+    assert 'If-None-Match' not in headers
+    assert 'If-None-Match' not in mocked_responses.calls[2].request.headers
+
+
+def test_execute_not_modified_not_cached(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=304,
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache())
+
+    with pytest.raises(ClientError) as cv:
+        c.get('resources', headers={'If-None-Match': '"v1"'})
+
+    assert cv.value.status_code == 304
+    assert str(cv.value) == 'The response has not been modified but it is not cached.'
+
+
+@pytest.mark.parametrize('json_codec', ('json', 'orjson'))
+def test_execute_invalid_json(mocked_responses, json_codec):
+    pytest.importorskip(json_codec)
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        body='{not json',
+        content_type='application/json',
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', json_codec=json_codec)
+
+    with pytest.raises(ClientError) as cv:
+        c.get('resources')
+
+    assert cv.value.status_code == 200
+    assert str(cv.value) == 'The response body is not valid JSON.'
+
+
+def test_execute_cache_ttl(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        json=[{'id': 1}],
+        headers={'Content-Range': 'items 0-0/1'},
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache(ttl=60))
+
+    assert c.resources.all().count() == 1
+    assert list(c.resources.all()) == [{'id': 1}]
+    assert c.resources.all().count() == 1
+    assert c.response.headers['Content-Range'] == 'items 0-0/1'
+    assert len(mocked_responses.calls) == 2
+    assert c.cache.stats['hits'] == 1
+    assert c.cache.stats['misses'] == 2
+
+
+def test_execute_cache_invalidated_by_writes(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources/RES-1',
+        json={'id': 1, 'name': 'old'},
+    )
+    mocked_responses.add(
+        responses.PUT,
+        'https://localhost/resources/RES-1',
+        json={'id': 1, 'name': 'new'},
+    )
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources/RES-1',
+        json={'id': 1, 'name': 'new'},
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache(ttl=60))
+
+    assert c.resources['RES-1'].get()['name'] == 'old'
+    assert c.resources['RES-1'].get()['name'] == 'old'
+    c.resources['RES-1'].update({'name': 'new'})
+    assert len(c.cache) == 0
+    assert c.resources['RES-1'].get()['name'] == 'new'
+    assert len(mocked_responses.calls) == 3
+
+
+def test_execute_cache_invalidated_by_failed_writes(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        json=[],
+    )
+    mocked_responses.add(
+        responses.POST,
+        'https://localhost/resources/RES-1/approve',
+        status=400,
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache(ttl=60))
+
+    c.get('resources')
+    with pytest.raises(ClientError):
+        c.resources['RES-1'].action('approve').post()
+
+    assert len(c.cache) == 0
+
+
+def _wait_refresh(cache):
+    started = time.monotonic()
+    while cache._refreshing and time.monotonic() - started < 5:
+        time.sleep(0.01)
+
+
+def test_execute_cache_stale_while_revalidate(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/products/PRD-000',
+        json={'id': 'PRD-000', 'version': 2},
+        headers={'ETag': '"v2"'},
+        match=[matchers.header_matcher({'If-None-Match': '"v1"'})],
+    )
+
+    cache = ResponseCache(ttl=60, stale_while_revalidate={'products': 60})
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=cache)
+    key = get_cache_key(
+        'https://localhost/products/PRD-000',
+        {'headers': {'Authorization': 'API_KEY'}},
+    )
+    cache.set(
+        key,
+        CacheEntry(
+            'products/PRD-000',
+            {'id': 'PRD-000', 'version': 1},
+            b'{}',
+            {'ETag': '"v1"'},
+            stored_at=time.time() - 90,
+        ),
+    )
+
+    assert c.products['PRD-000'].get() == {'id': 'PRD-000', 'version': 1}
+    _wait_refresh(cache)
+    assert c.products['PRD-000'].get() == {'id': 'PRD-000', 'version': 2}
+    assert len(mocked_responses.calls) == 1
+    assert cache.stats['stale'] == 1
+    assert cache.stats['hits'] == 1
+
+
+def test_execute_cache_stale_refresh_in_progress(mocked_responses, mocker):
+    thread = mocker.patch('connect.client.mixins.threading.Thread')
+    cache = ResponseCache(stale_while_revalidate={'products': 60})
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=cache)
+    key = get_cache_key(
+        'https://localhost/products/PRD-000',
+        {'headers': {'Authorization': 'API_KEY'}},
+    )
+    cache.set(key, CacheEntry('products/PRD-000', {'id': 'PRD-000'}, b'{}', {}))
+
+    c.products['PRD-000'].get()
+    c.products['PRD-000'].get()
+
+    thread.assert_called_once()
+    assert cache.stats['stale'] == 2
+
+
+def test_execute_cache_stale_refresh_not_found(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/products/PRD-000',
+        status=404,
+    )
+
+    cache = ResponseCache(stale_while_revalidate={'products': 60})
+    c = ConnectClient('API_KEY', endpoint='https://localhost', cache=cache)
+    cache.set(
+        get_cache_key(
+            'https://localhost/products/PRD-000',
+            {'headers': {'Authorization': 'API_KEY'}},
+        ),
+        CacheEntry('products/PRD-000', {'id': 'PRD-000'}, b'{}', {}),
+    )
+
+    assert c.products['PRD-000'].get() == {'id': 'PRD-000'}
+    _wait_refresh(cache)
+    assert len(cache) == 0
+
+
+def test_execute_coalesce_requests(mocked_responses):
+    barrier = Barrier(5)
+
+    def callback(request):
+        time.sleep(0.2)
+        return (200, {'Content-Type': 'application/json'}, '[{"id": 1}]')
+
+    mocked_responses.add_callback(
+        responses.GET,
+        'https://localhost/resources',
+        callback=callback,
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', coalesce_requests=True)
+    results = []
+
+    def worker():
+        barrier.wait()
+        result = c.get('resources', params={'limit': 10})
+        results.append((result, c.response.status_code))
+
+    threads = [Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [([{'id': 1}], 200)] * 5
+    assert len({id(result) for result, _ in results}) == 5
+    assert len(mocked_responses.calls) == 1
+    assert c.coalesced_calls == 4
+
+
+def test_execute_coalesce_requests_errors(mocked_responses):
+    barrier = Barrier(3)
+
+    def callback(request):
+        time.sleep(0.2)
+        return (404, {}, '')
+
+    mocked_responses.add_callback(
+        responses.GET,
+        'https://localhost/resources',
+        callback=callback,
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', coalesce_requests=True)
+    errors = []
+
+    def worker():
+        barrier.wait()
+        try:
+            c.get('resources')
+        except ClientError as e:
+            errors.append(e.status_code)
+
+    threads = [Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == [404] * 3
+    assert len(mocked_responses.calls) == 1
+
+
+class _RecordingCodec(JSONCodec):
+    def __init__(self):
+        self.calls = []
+
+    def loads(self, content):
+        self.calls.append(('loads', content))
+        return super().loads(content)
+
+    def dumps(self, obj):
+        self.calls.append(('dumps', obj))
+        return super().dumps(obj)
+
+
+def test_execute_json_codec(mocked_responses):
+    mocked_responses.add(
+        responses.POST,
+        'https://localhost/resources',
+        json={'id': 1},
+        match=[matchers.json_params_matcher({'name': 'test'})],
+    )
+
+    codec = _RecordingCodec()
+    c = ConnectClient('API_KEY', endpoint='https://localhost', json_codec=codec)
+
+    assert c.resources.create({'name': 'test'}) == {'id': 1}
+    assert codec.calls == [('dumps', {'name': 'test'}), ('loads', b'{"id": 1}')]
+    assert mocked_responses.calls[0].request.headers['Content-Type'] == 'application/json'
+
+
+def test_execute_json_codec_error_details(mocked_responses):
+    mocked_responses.add(
+        responses.GET,
+        'https://localhost/resources',
+        status=400,
+        json={'error_code': 'VAL_001', 'errors': ['error']},
+    )
+
+    c = ConnectClient('API_KEY', endpoint='https://localhost', json_codec='json')
+
+    with pytest.raises(ClientError) as cv:
+        c.get('resources')
+
+    assert cv.value.error_code == 'VAL_001'
+
+
 def test_execute_default_headers(mocked_responses):
     mocked_responses.add(
         responses.GET,
@@ -122,10 +122,9 @@ def test_log_response(mocker):
     ios.truncate(0)
     ios.seek(0, 0)
 
-    json = {'id': 'XX-1234', 'name': 'XXX'}
-    mocker.patch('requests.models.Response.json', return_value=json)
     rsp = Response()
     rsp.raw = HTTPResponse()
+    rsp._content = b'{"id": "XX-1234", "name": "XXX"}'
     rsp.headers = {
         'Content-Type': 'application/json',
         'Set-Cookie': (
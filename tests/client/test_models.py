@@ -1,5 +1,12 @@
+import gzip
+import json
+import sys
+import time
+
 import pytest
+from responses import matchers
 
+from connect.client import ConnectClient, ResponseCache
 from connect.client.exceptions import ClientError
 from connect.client.models import (
     NS,
@@ -12,6 +19,13 @@ from connect.client.rql import R
 from connect.client.utils import ContentRange
 
 
+def _url_matcher(url):
+    def match(request):
+        return request.url == url, f'{request.url} doesn\'t match {url}'
+
+    return match
+
+
 def test_ns_ns_invalid_type(ns_factory):
     ns = ns_factory()
     with pytest.raises(TypeError) as cv:
@@ -203,6 +217,92 @@ def test_collection_bulk_create(col_factory):
     )
 
 
+def test_collection_bulk_create_chunks(col_factory):
+    collection = col_factory(path='resource')
+    payload = [{'name': f'test {idx}'} for idx in range(5)]
+    error = ClientError(status_code=400, error_code='VAL_001', errors=['Invalid.'])
+
+    def create(path, payload=None, **kwargs):
+        if payload[0]['name'] == 'test 2':
+            raise error
+        return [dict(item, id=item['name']) for item in payload]
+
+    collection._client.create.side_effect = create
+
+    result = collection.bulk_create(payload, chunk_size=2, concurrency=2, timeout=10)
+
+    assert collection._client.create.call_count == 3
+    collection._client.create.assert_any_call('resource', payload=payload[:2], timeout=10)
+    assert result.ok is False
+    assert result.succeeded == payload[:2] + payload[4:]
+    assert result.failed == payload[2:4]
+    assert result.results == [dict(item, id=item['name']) for item in result.succeeded]
+    assert result.errors == [(payload[2:4], error)]
+    assert repr(result) == '<BulkResult succeeded=3 failed=2>'
+
+
+@pytest.mark.parametrize('method', ('update', 'delete'))
+def test_collection_bulk_update_delete_chunks(col_factory, method):
+    collection = col_factory(path='resource')
+    payload = ({'id': 1}, {'id': 2}, {'id': 3})
+    getattr(collection._client, method).return_value = None
+
+    result = getattr(collection, f'bulk_{method}')(payload, chunk_size=2)
+
+    assert result.ok is True
+    assert result.succeeded == list(payload)
+    assert result.results == []
+    assert getattr(collection._client, method).call_count == 2
+
+
+def test_collection_bulk_create_invalid_chunk_size(col_factory):
+    collection = col_factory(path='resource')
+
+    with pytest.raises(ValueError) as excinfo:
+        collection.bulk_create([{'name': 'test'}], chunk_size=0)
+
+    assert str(excinfo.value) == '`chunk_size` must be a positive, non-zero integer.'
+
+
+def test_collection_bulk_action(mocked_responses):
+    for request_id, status in (('PR-1', 200), ('PR-2', 400), ('PR-3', 200)):
+        mocked_responses.add(
+            'POST',
+            f'https://localhost/requests/{request_id}/approve',
+            status=status,
+            json={'id': request_id} if status == 200 else {'error_code': 'REQ_003'},
+            match=[matchers.json_params_matcher({'template_id': f'TL-{request_id}'})],
+        )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+    progress = []
+
+    results = client.requests.bulk_action(
+        'approve',
+        ['PR-1', {'id': 'PR-2'}, 'PR-3', 'PR-1'],
+        payload_fn=lambda item: {
+            'template_id': f'TL-{item if isinstance(item, str) else item["id"]}'
+        },
+        concurrency=2,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert list(results) == ['PR-1', 'PR-2', 'PR-3']
+    assert results['PR-1'] == {'id': 'PR-1'}
+    assert results.succeeded == ['PR-1', 'PR-3']
+    assert list(results.failed) == ['PR-2']
+    assert results.failed['PR-2'].status_code == 400
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_collection_bulk_action_invalid_items(col_factory):
+    collection = col_factory(path='resource')
+
+    with pytest.raises(TypeError) as excinfo:
+        collection.bulk_action('approve', [1])
+
+    assert str(excinfo.value) == '`items` must be a list of ids or resources.'
+
+
 def test_collection_bulk_create_invalid_type(col_factory):
     collection = col_factory(path='resource')
 
@@ -247,6 +347,68 @@ def test_collection_bulk_delete_invalid_type(col_factory):
     assert str(excinfo.value) == '`payload` must be a list or tuple.'
 
 
+def test_collection_get_many(mocked_responses):
+    for query, ids in (('in(id,(A,B))&limit=2', ['A', 'B']), ('in(id,(C,D))&limit=2', ['C'])):
+        mocked_responses.add(
+            'GET',
+            'https://localhost/resources',
+            json=[{'id': id_} for id_ in ids],
+            headers={'Content-Range': f'items 0-{len(ids) - 1}/{len(ids)}'},
+            match=[_url_matcher(f'https://localhost/resources?{query}&offset=0')],
+        )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    result = client.resources.get_many(['A', 'B', 'C', 'A', 'D'], chunk_size=2)
+
+    assert result == {'A': {'id': 'A'}, 'B': {'id': 'B'}, 'C': {'id': 'C'}}
+    assert list(result) == ['A', 'B', 'C']
+    assert result.missing == ['D']
+
+
+def test_collection_get_many_url_length(mocked_responses, mocker):
+    mocker.patch('connect.client.models.batch.MAX_IN_FILTER_LENGTH', 6)
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        json=[],
+        headers={'Content-Range': 'items 0-0/0'},
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    result = client.resources.get_many(['AA', 'BB', 'CC'], field='external_id')
+
+    assert result == {}
+    assert result.missing == ['AA', 'BB', 'CC']
+    assert sorted(call.request.url for call in mocked_responses.calls) == [
+        'https://localhost/resources?in(external_id,(AA,BB))&limit=2&offset=0',
+        'https://localhost/resources?in(external_id,(CC))&limit=1&offset=0',
+    ]
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'error'),
+    (
+        ({'ids': 'A'}, TypeError('`ids` must be a list of strings.')),
+        ({'ids': [1]}, TypeError('`ids` must be a list of strings.')),
+        (
+            {'ids': ['A'], 'chunk_size': 0},
+            ValueError('`chunk_size` must be a positive, non-zero integer.'),
+        ),
+        (
+            {'ids': ['A'], 'concurrency': 0},
+            ValueError('`concurrency` must be a positive, non-zero integer.'),
+        ),
+    ),
+)
+def test_collection_get_many_invalid(col_factory, kwargs, error):
+    collection = col_factory(path='resource')
+
+    with pytest.raises(type(error)) as excinfo:
+        collection.get_many(**kwargs)
+
+    assert str(excinfo.value) == str(error)
+
+
 def test_collection_filter(col_factory):
     collection = col_factory(path='resource')
 
@@ -492,9 +654,8 @@ def test_resource_delete(res_factory):
 
 
 def test_resource_values(mocker, res_factory):
-    mocker.patch.object(
-        Resource,
-        'get',
+    resource = res_factory()
+    resource._client.get = mocker.MagicMock(
         return_value={
             'id': 'ID',
             'not_choosen': 'value',
@@ -504,14 +665,46 @@ def test_resource_values(mocker, res_factory):
         },
     )
 
-    resource = res_factory()
     result = resource.values('id', 'sub_object.name')
+    resource._client.get.assert_called_once_with('{item_id}?select(id,sub_object.name)')
     assert isinstance(result, dict)
     assert 'not_choosen' not in result
     assert 'id' in result and result['id'] == 'ID'
     assert 'sub_object.name' in result and result['sub_object.name'] == 'ok'
 
 
+def test_resource_values_select_not_supported(mocked_responses):
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources/RES-1',
+        status=400,
+        json={'error_code': 'RQL_000', 'errors': ['Invalid select.']},
+        match=[_url_matcher('https://localhost/resources/RES-1?select(id,events.created.at)')],
+    )
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources/RES-1',
+        json={'id': 'RES-1', 'events': {'created': {'at': 'now'}}},
+        match=[_url_matcher('https://localhost/resources/RES-1')],
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    assert client.resources['RES-1'].values('id', 'events.created.at') == {
+        'id': 'RES-1',
+        'events.created.at': 'now',
+    }
+
+
+def test_resource_values_error(mocked_responses):
+    mocked_responses.add('GET', 'https://localhost/resources/RES-1', status=404)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    with pytest.raises(ClientError) as cv:
+        client.resources['RES-1'].values('id')
+
+    assert cv.value.status_code == 404
+
+
 def test_resource_help(res_factory):
     res = res_factory()
     res1 = res.help()
@@ -915,6 +1108,7 @@ def test_rs_values_list(mocker, rs_factory):
 
     assert isinstance(rs, ResourceSet)
     assert list(rs) == expected
+    assert rs._client.get.call_args[0][0] == 'resources?select(id,inner.title)'
 
 
 def test_rs_pagination(mocker, rs_factory):
@@ -1117,3 +1311,736 @@ def test_rs_slice_single_bound(mocker, rs_factory):
     with pytest.raises(ValueError) as cv:
         rs[:1]
     assert str(cv.value) == 'Both start and stop indexes must be specified.'
+
+
+def _add_pages(mocked_responses, count, limit, offset=0, stop=None, query=''):
+    while offset < min(count, stop or count):
+        page_limit = min(limit, stop - offset) if stop else limit
+        last = min(offset + page_limit, count) - 1
+        mocked_responses.add(
+            'GET',
+            'https://localhost/resources',
+            json=[{'id': idx} for idx in range(offset, last + 1)],
+            headers={'Content-Range': f'items {offset}-{last}/{count}'},
+            match=[
+                _url_matcher(
+                    f'https://localhost/resources?{query}limit={page_limit}&offset={offset}',
+                ),
+            ],
+        )
+        offset += page_limit
+
+
+def test_rs_parallel(mocked_responses):
+    _add_pages(mocked_responses, 95, 10)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).parallel(workers=3)
+
+    assert list(rs) == [{'id': idx} for idx in range(95)]
+    assert len(mocked_responses.calls) == 10
+    assert rs._results == [{'id': idx} for idx in range(95)]
+    assert rs.content_range == ContentRange(90, 94, 95)
+
+
+def test_rs_parallel_slice(mocked_responses):
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        json=[{'id': idx} for idx in range(5, 15)],
+        headers={'Content-Range': 'items 5-14/100'},
+        match=[matchers.query_param_matcher({'limit': '10', 'offset': '5'})],
+    )
+    _add_pages(mocked_responses, 100, 10, offset=15, stop=37)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).parallel(workers=2)[5:37]
+
+    assert list(rs) == [{'id': idx} for idx in range(5, 37)]
+    assert len(mocked_responses.calls) == 4
+
+
+def test_rs_parallel_values_list(mocked_responses):
+    _add_pages(mocked_responses, 25, 10, query='select(id)&')
+    client = ConnectClient('API_KEY', endpoint='https://localhost', resourceset_append=False)
+
+    rs = client.resources.all().limit(10).parallel(workers=2).values_list('id')
+
+    assert list(rs) == [{'id': idx} for idx in range(25)]
+    assert rs._results == [{'id': idx} for idx in range(20, 25)]
+
+
+def test_rs_parallel_single_page(mocked_responses):
+    _add_pages(mocked_responses, 5, 10)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    assert list(client.resources.all().limit(10).parallel()) == [{'id': idx} for idx in range(5)]
+
+
+def test_rs_parallel_max_buffered_pages(mocked_responses):
+    _add_pages(mocked_responses, 200, 10)
+    mocked_responses.assert_all_requests_are_fired = False
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    iterator = iter(client.resources.all().limit(10).parallel(workers=2, max_buffered_pages=3))
+    for _ in range(11):
+        next(iterator)
+    time.sleep(0.2)
+
+    assert len(mocked_responses.calls) == 5
+    iterator.close()
+    time.sleep(0.1)
+    assert len(mocked_responses.calls) == 5
+
+
+@pytest.mark.parametrize('parallel', (False, True))
+def test_rs_iterate_response_cache(mocked_responses, parallel):
+    _add_pages(mocked_responses, 4, 2)
+    client = ConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache(ttl=60))
+    rs = client.resources.all().limit(2)
+    if parallel:
+        rs = rs.parallel(workers=2)
+
+    assert list(rs) == [{'id': idx} for idx in range(4)]
+    assert list(client.resources.all().limit(2)[0:2]) == [{'id': 0}, {'id': 1}]
+    assert len(mocked_responses.calls) == 2
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'exception', 'message'),
+    (
+        ({'workers': '2'}, TypeError, '`workers` must be an integer.'),
+        ({'workers': 0}, ValueError, '`workers` must be a positive, non-zero integer.'),
+        (
+            {'workers': 4, 'max_buffered_pages': 2},
+            ValueError,
+            '`max_buffered_pages` must be an integer greater than or equal to `workers`.',
+        ),
+    ),
+)
+def test_rs_parallel_invalid(rs_factory, kwargs, exception, message):
+    with pytest.raises(exception) as cv:
+        rs_factory().parallel(**kwargs)
+
+    assert str(cv.value) == message
+
+
+def test_rs_prefetch(mocked_responses):
+    _add_pages(mocked_responses, 100, 10)
+    mocked_responses.assert_all_requests_are_fired = False
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).prefetch(2)
+    iterator = iter(rs)
+    assert next(iterator) == {'id': 0}
+    time.sleep(0.2)
+
+    assert rs._workers == 2
+    assert rs._max_buffered_pages == 2
+    assert len(mocked_responses.calls) == 3
+    assert [item['id'] for item in iterator] == list(range(1, 100))
+    assert len(mocked_responses.calls) == 10
+
+
+def test_rs_prefetch_after_parallel(rs_factory):
+    rs = rs_factory().parallel(workers=8).prefetch(3)
+
+    assert rs._workers == 3
+    assert rs._max_buffered_pages == 3
+
+
+@pytest.mark.parametrize(
+    ('pages', 'exception', 'message'),
+    (
+        ('2', TypeError, '`pages` must be an integer.'),
+        (0, ValueError, '`pages` must be a positive, non-zero integer.'),
+    ),
+)
+def test_rs_prefetch_invalid(rs_factory, pages, exception, message):
+    with pytest.raises(exception) as cv:
+        rs_factory().prefetch(pages)
+
+    assert str(cv.value) == message
+
+
+def _add_keyset_pages(mocked_responses, ids, limit, field='id', query=None, select=''):
+    descending = field.startswith('-')
+    name = field.lstrip('-')
+    for offset in range(0, len(ids), limit):
+        page = ids[offset : offset + limit]
+        rql = [query] if query else []
+        if offset:
+            rql.append(f'{"lt" if descending else "gt"}({name},{ids[offset - 1]})')
+        qs = f'and({",".join(rql)})' if len(rql) > 1 else ''.join(rql)
+        count = len(ids) - offset
+        mocked_responses.add(
+            'GET',
+            'https://localhost/resources',
+            json=[{name: value} for value in page],
+            headers={'Content-Range': f'items 0-{len(page) - 1}/{count}'},
+            match=[
+                _url_matcher(
+                    f'https://localhost/resources?{select}{qs}{"&" if qs else ""}'
+                    f'ordering({field})&limit={limit}&offset=0',
+                ),
+            ],
+        )
+
+
+def test_rs_keyset(mocked_responses):
+    ids = [f'RES-{idx:03d}' for idx in range(25)]
+    _add_keyset_pages(mocked_responses, ids, 10)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().order_by('name').limit(10).keyset()
+
+    assert [item['id'] for item in rs] == ids
+    assert len(mocked_responses.calls) == 3
+    assert mocked_responses.calls[1].request.url == (
+        'https://localhost/resources?gt(id,RES-009)&ordering(id)&limit=10&offset=0'
+    )
+
+
+def test_rs_keyset_filter_descending(mocked_responses):
+    ids = list(range(24, 0, -1))
+    _add_keyset_pages(
+        mocked_responses,
+        ids,
+        10,
+        field='-created',
+        query='eq(status,active)',
+        select='select(created)&',
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost', resourceset_append=False)
+
+    rs = (
+        client.resources.filter(status='active')
+        .limit(10)
+        .keyset('-created')
+        .values_list(
+            'created',
+        )
+    )
+
+    assert [item['created'] for item in rs] == ids
+    assert rs._results == [{'created': value} for value in ids[20:]]
+
+
+def test_rs_keyset_without_content_range(mocked_responses):
+    for query, page in (('', range(10)), ('gt(id,9)&', range(10, 13))):
+        mocked_responses.add(
+            'GET',
+            'https://localhost/resources',
+            json=[{'id': idx} for idx in page],
+            match=[
+                _url_matcher(
+                    f'https://localhost/resources?{query}ordering(id)&limit=10&offset=0',
+                ),
+            ],
+        )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    assert [item['id'] for item in client.resources.all().limit(10).keyset()] == list(range(13))
+
+
+def test_rs_keyset_slice(mocked_responses):
+    _add_keyset_pages(mocked_responses, list(range(30)), 10)
+    mocked_responses.assert_all_requests_are_fired = False
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        json=[{'id': idx} for idx in range(10, 15)],
+        headers={'Content-Range': 'items 0-4/20'},
+        match=[_url_matcher('https://localhost/resources?gt(id,9)&ordering(id)&limit=5&offset=0')],
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).keyset()[0:15]
+
+    assert [item['id'] for item in rs] == list(range(15))
+    assert len(mocked_responses.calls) == 2
+
+
+def test_rs_keyset_missing_field(mocked_responses):
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        json=[{'name': 'first'}],
+        headers={'Content-Range': 'items 0-0/2'},
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    with pytest.raises(ValueError) as cv:
+        list(client.resources.all().limit(1).keyset())
+
+    assert str(cv.value) == 'The keyset field `id` is missing from the results.'
+
+
+@pytest.mark.parametrize(
+    ('field', 'exception', 'message'),
+    (
+        (1, TypeError, '`field` must be a string.'),
+        ('-', ValueError, '`field` must not be blank.'),
+    ),
+)
+def test_rs_keyset_invalid(rs_factory, field, exception, message):
+    with pytest.raises(exception) as cv:
+        rs_factory().keyset(field)
+
+    assert str(cv.value) == message
+
+
+@pytest.mark.parametrize(
+    'factory',
+    (
+        lambda rs: rs.keyset().parallel(),
+        lambda rs: rs.keyset().prefetch(),
+        lambda rs: rs.prefetch().keyset(),
+    ),
+)
+def test_rs_keyset_parallel(rs_factory, factory):
+    with pytest.raises(ValueError) as cv:
+        factory(rs_factory())
+
+    assert str(cv.value) == 'Keyset pagination cannot be combined with `parallel` or `prefetch`.'
+
+
+def test_rs_stream(mocked_responses):
+    _add_pages(mocked_responses, 25, 10)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().stream(chunk_size=10)
+    page_sizes = []
+    for _ in rs:
+        page_sizes.append(len(rs._results))
+
+    assert page_sizes == [10] * 20 + [5] * 5
+    assert rs._results is None
+    assert rs.content_range == ContentRange(20, 24, 25)
+
+
+def test_rs_stream_iterate_again(mocked_responses):
+    _add_pages(mocked_responses, 15, 10, query='select(id)&')
+    _add_pages(mocked_responses, 15, 10, query='select(id)&')
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).stream().values_list('id')
+
+    assert list(rs) == [{'id': idx} for idx in range(15)]
+    assert list(rs) == [{'id': idx} for idx in range(15)]
+    assert len(mocked_responses.calls) == 4
+
+
+def test_rs_iterator_close(mocked_responses):
+    _add_pages(mocked_responses, 15, 10, stop=10)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all()
+    iterator = rs[0:10].iterator()
+    assert next(iterator) == {'id': 0}
+
+    iterator.close()
+
+    assert iterator._rs._results is None
+    assert rs._results is None
+
+
+@pytest.mark.parametrize('chunk_size', ('10', 0))
+def test_rs_stream_invalid(rs_factory, chunk_size):
+    with pytest.raises(ValueError) as cv:
+        rs_factory().stream(chunk_size)
+
+    assert str(cv.value) == '`chunk_size` must be a positive, non-zero integer.'
+
+
+def test_rs_values_list_select(mocked_responses):
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        json=[{'id': 'RES-1', 'product': {'id': 'PRD-1'}}],
+        headers={'Content-Range': 'items 0-0/1'},
+        match=[
+            _url_matcher(
+                'https://localhost/resources?select(-items,id,product.id)'
+                '&eq(status,active)&limit=100&offset=0',
+            ),
+        ],
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = (
+        client.resources.filter(status='active')
+        .select('-items', 'id')
+        .values_list(
+            'id',
+            'product.id',
+        )
+    )
+
+    assert list(rs) == [{'id': 'RES-1', 'product.id': 'PRD-1'}]
+
+
+def test_rs_values_list_select_not_supported(mocked_responses):
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        status=400,
+        json={'error_code': 'RQL_000', 'errors': ['Invalid select.']},
+        match=[_url_matcher('https://localhost/resources?select(id)&limit=10&offset=0')],
+    )
+    _add_pages(mocked_responses, 15, 10)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10).values_list('id')
+
+    assert list(rs) == [{'id': idx} for idx in range(15)]
+    assert rs._projection is False
+    assert len(mocked_responses.calls) == 3
+
+
+def test_rs_values_list_select_error(mocked_responses):
+    mocked_responses.add('GET', 'https://localhost/resources', status=400)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    with pytest.raises(ClientError):
+        list(client.resources.all().values_list('id')[0:10])
+
+    with pytest.raises(ClientError):
+        list(client.resources.all().select('id').values_list('id'))
+
+
+def test_rs_first_values_list_select_not_supported(mocked_responses):
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        status=400,
+        match=[_url_matcher('https://localhost/resources?select(id)&limit=1&offset=0')],
+    )
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        json=[{'id': 'RES-1', 'name': 'Resource'}],
+        match=[_url_matcher('https://localhost/resources?limit=1&offset=0')],
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    assert client.resources.all().values_list('id').first() == {'id': 'RES-1', 'name': 'Resource'}
+
+
+def test_rs_values_list_field_paths(mocked_responses):
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        json=[
+            {
+                'id': 'AS-1',
+                'items': [{'id': 'ITEM-1'}, {'id': 'ITEM-2'}],
+                'params': [{'id': 'email', 'value': 'user@example.com'}],
+            },
+        ],
+        headers={'Content-Range': 'items 0-0/1'},
+        match=[
+            _url_matcher('https://localhost/resources?select(id,items,params)&limit=100&offset=0'),
+        ],
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().values_list('id', 'items.*.id', 'params[id=email].value')
+
+    assert list(rs) == [
+        {
+            'id': 'AS-1',
+            'items.*.id': ['ITEM-1', 'ITEM-2'],
+            'params[id=email].value': 'user@example.com',
+        },
+    ]
+
+
+def test_rs_values_list_invalid_field_path(rs_factory):
+    with pytest.raises(ValueError) as cv:
+        rs_factory().values_list('items.')
+
+    assert str(cv.value) == 'Invalid field path: `items.`.'
+
+
+def test_rs_to_columns(mocked_responses):
+    _add_pages(mocked_responses, 25, 10, query='select(id,missing)&')
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10)
+    columns = rs.to_columns('id', 'missing')
+
+    assert columns == {'id': list(range(25)), 'missing': [None] * 25}
+    assert rs._results is None
+
+
+def test_rs_to_columns_values_list_fields(mocked_responses):
+    _add_pages(mocked_responses, 5, 10, query='select(id)&')
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    assert client.resources.all().limit(10).values_list('id').to_columns() == {
+        'id': list(range(5)),
+    }
+
+
+def test_rs_to_columns_no_fields(rs_factory):
+    with pytest.raises(ValueError) as cv:
+        rs_factory().to_columns()
+
+    assert str(cv.value) == 'At least one field must be specified.'
+
+
+@pytest.mark.parametrize(
+    ('method', 'module', 'factory'),
+    (
+        ('to_arrow', 'pyarrow', 'table'),
+        ('to_pandas', 'pandas', 'DataFrame'),
+    ),
+)
+def test_rs_to_arrow_pandas(mocker, mocked_responses, method, module, factory):
+    library = mocker.MagicMock()
+    mocker.patch.dict(sys.modules, {module: library})
+    _add_pages(mocked_responses, 5, 10, query='select(id)&')
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    result = getattr(client.resources.all().limit(10), method)('id')
+
+    assert result == getattr(library, factory).return_value
+    getattr(library, factory).assert_called_once_with({'id': list(range(5))})
+
+
+@pytest.mark.parametrize(('method', 'module'), (('to_arrow', 'pyarrow'), ('to_pandas', 'pandas')))
+def test_rs_to_arrow_pandas_not_installed(mocker, rs_factory, method, module):
+    mocker.patch.dict(sys.modules, {module: None})
+
+    with pytest.raises(ImportError) as cv:
+        getattr(rs_factory(), method)('id')
+
+    assert str(cv.value) == f'`{method}` requires the `{module}` package to be installed.'
+
+
+def test_rs_export(mocked_responses, tmp_path):
+    _add_pages(mocked_responses, 25, 10)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+    path = tmp_path / 'resources.ndjson'
+
+    assert client.resources.all().limit(10).export(str(path)) == 25
+    assert [json.loads(line) for line in path.read_text().splitlines()] == [
+        {'id': idx} for idx in range(25)
+    ]
+
+
+def test_rs_export_resume(mocked_responses, tmp_path):
+    _add_pages(mocked_responses, 25, 10, stop=20, query='select(id)&')
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        status=403,
+        match=[_url_matcher('https://localhost/resources?select(id)&limit=5&offset=20')],
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+    path = tmp_path / 'resources.csv.gz'
+    checkpoint = tmp_path / 'resources.checkpoint'
+    kwargs = {
+        'format': 'csv',
+        'fields': ['id'],
+        'compression': 'gzip',
+        'checkpoint': str(checkpoint),
+    }
+
+    with pytest.raises(ClientError):
+        client.resources.all().limit(10)[0:25].export(str(path), **kwargs)
+
+    assert json.loads(checkpoint.read_text())['count'] == 20
+
+    _add_pages(mocked_responses, 25, 10, offset=20, query='select(id)&')
+
+    assert client.resources.all().limit(10).export(str(path), **kwargs) == 25
+    assert not checkpoint.exists()
+    with gzip.open(path, 'rt') as f:
+        assert f.read().split() == ['id', *[str(idx) for idx in range(25)]]
+
+
+def test_rs_export_keyset_resume(mocked_responses, tmp_path):
+    path = tmp_path / 'resources.ndjson'
+    checkpoint = tmp_path / 'resources.checkpoint'
+    written = '{"id":"A"}\n{"id":"B"}\n'
+    path.write_text(f'{written}{{"id":"C"')
+    checkpoint.write_text(
+        json.dumps({'format': 'ndjson', 'count': 2, 'size': len(written), 'last': 'B'}),
+    )
+    mocked_responses.add(
+        'GET',
+        'https://localhost/resources',
+        json=[{'id': 'C', 'name': 'Third'}],
+        headers={'Content-Range': 'items 0-0/1'},
+        match=[_url_matcher('https://localhost/resources?gt(id,B)&ordering(id)&limit=2&offset=0')],
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost', json_codec='json')
+
+    count = client.resources.all().limit(2).keyset().export(str(path), checkpoint=str(checkpoint))
+
+    assert count == 3
+    assert path.read_text().splitlines() == [
+        '{"id":"A"}',
+        '{"id":"B"}',
+        '{"id": "C", "name": "Third"}',
+    ]
+
+
+def test_rs_export_parallel(mocked_responses, tmp_path):
+    _add_pages(mocked_responses, 45, 10)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+    path = tmp_path / 'resources.ndjson'
+
+    assert client.resources.all().limit(10).export(str(path), concurrency=3) == 45
+    assert len(path.read_text().splitlines()) == 45
+
+
+def test_rs_getitem_page_cache(mocked_responses):
+    _add_pages(mocked_responses, 15, 10)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10)
+
+    assert [rs[idx] for idx in range(16)] == [{'id': idx} for idx in range(15)] + [None]
+    assert len(mocked_responses.calls) == 2
+    assert rs._results is None
+
+
+def test_rs_getitem_page_cache_eviction(mocker, mocked_responses):
+    mocker.patch.object(ResourceSet, 'MAX_CACHED_PAGES', 2)
+    _add_pages(mocked_responses, 30, 10)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.resources.all().limit(10)
+
+    assert [rs[0], rs[10], rs[0], rs[20], rs[0]] == [
+        {'id': 0},
+        {'id': 10},
+        {'id': 0},
+        {'id': 20},
+        {'id': 0},
+    ]
+    assert list(rs._pages) == [2, 0]
+    assert len(mocked_responses.calls) == 3
+
+    assert rs[10] == {'id': 10}
+    assert len(mocked_responses.calls) == 4
+
+
+def _add_related_pages(mocked_responses):
+    requests = [
+        {'id': 'PR-1', 'asset': {'product': {'id': 'PRD-1'}}},
+        {'id': 'PR-2', 'asset': {'product': {'id': 'PRD-2'}}},
+        {'id': 'PR-3', 'asset': {'product': {'id': 'PRD-1'}}},
+        {'id': 'PR-4', 'asset': {'product': {'id': 'PRD-3'}}},
+        {'id': 'PR-5', 'asset': {}},
+    ]
+    for offset, ids in ((0, ['PRD-1', 'PRD-2']), (3, ['PRD-3'])):
+        mocked_responses.add(
+            'GET',
+            'https://localhost/requests',
+            json=requests[offset : offset + 3],
+            headers={'Content-Range': f'items {offset}-{min(offset + 2, 4)}/5'},
+            match=[_url_matcher(f'https://localhost/requests?limit=3&offset={offset}')],
+        )
+        mocked_responses.add(
+            'GET',
+            'https://localhost/products',
+            json=[{'id': id_, 'name': f'Product {id_}'} for id_ in ids if id_ != 'PRD-3'],
+            headers={'Content-Range': 'items 0-0/1'},
+            match=[
+                _url_matcher(
+                    f'https://localhost/products?in(id,({",".join(ids)}))'
+                    f'&limit={len(ids)}&offset=0',
+                ),
+            ],
+        )
+
+
+def test_rs_prefetch_related(mocked_responses):
+    _add_related_pages(mocked_responses)
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    results = list(
+        client.requests.all().limit(3).prefetch_related('asset.product', collection='products'),
+    )
+
+    assert [item['asset'].get('product') for item in results] == [
+        {'id': 'PRD-1', 'name': 'Product PRD-1'},
+        {'id': 'PRD-2', 'name': 'Product PRD-2'},
+        {'id': 'PRD-1', 'name': 'Product PRD-1'},
+        {'id': 'PRD-3'},
+        None,
+    ]
+    assert results[0]['asset']['product'] is results[2]['asset']['product']
+    assert len(mocked_responses.calls) == 4
+
+
+def test_rs_prefetch_related_values_list(mocked_responses):
+    mocked_responses.add(
+        'GET',
+        'https://localhost/requests',
+        json=[{'id': 'PR-1', 'asset': {'product': {'id': 'PRD-1'}}}],
+        headers={'Content-Range': 'items 0-0/1'},
+        match=[
+            _url_matcher(
+                'https://localhost/requests?select(id,asset.product.name,asset.product.id)'
+                '&limit=100&offset=0',
+            ),
+        ],
+    )
+    mocked_responses.add(
+        'GET',
+        'https://localhost/products',
+        json=[{'id': 'PRD-1', 'name': 'Product'}],
+        headers={'Content-Range': 'items 0-0/1'},
+        match=[_url_matcher('https://localhost/products?in(id,(PRD-1))&limit=1&offset=0')],
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost')
+
+    rs = client.requests.all().prefetch_related('asset.product', 'products')
+
+    assert list(rs.values_list('id', 'asset.product.name')) == [
+        {'id': 'PR-1', 'asset.product.name': 'Product'},
+    ]
+
+
+@pytest.mark.parametrize(
+    ('field', 'collection', 'exception', 'message'),
+    (
+        (None, 'products', TypeError, '`field` and `collection` must be strings.'),
+        ('', 'products', ValueError, '`field` and `collection` must not be blank.'),
+        ('items.*.product', 'products', ValueError, '`field` must be a dot notation path.'),
+    ),
+)
+def test_rs_prefetch_related_invalid(rs_factory, field, collection, exception, message):
+    with pytest.raises(exception) as excinfo:
+        rs_factory().prefetch_related(field, collection)
+
+    assert str(excinfo.value) == message
+
+
+def test_rs_prefetch_related_response_cache(mocked_responses):
+    mocked_responses.add(
+        'GET',
+        'https://localhost/requests',
+        json=[{'id': 'PR-1', 'asset': {'product': {'id': 'PRD-1'}}}],
+        headers={'Content-Range': 'items 0-0/1'},
+    )
+    mocked_responses.add(
+        'GET',
+        'https://localhost/products',
+        json=[{'id': 'PRD-1', 'name': 'Big product'}],
+        headers={'Content-Range': 'items 0-0/1'},
+    )
+    client = ConnectClient('API_KEY', endpoint='https://localhost', cache=ResponseCache(ttl=60))
+
+    rs = client.requests.all().prefetch_related('asset.product', collection='products')
+
+    assert list(rs) == [
+        {'id': 'PR-1', 'asset': {'product': {'id': 'PRD-1', 'name': 'Big product'}}},
+    ]
+    assert list(client.requests.all()) == [{'id': 'PR-1', 'asset': {'product': {'id': 'PRD-1'}}}]
+    assert len(mocked_responses.calls) == 2
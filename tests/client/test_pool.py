@@ -0,0 +1,119 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from connect.client import ConnectClient
+from connect.client.fluent import _SYNC_TRANSPORTS
+from connect.client.pool import PooledHTTPAdapter, PoolStats
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # noqa: N802
+        body = json.dumps({'path': self.path}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_stats_incr():
+    stats = PoolStats()
+    stats.incr('created')
+    stats.incr('wait_time', 0.5)
+
+    assert stats.created == 1
+    assert stats.wait_time == 0.5
+
+
+def test_client_pool_options():
+    c = ConnectClient(
+        'API_KEY',
+        endpoint='https://localhost',
+        pool_connections=4,
+        pool_maxsize=64,
+        pool_block=True,
+    )
+
+    adapter = c.session.adapters['https://localhost']
+
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+    assert _SYNC_TRANSPORTS[('https://localhost', 4, 64, True)] is adapter
+
+
+def test_client_transport_shared():
+    c1 = ConnectClient('API_KEY', endpoint='https://localhost', pool_maxsize=32)
+    c2 = ConnectClient('API_KEY', endpoint='https://localhost', pool_maxsize=32)
+    c3 = ConnectClient('API_KEY', endpoint='https://localhost', pool_maxsize=16)
+
+    assert c1._get_transport() is c2._get_transport()
+    assert c1._get_transport() is not c3._get_transport()
+
+
+def test_client_keep_alive_disabled():
+    c = ConnectClient('API_KEY', endpoint='https://localhost', keep_alive=False)
+
+    assert c.session.headers['Connection'] == 'close'
+
+
+def test_client_pool_stats(local_server):
+    c = ConnectClient('API_KEY', endpoint=local_server, pool_maxsize=2)
+
+    assert c.pool_stats() == {}
+
+    for _ in range(3):
+        assert c.get('resources') == {'path': '/resources'}
+
+    stats = c.pool_stats()
+    host = local_server
+    assert list(stats.keys()) == [host]
+    assert stats[host]['maxsize'] == 2
+    assert stats[host]['created'] == 1
+    assert stats[host]['idle'] == 1
+    assert stats[host]['in_use'] == 0
+    assert stats[host]['discarded'] == 0
+    assert stats[host]['wait_time'] >= 0
+
+
+def test_client_pool_stats_discarded(local_server):
+    c = ConnectClient('API_KEY', endpoint=local_server, pool_maxsize=1)
+    barrier = threading.Barrier(4)
+
+    def worker():
+        barrier.wait()
+        for _ in range(5):
+            c.get('resources')
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = next(iter(c.pool_stats().values()))
+    assert stats['in_use'] == 0
+    assert stats['idle'] == 1
+    assert stats['created'] >= 1
+    assert stats['created'] == stats['discarded'] + stats['idle']
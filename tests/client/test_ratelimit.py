@@ -0,0 +1,184 @@
+from email.utils import formatdate
+
+import pytest
+
+from connect.client.ratelimit import RateLimiter, TokenBucket, parse_retry_after
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    (
+        (None, None),
+        ('', None),
+        ('5', 5.0),
+        ('0.5', 0.5),
+        ('-3', 0.0),
+        ('not a date', None),
+    ),
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    value = formatdate(timeval=None, usegmt=True)
+
+    assert parse_retry_after(value) == 0.0
+
+
+def test_token_bucket_unlimited():
+    bucket = TokenBucket()
+
+    for _ in range(100):
+        assert bucket.reserve() == 0
+
+
+def test_token_bucket_rate(mocker):
+    mocker.patch('connect.client.ratelimit.time.monotonic', return_value=100.0)
+    bucket = TokenBucket(rate=2, capacity=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+
+def test_token_bucket_refill(mocker):
+    monotonic = mocker.patch('connect.client.ratelimit.time.monotonic', return_value=100.0)
+    bucket = TokenBucket(rate=1)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 1.0
+
+    monotonic.return_value = 102.0
+
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_block(mocker):
+    monotonic = mocker.patch('connect.client.ratelimit.time.monotonic', return_value=100.0)
+    bucket = TokenBucket()
+
+    bucket.block(10)
+
+    assert bucket.reserve() == 10
+    monotonic.return_value = 104.0
+    assert bucket.reserve() == 6
+    monotonic.return_value = 110.0
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_block_rate(mocker):
+    mocker.patch('connect.client.ratelimit.time.monotonic', return_value=100.0)
+    bucket = TokenBucket(rate=2)
+
+    bucket.block(10)
+
+    assert [bucket.reserve() for _ in range(4)] == [10, 10, 10.5, 11]
+
+
+@pytest.mark.parametrize(
+    ('path', 'key'),
+    (
+        ('/products', 'products'),
+        ('/products/PRD-000/items?limit=10', 'products'),
+        ('subscriptions/assets', 'subscriptions'),
+        ('/assets?eq(id,AS-000)', 'assets'),
+    ),
+)
+def test_rate_limiter_key(path, key):
+    assert RateLimiter().get_key(path) == key
+
+
+def test_rate_limiter_shares_buckets_by_endpoint():
+    limiter = RateLimiter(rate=5)
+
+    assert limiter.get_bucket('products') is limiter.get_bucket('products')
+    assert limiter.get_bucket('products') is not limiter.get_bucket('assets')
+    assert limiter.get_bucket('products').rate == 5
+
+
+@pytest.mark.parametrize('status_code', (429, 503))
+def test_rate_limiter_retry_after(mocker, status_code):
+    mocker.patch('connect.client.ratelimit.time.monotonic', return_value=100.0)
+    limiter = RateLimiter()
+
+    retry_after = limiter.update('/products/PRD-000', status_code, {'Retry-After': '3'})
+
+    assert retry_after == 3
+    assert limiter.acquire('/products') == 3
+    assert limiter.acquire('/assets') == 0
+
+
+def test_rate_limiter_ignores_retry_after_on_other_statuses():
+    limiter = RateLimiter()
+
+    assert limiter.update('/products', 200, {'Retry-After': '3'}) is None
+    assert limiter.acquire('/products') == 0
+
+
+def test_rate_limiter_rate_limit_headers(mocker):
+    mocker.patch('connect.client.ratelimit.time.monotonic', return_value=100.0)
+    limiter = RateLimiter()
+
+    limiter.update(
+        '/products',
+        200,
+        {'X-RateLimit-Remaining': '2', 'X-RateLimit-Reset': '4'},
+    )
+
+    assert limiter.get_bucket('products').rate == 0.5
+    assert limiter.acquire('/products') == 0
+    assert limiter.acquire('/products') == 0
+    assert limiter.acquire('/products') == 2
+
+
+def test_rate_limiter_quota_exhausted(mocker):
+    mocker.patch('connect.client.ratelimit.time.time', return_value=1700000000.0)
+    mocker.patch('connect.client.ratelimit.time.monotonic', return_value=100.0)
+    limiter = RateLimiter()
+
+    limiter.update(
+        '/products',
+        200,
+        {'RateLimit-Remaining': '0', 'RateLimit-Reset': '1700000010'},
+    )
+
+    assert limiter.acquire('/products') == 10
+
+
+def test_rate_limiter_slows_down_on_429_without_headers():
+    limiter = RateLimiter(rate=10)
+
+    limiter.update('/products', 429, {})
+
+    assert limiter.get_bucket('products').rate == 5
+
+
+@pytest.mark.parametrize('status_code', (429, 503))
+def test_rate_limiter_throttled_without_rate(mocker, status_code):
+    mocker.patch('connect.client.ratelimit.time.monotonic', return_value=100.0)
+    limiter = RateLimiter(throttled_rate=2)
+
+    limiter.update('/products', status_code, {})
+
+    assert limiter.get_bucket('products').rate == 2
+    assert [limiter.acquire('/products') for _ in range(4)] == [0, 0.5, 1, 1.5]
+    assert limiter.acquire('/assets') == 0
+
+
+def test_rate_limiter_retry_after_staggers_callers(mocker):
+    mocker.patch('connect.client.ratelimit.time.monotonic', return_value=100.0)
+    limiter = RateLimiter()
+
+    limiter.update('/products', 429, {'Retry-After': '2'})
+
+    assert [limiter.acquire('/products') for _ in range(3)] == [2, 3, 4]
+
+
+def test_rate_limiter_max_retry_after(mocker):
+    mocker.patch('connect.client.ratelimit.time.monotonic', return_value=100.0)
+    limiter = RateLimiter(max_retry_after=30)
+
+    assert limiter.update('/products', 429, {'Retry-After': '86400'}) == 86400
+    assert limiter.acquire('/products') == 30
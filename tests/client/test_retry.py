@@ -0,0 +1,121 @@
+import pytest
+from httpx import ConnectError
+from requests import ConnectionError, Timeout
+
+from connect.client.retry import RetryPolicy
+
+
+def test_default_policy_retries_server_errors():
+    policy = RetryPolicy(jitter=False)
+
+    assert policy.get_delay(0, 0, status_code=429) == 1.0
+    assert policy.get_delay(0, 0, status_code=500) == 1.0
+    assert policy.get_delay(1, 0, status_code=502) == 2.0
+    assert policy.get_delay(2, 0, status_code=503) == 4.0
+    assert policy.get_delay(3, 0, status_code=503) is None
+
+
+@pytest.mark.parametrize('status_code', (200, 204, 400, 404))
+def test_default_policy_does_not_retry(status_code):
+    policy = RetryPolicy()
+
+    assert policy.get_delay(0, 0, status_code=status_code) is None
+
+
+@pytest.mark.parametrize('exception', (Timeout(), ConnectionError(), ConnectError('error')))
+def test_default_policy_retries_transport_errors(exception):
+    policy = RetryPolicy(jitter=False, backoff_factor=0.5)
+
+    assert policy.get_delay(0, 0, exception=exception) == 0.5
+
+
+def test_policy_does_not_retry_unknown_exceptions():
+    policy = RetryPolicy()
+
+    assert policy.get_delay(0, 0, exception=ValueError()) is None
+
+
+def test_max_backoff():
+    policy = RetryPolicy(max_retries=10, jitter=False, max_backoff=5)
+
+    assert policy.compute_backoff(1) == 1
+    assert policy.compute_backoff(3) == 4
+    assert policy.compute_backoff(4) == 5
+    assert policy.compute_backoff(10) == 5
+
+
+def test_full_jitter(mocker):
+    uniform = mocker.patch('connect.client.retry.random.uniform', return_value=0.3)
+    policy = RetryPolicy(backoff_factor=2)
+
+    assert policy.get_delay(1, 0, status_code=500) == 0.3
+    uniform.assert_called_once_with(0, 4)
+
+
+def test_max_retry_time():
+    policy = RetryPolicy(max_retries=10, jitter=False, max_retry_time=10)
+
+    assert policy.get_delay(2, 5, status_code=500) == 4
+    assert policy.get_delay(3, 5, status_code=500) is None
+
+
+def test_retry_after():
+    policy = RetryPolicy(jitter=False)
+
+    assert policy.get_delay(0, 0, status_code=429, retry_after=7) == 7
+    assert policy.get_delay(2, 0, status_code=429, retry_after=2) == 4
+
+
+def test_retry_after_exceeds_max_retry_time():
+    policy = RetryPolicy(max_retry_time=30)
+
+    assert policy.get_delay(0, 0, status_code=503, retry_after=60) is None
+
+
+def test_retry_after_exceeds_max_retry_after():
+    policy = RetryPolicy(jitter=False, max_retry_after=120)
+
+    assert policy.get_delay(0, 0, status_code=429, retry_after=120) == 120
+    assert policy.get_delay(0, 0, status_code=429, retry_after=86400) is None
+    assert RetryPolicy().get_delay(0, 0, status_code=503, retry_after=86400) is None
+    assert (
+        RetryPolicy(max_retry_after=None).get_delay(0, 0, status_code=503, retry_after=600) == 600
+    )
+
+
+def test_status_codes_rules():
+    policy = RetryPolicy(max_retries=2, jitter=False, status_codes={502: 1, 503: 4})
+
+    assert policy.get_delay(0, 0, status_code=500) is None
+    assert policy.get_delay(0, 0, status_code=502) == 1
+    assert policy.get_delay(1, 0, status_code=502) is None
+    assert policy.get_delay(3, 0, status_code=503) == 8
+
+
+def test_status_codes_iterable():
+    policy = RetryPolicy(max_retries=1, jitter=False, status_codes=(503,))
+
+    assert policy.get_delay(0, 0, status_code=500) is None
+    assert policy.get_delay(0, 0, status_code=503) == 1
+    assert policy.get_delay(1, 0, status_code=503) is None
+
+
+def test_exceptions_rules():
+    policy = RetryPolicy(max_retries=1, jitter=False, exceptions={Timeout: 3})
+
+    assert policy.get_delay(2, 0, exception=Timeout()) == 4
+    assert policy.get_delay(0, 0, exception=ConnectionError()) is None
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'message'),
+    (
+        ({'max_retries': -1}, '`max_retries` must be a positive integer or zero.'),
+        ({'backoff_factor': -1}, '`backoff_factor` must be a positive number or zero.'),
+    ),
+)
+def test_invalid_policy(kwargs, message):
+    with pytest.raises(ValueError) as cv:
+        RetryPolicy(**kwargs)
+
+    assert str(cv.value) == message
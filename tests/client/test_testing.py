@@ -265,6 +265,17 @@ def test_indexing():
         assert client.products.all()[0] == return_value[0]
 
 
+def test_indexing_page():
+    return_value = [{'id': f'OBJ-{i}'} for i in range(10, 20)]
+
+    with ConnectClientMocker('http://localhost') as mocker:
+        mocker.products.all().limit(10)[15].mock(return_value=return_value)
+
+        client = ConnectClient('api_key', endpoint='http://localhost')
+
+        assert client.products.all().limit(10)[15] == {'id': 'OBJ-15'}
+
+
 @pytest.mark.parametrize(
     ('total', 'start', 'stop'),
     (
@@ -414,3 +425,49 @@ def test_mocker_reset(mocker):
     with pytest.raises(Exception):
         mocker.reset()
     mocked_reset.assert_called_once()
+
+
+def test_resource_values_fields():
+    with ConnectClientMocker('http://localhost') as mocker:
+        mocker.products['product_id'].values(
+            'id',
+            'name',
+            return_value={'id': 'PRD-000', 'name': 'my_product'},
+        )
+        client = ConnectClient('api_key', endpoint='http://localhost')
+        assert client.products['product_id'].values('id', 'name') == {
+            'id': 'PRD-000',
+            'name': 'my_product',
+        }
+
+
+def test_values_list_all_mock():
+    return_value = [{'id': f'PRD-{idx}', 'name': f'Product {idx}'} for idx in range(3)]
+
+    with ConnectClientMocker('http://localhost') as mocker:
+        mocker.products.all().mock(return_value=return_value)
+        mocker.products.filter(status='published').select('name').mock(
+            return_value=return_value,
+        )
+
+        client = ConnectClient('api_key', endpoint='http://localhost')
+
+        assert list(client.products.all().values_list('id')) == [
+            {'id': f'PRD-{idx}'} for idx in range(3)
+        ]
+        assert list(
+            client.products.filter(status='published').select('name').values_list('id'),
+        ) == [{'id': f'PRD-{idx}'} for idx in range(3)]
+
+
+def test_all_mock_quoted_query():
+    return_value = [{'id': 'PRD-0', 'name': "Big 'product' é"}]
+
+    with ConnectClientMocker('http://localhost') as mocker:
+        mocker.products.filter(R().name.eq("Big 'product' é")).mock(return_value=return_value)
+        mocker.products.all().search('big product').mock(return_value=return_value)
+
+        client = ConnectClient('api_key', endpoint='http://localhost')
+
+        assert list(client.products.filter(R().name.eq("Big 'product' é"))) == return_value
+        assert list(client.products.all().search('big product')) == return_value
@@ -1,8 +1,13 @@
 import platform
 
+import pytest
+
 from connect.client.utils import (
     ContentRange,
+    compile_field_path,
+    compile_values,
     get_headers,
+    get_projection,
     parse_content_range,
     resolve_attribute,
 )
@@ -64,3 +69,74 @@ def test_resolve_attribute_not_found():
     }
 
     assert resolve_attribute('a.b.c', data) is None
+
+
+ASSET = {
+    'id': 'AS-001',
+    'product': {'id': 'PRD-001', 'name': 'Product'},
+    'items': [
+        {'id': 'ITEM-1', 'quantity': 10},
+        {'id': 'ITEM-2'},
+    ],
+    'params': [
+        {'id': 'email', 'value': 'user@example.com'},
+        {'id': 'seats.max', 'value': 5},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    ('path', 'expected', 'projection'),
+    (
+        ('id', 'AS-001', 'id'),
+        ('product.name', 'Product', 'product.name'),
+        ('product.missing.name', None, 'product.missing.name'),
+        ('id.missing', None, 'id.missing'),
+        ('items.*.id', ['ITEM-1', 'ITEM-2'], 'items'),
+        ('items.*.quantity', [10, None], 'items'),
+        ('product.*', None, 'product'),
+        ('params[id=email].value', 'user@example.com', 'params'),
+        ('params[id=seats.max].value', 5, 'params'),
+        ('params[id=missing].value', None, 'params'),
+        ('product[id=PRD-001].name', None, 'product'),
+        ('params[id=email]', {'id': 'email', 'value': 'user@example.com'}, 'params'),
+    ),
+)
+def test_compile_field_path(path, expected, projection):
+    field_path = compile_field_path(path)
+
+    assert field_path(ASSET) == expected
+    assert field_path.projection == projection
+
+
+def test_compile_field_path_root_list():
+    field_path = compile_field_path('*.id')
+
+    assert field_path([{'id': 1}, {'id': 2}]) == [1, 2]
+    assert field_path.projection is None
+
+
+def test_compile_field_path_cached():
+    assert compile_field_path('items.*.id') is compile_field_path('items.*.id')
+
+
+@pytest.mark.parametrize('path', ('', 'a..b', 'a.', '.a', 'params[id', 'a]b', '[id=x]value'))
+def test_compile_field_path_invalid(path):
+    with pytest.raises(ValueError) as cv:
+        compile_field_path(path)
+
+    assert str(cv.value) == f'Invalid field path: `{path}`.'
+
+
+def test_compile_values():
+    get_values = compile_values(('id', 'items.*.id', 'params[id=email].value'))
+
+    assert get_values(ASSET) == {
+        'id': 'AS-001',
+        'items.*.id': ['ITEM-1', 'ITEM-2'],
+        'params[id=email].value': 'user@example.com',
+    }
+
+
+def test_get_projection():
+    assert get_projection(('id', 'items.*.id', 'items.*.quantity', '*.id')) == ['id', 'items']
@@ -20,6 +20,7 @@ def async_client_mock(async_mocker):
         methods = methods or ['execute']
         client = async_mocker.MagicMock()
         client.default_limit = 100
+        client.get_batcher = None
         for method in methods:
             setattr(client, method, async_mocker.AsyncMock())
         return client